@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark single-prompt vs page-chunked LLM extraction on 1/10/50-page documents.
+
+A local stub Ollama server answers /api/generate (streamed NDJSON) after a
+delay that grows with the prompt: a fixed overhead plus linear and quadratic
+terms in the estimated prompt tokens, a rough model of prefill cost. The
+absolute numbers are therefore synthetic; what the benchmark shows is how
+latency scales with document length when the whole document goes into one
+prompt vs chunks of at most --chunk-tokens sent --concurrency at a time.
+"Over ctx" counts prompts larger than --context-window tokens, which a real
+model would truncate.
+
+Usage:
+    python -m benchmarks.bench_chunked_extraction --pages 1 10 50 --chunk-tokens 2000 --concurrency 4
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aiohttp import web
+
+from src.llm.chunking import CHARS_PER_TOKEN, estimate_tokens, split_lines_into_chunks
+from src.llm.client import OllamaClient
+from src.llm.config import DocumentTypeConfig
+from src.llm.field_extractor import extract_fields_with_llm
+
+MODEL_NAME = "llama3.1:8b"
+DOC_CONFIG = DocumentTypeConfig(
+    name="credit_request",
+    expected_fields=["company_name", "purchase_price", "term"],
+    field_descriptions={"company_name": "Company Name", "purchase_price": "Purchase Price", "term": "Term"},
+    validation_rules={},
+)
+
+
+def synthetic_normalized_lines(pages: int, lines_per_page: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Normalized OCR lines of a document with a few label/value pairs per page."""
+    rng = random.Random(seed)
+    words = ["Kreditantrag", "Betrag", "EUR", "Laufzeit", "Monate", "Firma", "GmbH", "Datum", "Zins", "Summe"]
+    lines = []
+    for page in range(1, pages + 1):
+        for index in range(lines_per_page):
+            if index % 10 == 0:
+                lines.append({
+                    "type": "label_value", "label": rng.choice(words), "value": f"{rng.randint(1, 99999)} EUR",
+                    "page": page, "confidence": rng.random(),
+                })
+            else:
+                text = " ".join(rng.choice(words) for _ in range(rng.randint(3, 9)))
+                lines.append({"type": "text_line", "text": text, "page": page, "confidence": rng.random()})
+    return lines
+
+
+def start_stub_server(base_seconds: float, seconds_per_token: float, seconds_per_token_squared: float) -> str:
+    """Serve a streaming /api/generate stub on a background thread and return its URL."""
+    started = threading.Event()
+    address = {}
+    answer = '{"extracted_fields": {"company_name": "DemoTech GmbH", "term": "20 Jahre"}, "missing_fields": []}'
+
+    async def handle_generate(request: web.Request) -> web.StreamResponse:
+        payload = await request.json()
+        tokens = len(payload["prompt"]) / CHARS_PER_TOKEN
+        await asyncio.sleep(base_seconds + seconds_per_token * tokens + seconds_per_token_squared * tokens ** 2)
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        for offset in range(0, len(answer), 8):
+            await response.write(json.dumps({"response": answer[offset:offset + 8], "done": False}).encode() + b"\n")
+        await response.write(json.dumps({"response": "", "done": True}).encode() + b"\n")
+        return response
+
+    async def serve() -> None:
+        app = web.Application()
+        app.router.add_post("/api/generate", handle_generate)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        address["url"] = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        started.set()
+        await asyncio.Event().wait()
+
+    threading.Thread(target=lambda: asyncio.run(serve()), daemon=True).start()
+    started.wait()
+    return address["url"]
+
+
+async def run(args: argparse.Namespace, base_url: str) -> None:
+    """Print latency per document size for the single-prompt and chunked modes."""
+    print(f"chunk budget {args.chunk_tokens} tokens, concurrency {args.concurrency}, context {args.context_window}")
+    print(f"{'pages':>5} {'doc tokens':>10} {'mode':>7} {'prompts':>7} {'over ctx':>8} {'seconds':>8} {'fields':>6}")
+    async with OllamaClient(base_url, MODEL_NAME, max_connections_per_host=args.concurrency) as client:
+        for pages in args.pages:
+            lines = synthetic_normalized_lines(pages, args.lines_per_page)
+            for mode, budget in (("single", None), ("chunked", args.chunk_tokens)):
+                chunks = split_lines_into_chunks(lines, budget) if budget else [lines]
+                chunk_tokens = [estimate_tokens(chunk) for chunk in chunks]
+                start_time = time.perf_counter()
+                result = await extract_fields_with_llm(
+                    lines, DOC_CONFIG, client, max_chunk_tokens=budget, max_concurrency=args.concurrency
+                )
+                elapsed = time.perf_counter() - start_time
+                over_context = sum(tokens > args.context_window for tokens in chunk_tokens)
+                print(
+                    f"{pages:>5} {estimate_tokens(lines):>10} {mode:>7} {len(chunks):>7} {over_context:>8} "
+                    f"{elapsed:>8.2f} {len(result['extracted_fields']):>6}"
+                )
+
+
+def main() -> None:
+    """Start the stub server and run both modes for each document size."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 50], help="Document sizes in pages")
+    parser.add_argument("--lines-per-page", type=int, default=40, help="Normalized lines per page")
+    parser.add_argument("--chunk-tokens", type=int, default=2000, help="Token budget per chunk")
+    parser.add_argument("--concurrency", type=int, default=4, help="Chunk requests in flight at once")
+    parser.add_argument("--context-window", type=int, default=8192, help="Model context window in tokens")
+    parser.add_argument("--base-seconds", type=float, default=0.05, help="Stub latency per request")
+    parser.add_argument("--seconds-per-token", type=float, default=2e-5, help="Stub latency per prompt token")
+    parser.add_argument(
+        "--seconds-per-token-squared", type=float, default=2e-9, help="Stub latency per squared prompt token"
+    )
+    args = parser.parse_args()
+
+    base_url = start_stub_server(args.base_seconds, args.seconds_per_token, args.seconds_per_token_squared)
+    asyncio.run(run(args, base_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark concurrent /status/{id} polls against one event loop.
+
+Each metadata lookup waits --latency-ms, standing in for a database round
+trip. "blocking" calls a synchronous repository on the event loop (the
+behaviour of psycopg2 inside async routes), "threaded" runs it through
+ThreadedMetadataRepository and "async" awaits the wait like the asyncpg
+repository does. All polls are issued at once through an in-process ASGI
+transport, so the numbers show how many polls one worker overlaps.
+
+Usage:
+    python -m benchmarks.bench_concurrent_status --concurrency 100 1000
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import httpx
+
+from src.api.dependencies import get_metadata_repository
+from src.api.main import app
+from src.dms.async_adapters import ThreadedMetadataRepository
+
+
+def _document(document_id: str) -> Dict[str, Any]:
+    return {"id": document_id, "textextraction_status": "done", "processing_status": "done"}
+
+
+class SleepingMetadataRepository:
+    """Synchronous repository whose lookups block for a fixed latency."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
+        time.sleep(self.latency)
+        return _document(document_id)
+
+
+class BlockingMetadataRepository:
+    """Async facade calling the synchronous repository directly on the event loop."""
+
+    def __init__(self, repository: SleepingMetadataRepository) -> None:
+        self._repository = repository
+
+    async def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
+        return self._repository.get_document(document_id)
+
+
+class AsyncSleepingMetadataRepository:
+    """Async repository whose lookups await a fixed latency."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    async def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
+        await asyncio.sleep(self.latency)
+        return _document(document_id)
+
+
+async def _timed_poll(client: httpx.AsyncClient, index: int) -> float:
+    start_time = time.perf_counter()
+    response = await client.get(f"/api/v1/status/doc-{index}")
+    assert response.status_code == 200, response.text
+    return time.perf_counter() - start_time
+
+
+async def _poll_concurrently(concurrency: int) -> tuple:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        start_time = time.perf_counter()
+        latencies = await asyncio.gather(*(_timed_poll(client, index) for index in range(concurrency)))
+        return time.perf_counter() - start_time, list(latencies)
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main() -> None:
+    """Issue concurrent polls for each repository flavour and report throughput and latency."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[100, 1000], help="Simultaneous polls")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated database round trip")
+    args = parser.parse_args()
+    # Per-request access logs would dominate the output
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    latency = args.latency_ms / 1000
+    setups = {
+        "blocking": BlockingMetadataRepository(SleepingMetadataRepository(latency)),
+        "threaded": ThreadedMetadataRepository(SleepingMetadataRepository(latency)),
+        "async": AsyncSleepingMetadataRepository(latency),
+    }
+    print(f"{'setup':>9} {'polls':>6} {'seconds':>8} {'polls/s':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    try:
+        for concurrency in args.concurrency:
+            for name, repository in setups.items():
+                app.dependency_overrides[get_metadata_repository] = lambda repository=repository: repository
+                elapsed, latencies = asyncio.run(_poll_concurrently(concurrency))
+                print(
+                    f"{name:>9} {concurrency:>6} {elapsed:>8.2f} {concurrency / elapsed:>9.0f} "
+                    f"{statistics.median(latencies) * 1000:>9.1f} {_percentile(latencies, 99) * 1000:>9.1f}"
+                )
+    finally:
+        app.dependency_overrides.pop(get_metadata_repository, None)
+
+
+if __name__ == "__main__":
+    main()
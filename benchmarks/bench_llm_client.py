@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-call overhead of OllamaClient.generate against a local stub server.
+
+"per-call session" opens an aiohttp session (and TCP connection) for every
+request, as OllamaClient did before it kept a pooled session; "pooled" reuses
+one long-lived OllamaClient. The stub answers /api/generate immediately from
+a separate thread, so the numbers are the client-side connection and session
+setup cost rather than model time. --concurrency runs that many requests at
+once, as when several prompts of one document are in flight.
+
+Usage:
+    python -m benchmarks.bench_llm_client --calls 1000 --concurrency 1
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import aiohttp
+from aiohttp import web
+
+from src.llm.client import OllamaClient
+
+MODEL_NAME = "llama3.1:8b"
+
+
+def start_stub_server() -> str:
+    """Serve a canned /api/generate response on a background thread and return its URL."""
+    started = threading.Event()
+    address = {}
+
+    async def handle_generate(request: web.Request) -> web.Response:
+        await request.read()
+        return web.json_response({"model": MODEL_NAME, "response": '{"company_name": "DemoTech GmbH"}'})
+
+    async def serve() -> None:
+        app = web.Application()
+        app.router.add_post("/api/generate", handle_generate)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        address["url"] = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        started.set()
+        await asyncio.Event().wait()
+
+    threading.Thread(target=lambda: asyncio.run(serve()), daemon=True).start()
+    started.wait()
+    return address["url"]
+
+
+async def generate_with_new_session(base_url: str, prompt: str) -> str:
+    """The previous OllamaClient.generate: one session and connection per call."""
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=120)) as session:
+        async with session.post(
+            f"{base_url}/api/generate", json={"model": MODEL_NAME, "prompt": prompt, "stream": False}
+        ) as response:
+            return (await response.json()).get("response", "")
+
+
+async def _measure(call: Callable[[str], Awaitable[str]], calls: int, concurrency: int) -> List[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    timings: List[float] = []
+
+    async def timed(index: int) -> None:
+        async with semaphore:
+            start_time = time.perf_counter()
+            await call(f"Extract the fields from line {index}")
+            timings.append(time.perf_counter() - start_time)
+
+    await asyncio.gather(*(timed(index) for index in range(calls)))
+    return timings
+
+
+async def run(base_url: str, calls: int, concurrency: int) -> None:
+    """Print mean, p50, p99 and throughput for both client variants."""
+    print(f"{calls} calls, concurrency {concurrency}")
+    print(f"{'variant':>17} {'mean ms':>8} {'p50 ms':>8} {'p99 ms':>8} {'calls/s':>8}")
+
+    async def per_call(prompt: str) -> str:
+        return await generate_with_new_session(base_url, prompt)
+
+    async with OllamaClient(base_url, MODEL_NAME, max_connections_per_host=max(concurrency, 1)) as client:
+        for name, call in (("per-call session", per_call), ("pooled", client.generate)):
+            await _measure(call, min(calls, 20), concurrency)  # warm up
+            start_time = time.perf_counter()
+            timings = await _measure(call, calls, concurrency)
+            elapsed = time.perf_counter() - start_time
+            quantiles = statistics.quantiles(timings, n=100)
+            print(
+                f"{name:>17} {statistics.mean(timings) * 1000:>8.2f} {quantiles[49] * 1000:>8.2f} "
+                f"{quantiles[98] * 1000:>8.2f} {calls / elapsed:>8.0f}"
+            )
+
+
+def main() -> None:
+    """Start the stub server and compare the two client variants."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=1000, help="Requests per variant")
+    parser.add_argument("--concurrency", type=int, default=1, help="Requests in flight at once")
+    args = parser.parse_args()
+
+    asyncio.run(run(start_stub_server(), args.calls, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark OCR artifact size and encode/decode time: JSON vs columnar.
+
+"json" is the current artifact (upload_document_data, indent=2); "columnar"
+is the compressed format of src/storage/ocr_codec.py, with gzip and (if the
+zstandard package is installed) zstd. "page" is the time to read one page:
+a full parse for JSON, a single block for the columnar format.
+
+Usage:
+    python -m benchmarks.bench_ocr_artifact_format --pages 100 --lines-per-page 80
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.storage import ocr_codec
+from src.storage.ocr_codec import ColumnarOcrArtifact, encode_ocr_artifact
+from src.storage.storage import build_document_envelope
+
+
+def synthetic_ocr_artifact(pages: int, lines_per_page: int, seed: int = 0) -> Dict[str, Any]:
+    """Stored OCR artifact of a document shaped like EasyOCR output."""
+    rng = random.Random(seed)
+    words = ["Kreditantrag", "Betrag", "EUR", "Laufzeit", "Monate", "Firma", "GmbH", "Datum", "Zins", "Summe"]
+    original_lines = []
+    for page_num in range(1, pages + 1):
+        for _ in range(lines_per_page):
+            x1, y1 = rng.randint(0, 1100), rng.randint(0, 1600)
+            x2, y2 = x1 + rng.randint(20, 400), y1 + rng.randint(12, 24)
+            original_lines.append({
+                "page_num": page_num,
+                "text": " ".join(rng.choice(words) for _ in range(rng.randint(1, 5))),
+                "confidence": rng.random(),
+                "bbox": {"x1": x1, "y1": y1, "x2": x2, "y2": y2, "width": x2 - x1, "height": y2 - y1},
+            })
+    data = {
+        "document_id": "bench-ocr-artifact",
+        "processing_metadata": {"total_elements": len(original_lines), "processing_method": "easyocr"},
+        "normalized_lines": [],
+        "original_lines": original_lines,
+    }
+    return build_document_envelope("bench-ocr-artifact", data, {"stage": "ocr"})
+
+
+def _median_ms(function: Callable[[], Any], repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start_time)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    """Report size and median encode, decode and single-page read times per format."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=100, help="Pages per document")
+    parser.add_argument("--lines-per-page", type=int, default=80, help="OCR lines per page")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per operation")
+    args = parser.parse_args()
+
+    document = synthetic_ocr_artifact(args.pages, args.lines_per_page)
+    middle_page = args.pages // 2 + 1
+    formats = {
+        "json": (
+            lambda: json.dumps(document, indent=2, ensure_ascii=False).encode("utf-8"),
+            lambda blob: json.loads(blob),
+            lambda blob: [
+                line for line in json.loads(blob)["data"]["original_lines"] if line["page_num"] == middle_page
+            ],
+        ),
+    }
+    codecs = ["gzip"] + (["zstd"] if ocr_codec.zstandard is not None else [])
+    for codec in codecs:
+        formats[f"columnar-{codec}"] = (
+            lambda codec=codec: encode_ocr_artifact(document, codec=codec),
+            lambda blob: ColumnarOcrArtifact(blob).to_document(),
+            lambda blob: ColumnarOcrArtifact(blob).read_page(middle_page),
+        )
+
+    print(f"{args.pages} pages x {args.lines_per_page} lines")
+    print(f"{'format':>15} {'KiB':>9} {'encode ms':>10} {'decode ms':>10} {'page ms':>9}")
+    for name, (encode, decode, read_page) in formats.items():
+        blob = encode()
+        print(
+            f"{name:>15} {len(blob) / 1024:>9.0f} {_median_ms(encode, args.repeat):>10.1f} "
+            f"{_median_ms(lambda: decode(blob), args.repeat):>10.1f} "
+            f"{_median_ms(lambda: read_page(blob), args.repeat):>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
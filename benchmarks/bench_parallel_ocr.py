@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark sequential vs process-pool page OCR on the sample PDF replicated to N pages.
+
+The text-layer fast path is disabled so every page goes through EasyOCR.
+Pool start-up and reader loading are excluded: each configuration is warmed
+up on a short document before it is timed.
+
+Usage:
+    python -m benchmarks.bench_parallel_ocr --pages 8 32 --workers 1 2 4
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.pdf_fixtures import replicate_pdf
+from src.ocr.easyocr_client import extract_text_bboxes_with_ocr
+from src.ocr.parallel import shutdown_ocr_executors
+
+
+def _run(pdf_data: bytes, workers: int) -> float:
+    """OCR every page and return the elapsed seconds."""
+    start_time = time.perf_counter()
+    extract_text_bboxes_with_ocr(pdf_data, keep_images=False, use_text_layer=False, workers=workers)
+    return time.perf_counter() - start_time
+
+
+def main() -> None:
+    """Run the benchmark for each requested page count and worker count."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[8, 32], help="Page counts to test")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to test")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="In-flight page limit (default 2x workers)")
+    args = parser.parse_args()
+    if args.max_in_flight:
+        os.environ["OCR_MAX_IN_FLIGHT"] = str(args.max_in_flight)
+
+    try:
+        print(f"{'workers':>7} {'pages':>6} {'seconds':>9} {'pages/s':>9} {'speedup':>8}")
+        for page_count in args.pages:
+            pdf_data = replicate_pdf(page_count)
+            baseline = None
+            for workers in args.workers:
+                # Warm up the readers (and the pool) outside the timed run
+                _run(replicate_pdf(max(workers, 1)), workers)
+
+                elapsed = _run(pdf_data, workers)
+                baseline = baseline or elapsed
+                print(
+                    f"{workers:>7} {page_count:>6} {elapsed:>9.2f} "
+                    f"{page_count / elapsed:>9.2f} {baseline / elapsed:>7.2f}x"
+                )
+    finally:
+        shutdown_ocr_executors()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Report prompt size reduction and field recall of the candidate-line prefilter.
+
+Reads the sample loan application through the PDF text layer (no OCR model
+needed) and builds two views of it: the normalized lines the pipeline
+currently sends to the LLM, and every text line of the document as a
+text_line item. For each view and each top-k it prints the lines, estimated
+document tokens and full prompt characters left after prefiltering, and the
+fields whose label and value both survive (recall against the hand-written
+ground truth below).
+
+Usage:
+    python -m benchmarks.bench_prompt_prefilter --pdf data/loan_application.pdf --top-k 1 2 3 4 5
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.llm.chunking import estimate_tokens, format_ocr_line
+from src.llm.config import DocumentTypeConfig, load_document_config
+from src.llm.field_extractor import create_extraction_prompt
+from src.llm.prefilter import score_lines, select_candidate_lines
+from src.ocr.easyocr_client import OCR_DPI
+from src.ocr.postprocess import normalize_ocr_lines
+from src.ocr.text_layer import extract_text_layer
+
+DOCUMENT_TYPES_CONFIG_PATH = "config/document_types.conf"
+
+# (label, value) of every expected field as printed on data/loan_application.pdf
+GROUND_TRUTH: Dict[str, Tuple[str, str]] = {
+    "company_name": ("Company Name", "DemoTech Solutions GmbH"),
+    "legal_form": ("Legal Form", "Limited Liability Company (GmbH)"),
+    "founding_date": ("Date of Incorporation", "12/05/2018"),
+    "business_address": ("Business Address", "Main Street 123, 70173 Stuttgart"),
+    "commercial_register": ("Commercial Register Number", "HRB 123456 / Stuttgart Local Court"),
+    "vat_id": ("VAT ID", "DE123456789"),
+    "property_type": ("Type of Property", "Office and Commercial Building"),
+    "property_name": ("Property Name", "Innovation Center Stuttgart"),
+    "property_address": ("Adress", "Tech Park 45, 70191 Stuttgart"),
+    "purchase_price": ("Purchase Price", "€2,500,000"),
+    "requested_amount": ("Desired Financing Amount", "€2,000,000"),
+    "purpose": ("Purpose of Use", "Purchase and Renovation"),
+    "equity_share": ("Equity Contribution", "€500,000"),
+    "construction_year": ("Year of Construction", "2015"),
+    "total_area": ("Total Area", "2,800 m²"),
+    "loan_amount": ("Desired Loan Amount", "€2,000,000"),
+    "term": ("Term", "15 years"),
+    "monthly_payment": ("Preferred Installment Amount", "€13,500 per month"),
+    "interest_rate": ("Interest Rate", "Fixed"),
+    "early_repayment": ("Early Repayment Desired", "[x] yes [ ] no"),
+    "public_funding": ("Public Subsidies Applied For", "[ ] yes [x ] no"),
+}
+
+
+def document_views(pdf_path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Normalized lines and plain text lines of the PDF's text layer."""
+    records = [
+        record
+        for page_records in extract_text_layer(pdf_path, OCR_DPI).values()
+        for record in page_records or []
+    ]
+    all_lines = [
+        {"type": "text_line", "text": record["text"], "page": record["page_num"], "confidence": record["confidence"]}
+        for record in records
+    ]
+    return {"normalized": normalize_ocr_lines(records), "all lines": all_lines}
+
+
+def recalled_fields(lines: List[Dict[str, Any]]) -> List[str]:
+    """Fields whose label and value both appear in the given lines."""
+    texts = [text for text in map(format_ocr_line, lines) if text]
+    return [
+        field_name
+        for field_name, (label, value) in GROUND_TRUTH.items()
+        if any(label in text for text in texts) and any(value in text for text in texts)
+    ]
+
+
+def report(view: str, lines: List[Dict[str, Any]], doc_config: DocumentTypeConfig, top_ks: List[int]) -> None:
+    """Print one table row per top-k (0 is the unfiltered prompt)."""
+    base_tokens = estimate_tokens(lines)
+    base_chars = len(create_extraction_prompt(lines, doc_config))
+    scores = score_lines(lines, doc_config.field_descriptions)
+    print(f"\n{view}: {len(lines)} lines")
+    print(f"{'top-k':>5} {'lines':>5} {'doc tokens':>10} {'prompt chars':>12} {'reduction':>9} {'recall':>7}  missed")
+    for top_k in [0] + top_ks:
+        kept = select_candidate_lines(lines, doc_config.field_descriptions, top_k=top_k, scores=scores)
+        prompt_chars = len(create_extraction_prompt(kept, doc_config))
+        recalled = recalled_fields(kept)
+        missed = [field_name for field_name in GROUND_TRUTH if field_name not in recalled]
+        print(
+            f"{top_k or 'off':>5} {len(kept):>5} {estimate_tokens(kept):>10} {prompt_chars:>12} "
+            f"{1 - estimate_tokens(kept) / base_tokens:>8.0%} {len(recalled):>3}/{len(GROUND_TRUTH):<3}  "
+            f"{', '.join(missed) or '-'}"
+        )
+    print(f"(unfiltered prompt: {base_chars} chars; reduction is of the document tokens)")
+
+
+def main() -> None:
+    """Entry point for the prefilter report."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", default="data/loan_application.pdf", help="Sample document")
+    parser.add_argument("--top-k", type=int, nargs="+", default=[1, 2, 3, 4, 5], help="Candidate lines per field")
+    args = parser.parse_args()
+
+    doc_config = load_document_config(DOCUMENT_TYPES_CONFIG_PATH)["credit_request"]
+    for view, lines in document_views(args.pdf).items():
+        report(view, lines, doc_config, args.top_k)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark PDF rasterization backends: pages per second and peak RSS.
+
+Each backend runs in a fresh process so peak memory is not polluted by the
+other run. Peak RSS of poppler subprocesses (pdf2image) is reported separately.
+
+Usage:
+    python -m benchmarks.bench_rasterization --pages 1 20 80
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.pdf_fixtures import replicate_pdf
+from src.ocr.easyocr_client import OCR_DPI
+from src.ocr.rasterization import RasterBackend, iter_page_images
+
+
+def _run_backend(backend_name: str, pdf_data: bytes, dpi: int, result_queue) -> None:
+    """Rasterize every page and report throughput and peak memory."""
+    backend = RasterBackend(backend_name)
+    start_time = time.perf_counter()
+    page_count = 0
+    for _, image in iter_page_images(pdf_data, dpi=dpi, backend=backend):
+        page_count += 1
+        del image
+    elapsed = time.perf_counter() - start_time
+
+    self_usage = resource.getrusage(resource.RUSAGE_SELF)
+    children_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    result_queue.put({
+        "pages": page_count,
+        "seconds": elapsed,
+        "peak_rss_mb": self_usage.ru_maxrss / 1024,
+        "peak_child_rss_mb": children_usage.ru_maxrss / 1024,
+    })
+
+
+def main() -> None:
+    """Run the benchmark for each requested page count and backend."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 20, 80], help="Page counts to test")
+    parser.add_argument("--dpi", type=int, default=OCR_DPI, help="Rasterization resolution")
+    parser.add_argument(
+        "--backends", nargs="+", default=[backend.value for backend in RasterBackend],
+        choices=[backend.value for backend in RasterBackend],
+    )
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'backend':<10} {'pages':>6} {'pages/s':>9} {'peak RSS MB':>12} {'child RSS MB':>13}")
+    for page_count in args.pages:
+        pdf_data = replicate_pdf(page_count)
+        for backend_name in args.backends:
+            result_queue = context.Queue()
+            process = context.Process(target=_run_backend, args=(backend_name, pdf_data, args.dpi, result_queue))
+            process.start()
+            process.join()
+            if process.exitcode != 0:
+                print(f"{backend_name:<10} {page_count:>6} failed (exit code {process.exitcode})")
+                continue
+            result = result_queue.get()
+            pages_per_second = result["pages"] / result["seconds"] if result["seconds"] else float("inf")
+            print(
+                f"{backend_name:<10} {result['pages']:>6} {pages_per_second:>9.1f} "
+                f"{result['peak_rss_mb']:>12.1f} {result['peak_child_rss_mb']:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark /results/{id} on a large document: rebuilt per request vs precomputed.
+
+"rebuilt" has only the OCR and LLM stage artifacts, so every request parses
+the full OCR dump and validates one pydantic model per element; "precomputed"
+serves the results document written at pipeline completion. Blob storage is
+in memory, so the numbers are the API's own CPU cost.
+
+Usage:
+    python -m benchmarks.bench_results_endpoint --elements 2000 --requests 200
+"""
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, Mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import get_blob_storage, get_metadata_repository
+from src.api.main import app
+from src.integration.results import RESULTS_EXT, build_results_payload, encode_results_payload
+from src.storage.storage import Stage
+
+DOCUMENT_ID = "bench-results-document"
+
+
+def synthetic_artifacts(element_count: int, seed: int = 0) -> tuple:
+    """OCR and LLM results of a document with element_count OCR lines."""
+    rng = random.Random(seed)
+    original_lines = []
+    for index in range(element_count):
+        x1, y1 = rng.uniform(0, 1100), rng.uniform(0, 1600)
+        width, height = rng.uniform(40, 300), rng.uniform(12, 20)
+        original_lines.append({
+            "text": f"Line {index} amount {rng.randint(0, 99999)} EUR",
+            "confidence": rng.uniform(0.5, 1.0),
+            "bbox": {"x1": x1, "y1": y1, "x2": x1 + width, "y2": y1 + height, "width": width, "height": height},
+            "page_num": index // 200 + 1,
+        })
+    ocr_content = {
+        "original_lines": original_lines,
+        "normalized_lines": [{"label": f"Label {index}", "value": str(index)} for index in range(element_count // 4)],
+    }
+    llm_content = {
+        "extraction_results": {
+            "extracted_fields": {
+                f"field_{index}": {"value": f"value {index}", "confidence": 0.9, "source_ocr_elements": [f"elem_{index}"]}
+                for index in range(25)
+            },
+            "validation_results": [],
+        }
+    }
+    return ocr_content, llm_content
+
+
+class InMemoryBlobStorage:
+    """Async blob storage serving fixed blobs."""
+
+    def __init__(self, blobs: Dict[tuple, bytes]) -> None:
+        self.blobs = blobs
+
+    async def download_blob(self, uuid: str, stage: Stage, ext: str) -> Optional[bytes]:
+        return self.blobs.get((stage, ext))
+
+    async def blob_exists(self, uuid: str, stage: Stage, ext: str) -> bool:
+        return False
+
+
+def _envelope(content: Dict[str, Any]) -> bytes:
+    return json.dumps({"document_uuid": DOCUMENT_ID, "data": content, "metadata": {}}, indent=2).encode("utf-8")
+
+
+def _time_requests(client: TestClient, request_count: int) -> List[float]:
+    latencies = []
+    for _ in range(request_count):
+        start_time = time.perf_counter()
+        response = client.get(f"/api/v1/results/{DOCUMENT_ID}")
+        latencies.append(time.perf_counter() - start_time)
+        assert response.status_code == 200, response.text
+    return latencies
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main() -> None:
+    """Time /results for both storage layouts."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--elements", type=int, default=2000, help="OCR elements in the document")
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests per layout")
+    args = parser.parse_args()
+    # Per-request access and route logs would dominate the output
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("src.api.routes").setLevel(logging.WARNING)
+
+    ocr_content, llm_content = synthetic_artifacts(args.elements)
+    stage_blobs = {(Stage.OCR, ".json"): _envelope(ocr_content), (Stage.LLM, ".json"): _envelope(llm_content)}
+    results_blob = encode_results_payload(build_results_payload(ocr_content, llm_content))
+    layouts = {
+        "rebuilt": InMemoryBlobStorage(stage_blobs),
+        "precomputed": InMemoryBlobStorage({**stage_blobs, (Stage.RESULTS, RESULTS_EXT): results_blob}),
+    }
+
+    metadata_repository = Mock()
+    metadata_repository.get_document = AsyncMock(return_value={
+        "id": DOCUMENT_ID, "filename": "bench.pdf", "processing_status": "done",
+    })
+    app.dependency_overrides[get_metadata_repository] = lambda: metadata_repository
+    client = TestClient(app)
+    stage_bytes = sum(len(blob) for blob in stage_blobs.values())
+    print(f"{args.elements} OCR elements: stage artifacts {stage_bytes / 1024:.0f} KiB, "
+          f"results document {len(results_blob) / 1024:.0f} KiB")
+    print(f"{'layout':>12} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    try:
+        for name, blob_storage in layouts.items():
+            app.dependency_overrides[get_blob_storage] = lambda blob_storage=blob_storage: blob_storage
+            _time_requests(client, 5)
+            latencies = _time_requests(client, args.requests)
+            print(
+                f"{name:>12} {statistics.mean(latencies) * 1000:>9.2f} "
+                f"{_percentile(latencies, 50) * 1000:>9.2f} {_percentile(latencies, 99) * 1000:>9.2f}"
+            )
+    finally:
+        app.dependency_overrides.pop(get_metadata_repository, None)
+        app.dependency_overrides.pop(get_blob_storage, None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark detect_lines_on_same_row on synthetic dense pages.
+
+Pages are table-like: rows of eight cells with a little vertical jitter,
+similar to bank statements or appendix tables. The original quadratic
+implementation is timed alongside for comparison up to --legacy-max boxes.
+
+Usage:
+    python -m benchmarks.bench_row_grouping --boxes 100 1500 5000 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.ocr.spatial_analysis import detect_lines_on_same_row
+
+
+def _legacy_detect_lines_on_same_row(ocr_lines: List[Dict[str, Any]], tolerance: float = 15.0):
+    """Original implementation: list.pop(0) plus a full scan per seed."""
+    grouped_lines = []
+    remaining_lines = ocr_lines.copy()
+    while remaining_lines:
+        current_line = remaining_lines.pop(0)
+        current_group = [current_line]
+        current_y_center = (current_line['bbox']['y1'] + current_line['bbox']['y2']) / 2
+        current_height = current_line['bbox']['y2'] - current_line['bbox']['y1']
+        lines_to_remove = []
+        for i, line in enumerate(remaining_lines):
+            line_y_center = (line['bbox']['y1'] + line['bbox']['y2']) / 2
+            line_height = line['bbox']['y2'] - line['bbox']['y1']
+            center_distance = abs(current_y_center - line_y_center)
+            avg_height = (current_height + line_height) / 2
+            if center_distance < tolerance and center_distance < avg_height * 0.5:
+                current_group.append(line)
+                lines_to_remove.append(i)
+        for i in reversed(lines_to_remove):
+            remaining_lines.pop(i)
+        current_group.sort(key=lambda x: x['bbox']['x1'])
+        grouped_lines.append(current_group)
+    return grouped_lines
+
+
+def synthetic_page(box_count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Table-like page with box_count OCR boxes in reading order."""
+    rng = random.Random(seed)
+    lines = []
+    for index in range(box_count):
+        row, column = divmod(index, 8)
+        y1 = row * 28 + rng.uniform(-2, 2)
+        x1 = column * 150 + rng.uniform(-5, 5)
+        lines.append({
+            "text": f"cell {index}",
+            "confidence": 0.9,
+            "page_num": 1,
+            "bbox": {"x1": x1, "y1": y1, "x2": x1 + 120, "y2": y1 + 18},
+        })
+    return lines
+
+
+def _time(function, lines: List[Dict[str, Any]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function(lines)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def main() -> None:
+    """Time both implementations for each requested page size."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--boxes", type=int, nargs="+", default=[100, 1500, 5000, 20000], help="Boxes per page")
+    parser.add_argument("--legacy-max", type=int, default=20000, help="Largest page to time the legacy version on")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'boxes':>7} {'sweep ms':>10} {'legacy ms':>10} {'speedup':>8}")
+    for box_count in args.boxes:
+        lines = synthetic_page(box_count)
+        sweep_seconds = _time(detect_lines_on_same_row, lines, args.repeat)
+        if box_count <= args.legacy_max:
+            legacy_seconds = _time(_legacy_detect_lines_on_same_row, lines, 1)
+            assert detect_lines_on_same_row(lines) == _legacy_detect_lines_on_same_row(lines)
+            print(
+                f"{box_count:>7} {sweep_seconds * 1000:>10.2f} {legacy_seconds * 1000:>10.2f} "
+                f"{legacy_seconds / sweep_seconds:>7.1f}x"
+            )
+        else:
+            print(f"{box_count:>7} {sweep_seconds * 1000:>10.2f} {'-':>10} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
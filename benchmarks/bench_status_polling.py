@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark /status/{id} polling latency with per-request vs app-scoped services.
+
+"per-request" rebuilds a BlobServiceClient and DmsService for every request,
+as the API did before services moved into the lifespan; "app-scoped" injects
+the single repository kept on app.state. The metadata repository is an
+in-memory stub so the numbers isolate the per-request setup cost from
+database round trips (with --database, the real connection pool is used).
+
+Usage:
+    python -m benchmarks.bench_status_polling --requests 2000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from azure.storage.blob import BlobServiceClient
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import create_dms_service, get_metadata_repository
+from src.api.main import app
+from src.dms.adapters import AzureBlobStorageClient
+from src.dms.async_adapters import ThreadedMetadataRepository
+from src.dms.service import DmsService
+from src.storage.storage import get_storage
+
+DOCUMENT_ID = "bench-status-document"
+
+
+class InMemoryMetadataRepository:
+    """Metadata repository holding a single ready document."""
+
+    def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
+        return {
+            "document_id": document_id,
+            "filename": "loan_application.pdf",
+            "textextraction_status": "done",
+            "processing_status": "done",
+        }
+
+
+def _connection_string() -> str:
+    return get_storage().connection_string
+
+
+def _per_request_service(use_database: bool):
+    def factory() -> ThreadedMetadataRepository:
+        storage_client = AzureBlobStorageClient(BlobServiceClient.from_connection_string(_connection_string()))
+        if use_database:
+            service = DmsService(storage_client, create_dms_service().metadata_repository)
+        else:
+            service = DmsService(storage_client, InMemoryMetadataRepository())
+        return ThreadedMetadataRepository(service.metadata_repository)
+    return factory
+
+
+def _app_scoped_service(use_database: bool):
+    if use_database:
+        service = create_dms_service()
+    else:
+        storage_client = AzureBlobStorageClient(get_storage().blob_service_client)
+        service = DmsService(storage_client, InMemoryMetadataRepository())
+    repository = ThreadedMetadataRepository(service.metadata_repository)
+    return lambda: repository
+
+
+def _poll(client: TestClient, request_count: int) -> List[float]:
+    latencies = []
+    for _ in range(request_count):
+        start_time = time.perf_counter()
+        response = client.get(f"/api/v1/status/{DOCUMENT_ID}")
+        latencies.append(time.perf_counter() - start_time)
+        assert response.status_code == 200, response.text
+    return latencies
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main() -> None:
+    """Poll the status endpoint with both dependency setups and report latency percentiles."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Status requests per setup")
+    parser.add_argument("--warmup", type=int, default=100, help="Untimed requests per setup")
+    parser.add_argument("--database", action="store_true", help="Read metadata through the real connection pool")
+    args = parser.parse_args()
+
+    setups = {
+        "per-request": _per_request_service(args.database),
+        "app-scoped": _app_scoped_service(args.database),
+    }
+    client = TestClient(app)
+    print(f"{'setup':>12} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    try:
+        for name, factory in setups.items():
+            app.dependency_overrides[get_metadata_repository] = factory
+            _poll(client, args.warmup)
+            latencies = _poll(client, args.requests)
+            print(
+                f"{name:>12} {statistics.mean(latencies) * 1000:>9.3f} "
+                f"{_percentile(latencies, 50) * 1000:>9.3f} {_percentile(latencies, 99) * 1000:>9.3f} "
+                f"{max(latencies) * 1000:>9.3f}"
+            )
+    finally:
+        app.dependency_overrides.pop(get_metadata_repository, None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Synthetic PDF inputs for benchmarks.
+"""
+
+from pathlib import Path
+
+import pymupdf
+
+SAMPLE_PDF = Path(__file__).resolve().parents[1] / "data" / "loan_application.pdf"
+
+
+def replicate_pdf(page_count: int, source_path: Path = SAMPLE_PDF) -> bytes:
+    """
+    Build a PDF with page_count pages by repeating the pages of source_path.
+
+    Args:
+        page_count: Number of pages in the generated document
+        source_path: PDF whose pages are repeated
+
+    Returns:
+        PDF bytes
+    """
+    source = pymupdf.open(source_path)
+    target = pymupdf.open()
+    try:
+        while target.page_count < page_count:
+            remaining = page_count - target.page_count
+            target.insert_pdf(source, to_page=min(source.page_count, remaining) - 1)
+        return target.tobytes()
+    finally:
+        target.close()
+        source.close()
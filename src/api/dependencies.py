@@ -0,0 +1,137 @@
+"""
+Application-scoped services for the API.
+
+The DMS service, the async metadata repository, the async blob storage and
+the outbound HTTP session are created once in the FastAPI lifespan, kept on
+``app.state`` and handed to the endpoints with ``Depends``, so a status poll
+does not pay for a new blob client and repository each time and does not
+block the event loop.
+"""
+
+import logging
+
+import aiohttp
+from fastapi import FastAPI, Request
+
+from ..config import AppConfig
+from ..dms.adapters import AzureBlobStorageClient, PostgresMetadataRepository
+from ..dms.async_adapters import AsyncPostgresMetadataRepository, ThreadedMetadataRepository
+from ..dms.connection_pool import close_connection_pool, get_connection_pool
+from ..dms.interfaces import AsyncMetadataRepository
+from ..dms.service import DmsService
+from ..storage.async_storage import AsyncBlobStorage
+from ..storage.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+
+def create_dms_service() -> DmsService:
+    """
+    Build a DMS service on the process-wide blob client and connection pool.
+
+    Returns:
+        DmsService backed by the shared BlobServiceClient and PostgreSQL pool
+    """
+    # Same client (and connection string resolution) as the pipeline storage
+    storage_client = AzureBlobStorageClient(get_storage().blob_service_client)
+    metadata_repository = PostgresMetadataRepository(pool=get_connection_pool())
+    return DmsService(storage_client=storage_client, metadata_repository=metadata_repository)
+
+
+async def create_async_metadata_repository(dms_service: DmsService) -> AsyncMetadataRepository:
+    """
+    Open the asyncpg-backed metadata repository.
+
+    Falls back to running the DMS service's synchronous repository in worker
+    threads if the asyncpg pool cannot be created.
+
+    Args:
+        dms_service: DMS service whose repository serves as the fallback
+
+    Returns:
+        Repository for the endpoints' metadata reads
+    """
+    try:
+        return await AsyncPostgresMetadataRepository.create(AppConfig().database)
+    except Exception as e:
+        logger.warning(f"asyncpg pool unavailable, running metadata queries in threads: {e}")
+        return ThreadedMetadataRepository(dms_service.metadata_repository)
+
+
+async def init_app_services(app: FastAPI) -> None:
+    """Create the shared services and store them on app.state."""
+    app.state.dms_service = create_dms_service()
+    app.state.http_session = aiohttp.ClientSession()
+    app.state.blob_storage = AsyncBlobStorage()
+    app.state.metadata_repository = await create_async_metadata_repository(app.state.dms_service)
+    logger.info("API services initialized")
+
+
+async def close_app_services(app: FastAPI) -> None:
+    """Release the shared services created by init_app_services."""
+    metadata_repository = getattr(app.state, "metadata_repository", None)
+    if metadata_repository is not None:
+        await metadata_repository.close()
+    blob_storage = getattr(app.state, "blob_storage", None)
+    if blob_storage is not None:
+        await blob_storage.close()
+    http_session = getattr(app.state, "http_session", None)
+    if http_session is not None:
+        await http_session.close()
+    app.state.metadata_repository = None
+    app.state.blob_storage = None
+    app.state.http_session = None
+    app.state.dms_service = None
+    close_connection_pool()
+    logger.info("API services closed")
+
+
+def get_dms_service(request: Request) -> DmsService:
+    """
+    Dependency returning the application's DMS service.
+
+    Falls back to creating it on first use when the app runs without its
+    lifespan (e.g. a TestClient used outside a ``with`` block).
+    """
+    dms_service = getattr(request.app.state, "dms_service", None)
+    if dms_service is None:
+        dms_service = create_dms_service()
+        request.app.state.dms_service = dms_service
+    return dms_service
+
+
+def get_metadata_repository(request: Request) -> AsyncMetadataRepository:
+    """
+    Dependency returning the application's async metadata repository.
+
+    Without the lifespan there is no event-loop-bound asyncpg pool, so the
+    DMS service's repository is wrapped to run in worker threads instead.
+    """
+    metadata_repository = getattr(request.app.state, "metadata_repository", None)
+    if metadata_repository is None:
+        metadata_repository = ThreadedMetadataRepository(get_dms_service(request).metadata_repository)
+        request.app.state.metadata_repository = metadata_repository
+    return metadata_repository
+
+
+def get_blob_storage(request: Request) -> AsyncBlobStorage:
+    """Dependency returning the application's async blob storage."""
+    blob_storage = getattr(request.app.state, "blob_storage", None)
+    if blob_storage is None:
+        blob_storage = AsyncBlobStorage()
+        request.app.state.blob_storage = blob_storage
+    return blob_storage
+
+
+async def get_http_session(request: Request) -> aiohttp.ClientSession:
+    """
+    Dependency returning the application's shared aiohttp session.
+
+    Async so that a session created on first use (without the lifespan) is
+    bound to the running event loop.
+    """
+    http_session = getattr(request.app.state, "http_session", None)
+    if http_session is None or http_session.closed:
+        http_session = aiohttp.ClientSession()
+        request.app.state.http_session = http_session
+    return http_session
@@ -12,6 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from .routes import router
 from .models import ErrorResponse
 from .config import ApiConfig
+from .dependencies import close_app_services, init_app_services
 from ..storage.storage import get_storage
 
 # Configure logging
@@ -36,10 +37,17 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize storage: {e}")
     
+    # Create the DMS service, metadata repository and HTTP session once for all requests
+    try:
+        await init_app_services(app)
+    except Exception as e:
+        logger.error(f"Failed to initialize API services: {e}")
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Credit OCR System API")
+    await close_app_services(app)
 
 
 # Load configuration
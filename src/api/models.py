@@ -36,6 +36,7 @@ class OcrElementData(BaseModel):
     confidence: float = Field(..., description="OCR confidence score")
     bbox: BoundingBoxData = Field(..., description="Bounding box coordinates")
     page_num: int = Field(..., description="Page number")
+    element_index: Optional[int] = Field(None, description="Position in the document's OCR elements (projected responses only)")
 
 
 class ExtractedFieldData(BaseModel):
@@ -74,6 +75,7 @@ class DocumentResultsResponse(BaseModel):
     extracted_fields: List[ExtractedFieldData] = Field(default_factory=list, description="Extracted fields")
     ocr_elements: List[OcrElementData] = Field(default_factory=list, description="OCR elements")
     has_visualization: bool = Field(False, description="Whether visualization is available")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page of OCR elements, set while more elements match")
 
 
 class ErrorResponse(BaseModel):
@@ -88,3 +90,4 @@ class HealthCheckResponse(BaseModel):
     status: str = Field(..., description="Service status")
     timestamp: datetime = Field(..., description="Check timestamp")
     services: Dict[str, str] = Field(..., description="Individual service statuses")
+    metrics: Dict[str, Any] = Field(default_factory=dict, description="Resource metrics such as database pool usage")
@@ -1,73 +1,73 @@
+import asyncio
+import json
+import os
 import uuid
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from io import BytesIO
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Response
+import aiohttp
+from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Response, Depends, Query
 from fastapi.responses import StreamingResponse
 
 from .models import (
     DocumentUploadResponse, DocumentStatusResponse, DocumentResultsResponse,
-    ProcessingStatus, ErrorResponse, HealthCheckResponse, OcrElementData,
-    ExtractedFieldData, ProcessingSummaryData, BoundingBoxData
+    ProcessingStatus, ErrorResponse, HealthCheckResponse
 )
 from ..async_processing import AsyncDocumentProcessor
 from ..storage.storage import get_storage, Stage
+from ..storage.async_storage import AsyncBlobStorage
+from ..storage.ocr_codec import OCR_COLUMNAR_EXT
+from ..integration.results import (
+    RESULTS_EXT, RESULTS_FIELDS_EXT, build_results_payload, compose_results_response,
+    encode_results_payload, parse_ocr_artifact, parse_stored_artifact, resolve_results_sections
+)
+from ..integration.ocr_export import NDJSON_MEDIA_TYPE, iter_columnar_export_lines, iter_ocr_export_lines
+from ..integration.ocr_index import (
+    OCR_INDEX_EXT, index_ocr_elements, page_shard_ext, parse_cursor, plan_shard_reads, select_ocr_elements
+)
 from ..dms.service import DmsService
-from ..dms.adapters import AzureBlobStorageClient, PostgresMetadataRepository
+from ..dms.interfaces import AsyncMetadataRepository
+from ..dms.connection_pool import get_connection_pool_stats
 from ..config import AppConfig
-import psycopg2
-from azure.storage.blob import BlobServiceClient
+from .config import ApiConfig
+from .dependencies import get_blob_storage, get_dms_service, get_http_session, get_metadata_repository
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+MAX_RESULTS_PAGE_SIZE = 5000
+
 # Initialize configuration and services
 app_config = AppConfig()
+api_config = ApiConfig()
 
 
-def get_dms_service() -> DmsService:
-    """Create and return DMS service instance."""
-    connection_string = (
-        "DefaultEndpointsProtocol=http;"
-        f"AccountName={app_config.azure.storage.account_name};"
-        f"AccountKey={app_config.azure.storage.account_key};"
-        f"BlobEndpoint=http://localhost:10000/devstoreaccount1;"
-    )
-    
-    blob_service_client = BlobServiceClient.from_connection_string(connection_string)
-    pg_conn = psycopg2.connect(
-        host=app_config.database.host,
-        port=app_config.database.port,
-        database=app_config.database.name,
-        user=app_config.database.user,
-        password=app_config.database.password,
-    )
-    
-    storage_client = AzureBlobStorageClient(blob_service_client)
-    metadata_repository = PostgresMetadataRepository(pg_conn)
-    
-    return DmsService(storage_client=storage_client, metadata_repository=metadata_repository)
+def _upload_size(file: UploadFile) -> int:
+    """Size of the spooled upload, measured without reading it."""
+    file.file.seek(0, os.SEEK_END)
+    size = file.file.tell()
+    file.file.seek(0)
+    return size
+
 
+async def process_document_background(
+    document_id: str,
+    filename: str,
+    dms_service: Optional[DmsService] = None
+):
+    """Background task to trigger processing of an uploaded document.
 
-async def process_document_background(document_id: str, filename: str, file_data: bytes):
-    """Background task to process uploaded document."""
+    The document bytes were already stored by the DMS; the OCR task reads
+    them from there, so nothing is uploaded again here.
+    """
     try:
-        logger.info(f"Starting background processing for document {document_id}")
-        
-        # Store raw PDF in blob storage
-        storage_client = get_storage()
-        storage_client.upload_blob(
-            uuid=document_id,
-            stage=Stage.RAW,
-            ext=".pdf",
-            data=file_data
-        )
+        logger.info(f"Starting background processing for document {document_id} ({filename})")
         
-        # Initialize async processor and trigger processing
-        async_processor = AsyncDocumentProcessor()
-        task_id = async_processor.trigger_processing(document_id)
+        # Initialize async processor and trigger processing (database and broker calls block)
+        async_processor = AsyncDocumentProcessor(dms_service=dms_service)
+        task_id = await asyncio.to_thread(async_processor.trigger_processing, document_id)
         
         if task_id:
             logger.info(f"Successfully triggered async processing for document {document_id}, task ID: {task_id}")
@@ -81,7 +81,8 @@ async def process_document_background(document_id: str, filename: str, file_data
 @router.post("/upload", response_model=DocumentUploadResponse)
 async def upload_document(
     background_tasks: BackgroundTasks,
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    dms_service: DmsService = Depends(get_dms_service)
 ) -> DocumentUploadResponse:
     """
     Upload a PDF document for processing.
@@ -100,17 +101,22 @@ async def upload_document(
         # Generate unique document ID
         document_id = str(uuid.uuid4())
         
-        # Read file data
-        file_data = await file.read()
-        if len(file_data) == 0:
+        # The upload is spooled to a temporary file; check its size without reading it
+        file_size = _upload_size(file)
+        if file_size == 0:
             raise HTTPException(status_code=400, detail="Empty file uploaded")
+        if file_size > api_config.max_file_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File exceeds the maximum upload size of {api_config.max_file_size // (1024 * 1024)} MB"
+            )
         
-        # Store document in DMS
-        dms_service = get_dms_service()
-        dms_service.store_document(
+        # Store document in DMS: hashed and uploaded in chunks, identical bytes are stored once
+        await asyncio.to_thread(
+            dms_service.store_document,
             document_id=document_id,
             filename=file.filename,
-            file_data=file_data
+            file_data=file.file
         )
         
         # Schedule background processing
@@ -118,7 +124,7 @@ async def upload_document(
             process_document_background,
             document_id,
             file.filename,
-            file_data
+            dms_service
         )
         
         logger.info(f"Document uploaded successfully: {document_id} ({file.filename})")
@@ -130,13 +136,18 @@ async def upload_document(
             message="Document uploaded successfully and processing started"
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error uploading document: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to upload document: {str(e)}")
 
 
 @router.get("/status/{document_id}", response_model=DocumentStatusResponse)
-async def get_document_status(document_id: str) -> DocumentStatusResponse:
+async def get_document_status(
+    document_id: str,
+    metadata_repository: AsyncMetadataRepository = Depends(get_metadata_repository)
+) -> DocumentStatusResponse:
     """
     Get processing status for a document.
     
@@ -147,8 +158,7 @@ async def get_document_status(document_id: str) -> DocumentStatusResponse:
         DocumentStatusResponse with current status
     """
     try:
-        dms_service = get_dms_service()
-        document = dms_service.get_document(document_id)
+        document = await metadata_repository.get_document(document_id)
         
         if not document:
             raise HTTPException(status_code=404, detail="Document not found")
@@ -190,21 +200,152 @@ async def get_document_status(document_id: str) -> DocumentStatusResponse:
         raise HTTPException(status_code=500, detail=f"Failed to get document status: {str(e)}")
 
 
+async def _has_visualization(blob_storage: AsyncBlobStorage, document_id: str) -> bool:
+    """Check if visualization exists (check for page 1)."""
+    try:
+        has_visualization = await blob_storage.blob_exists(document_id, Stage.ANNOTATED, "_page_1.png")
+        logger.info(f"Visualization check for {document_id}: {has_visualization}")
+        return has_visualization
+    except Exception as e:
+        logger.warning(f"Error checking visualization for {document_id}: {e}")
+        return False
+
+
+async def _download_ocr_artifact(blob_storage: AsyncBlobStorage, document_id: str) -> Optional[bytes]:
+    """
+    Read the stored OCR artifact in whichever format it was written.
+
+    The configured format is tried first, as in pipeline.load_ocr_results.
+    """
+    extensions = [OCR_COLUMNAR_EXT, ".json"]
+    if app_config.ocr.artifact_format != "columnar":
+        extensions.reverse()
+    for ext in extensions:
+        ocr_data = await blob_storage.download_blob(document_id, Stage.OCR, ext)
+        if ocr_data is not None:
+            return ocr_data
+    return None
+
+
+async def _load_results_payload(blob_storage: AsyncBlobStorage, document_id: str) -> Dict[str, Any]:
+    """Load the full results document, rebuilding it from the OCR and LLM stages if it was not precomputed."""
+    results_data = await blob_storage.download_blob(document_id, Stage.RESULTS, RESULTS_EXT)
+    if results_data:
+        return await asyncio.to_thread(json.loads, results_data)
+    ocr_data, llm_data = await asyncio.gather(
+        _download_ocr_artifact(blob_storage, document_id),
+        blob_storage.download_blob(document_id, Stage.LLM, ".json"),
+    )
+    return await asyncio.to_thread(
+        lambda: build_results_payload(parse_ocr_artifact(ocr_data), parse_stored_artifact(llm_data))
+    )
+
+
+async def _load_results_fields(blob_storage: AsyncBlobStorage, document_id: str) -> Dict[str, Any]:
+    """Load the processing summary and extracted fields without the OCR elements where possible."""
+    fields_data = await blob_storage.download_blob(document_id, Stage.RESULTS, RESULTS_FIELDS_EXT)
+    if fields_data:
+        return json.loads(fields_data)
+    return await _load_results_payload(blob_storage, document_id)
+
+
+async def _load_ocr_elements(
+    blob_storage: AsyncBlobStorage,
+    document_id: str,
+    page: Optional[int],
+    start: int,
+    limit: Optional[int],
+    min_confidence: Optional[float],
+) -> tuple:
+    """
+    Select OCR elements from the page shards written by the OCR stage.
+
+    Only shards the index marks as able to contain matching elements are read;
+    with a limit they are read one at a time until the page is full.
+
+    Returns:
+        Tuple of (selected elements, next cursor or None)
+    """
+    index_data = await blob_storage.download_blob(document_id, Stage.OCR, OCR_INDEX_EXT)
+    if not index_data:
+        # Documents processed before page shards existed: filter the full element list
+        payload = await _load_results_payload(blob_storage, document_id)
+        elements = index_ocr_elements(payload.get("ocr_elements", []))
+        return select_ocr_elements(elements, start, min_confidence, limit, page)
+
+    entries = plan_shard_reads(json.loads(index_data), page, start, min_confidence)
+
+    async def read_shard(entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+        shard_data = await blob_storage.download_blob(document_id, Stage.OCR, page_shard_ext(entry["page_num"]))
+        if shard_data is None:
+            logger.warning(f"OCR shard for page {entry['page_num']} of {document_id} is missing")
+            return []
+        return json.loads(shard_data)
+
+    if limit is None:
+        shards = await asyncio.gather(*(read_shard(entry) for entry in entries))
+        selected, _ = select_ocr_elements(
+            (element for shard in shards for element in shard), start, min_confidence, None, page
+        )
+        return selected, None
+
+    selected: List[Dict[str, Any]] = []
+    for entry in entries:
+        # Once the page is full the limit is 0: the next matching element only sets the cursor,
+        # so a cursor is returned only when another matching element exists
+        shard_elements, next_cursor = select_ocr_elements(
+            await read_shard(entry), start, min_confidence, limit - len(selected), page
+        )
+        selected.extend(shard_elements)
+        if next_cursor is not None:
+            return selected, next_cursor
+    return selected, None
+
+
 @router.get("/results/{document_id}", response_model=DocumentResultsResponse)
-async def get_document_results(document_id: str) -> DocumentResultsResponse:
+async def get_document_results(
+    document_id: str,
+    include: Optional[str] = Query(None, description="Comma-separated sections to return: summary, fields, ocr_elements"),
+    exclude: Optional[str] = Query(None, description="Comma-separated sections to leave out"),
+    page: Optional[int] = Query(None, ge=1, description="Only OCR elements of this page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous OCR element page"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_RESULTS_PAGE_SIZE, description="Maximum OCR elements to return"),
+    min_confidence: Optional[float] = Query(None, ge=0.0, le=1.0, description="Minimum OCR confidence"),
+    metadata_repository: AsyncMetadataRepository = Depends(get_metadata_repository),
+    blob_storage: AsyncBlobStorage = Depends(get_blob_storage)
+) -> DocumentResultsResponse:
     """
     Get complete processing results for a document.
     
+    Without query parameters the full results document is returned. With any
+    of them, only the selected sections are returned, OCR elements are
+    filtered server-side from the per-page shards and carry their
+    ``element_index``, and ``next_cursor`` is set while more elements match.
+    
     Args:
         document_id: Document identifier
+        include: Sections to return (summary, fields, ocr_elements)
+        exclude: Sections to leave out
+        page: Only OCR elements of this page
+        cursor: Continue after the previous OCR element page
+        limit: Maximum number of OCR elements
+        min_confidence: Minimum OCR confidence of returned elements
         
     Returns:
         DocumentResultsResponse with complete results
     """
+    try:
+        sections = resolve_results_sections(include, exclude)
+        start = parse_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    is_projected = any(
+        value is not None for value in (include, exclude, page, cursor, limit, min_confidence)
+    )
+    
     try:
         # Get document metadata
-        dms_service = get_dms_service()
-        document = dms_service.get_document(document_id)
+        document = await metadata_repository.get_document(document_id)
         
         if not document:
             raise HTTPException(status_code=404, detail="Document not found")
@@ -220,94 +361,6 @@ async def get_document_results(document_id: str) -> DocumentResultsResponse:
                 detail="Document processing not yet complete"
             )
         
-        # Get processing results from blob storage
-        storage_client = get_storage()
-        
-        # Load OCR results
-        ocr_data = storage_client.download_blob(document_id, Stage.OCR, ".json")
-        llm_data = storage_client.download_blob(document_id, Stage.LLM, ".json")
-        
-        ocr_elements = []
-        extracted_fields = []
-        processing_summary = None
-        ocr_results = None
-        llm_results = None
-        
-        if ocr_data:
-            import json
-            ocr_results = json.loads(ocr_data.decode('utf-8'))
-            # Check if data is nested under 'data' key
-            if 'data' in ocr_results:
-                ocr_data_content = ocr_results['data']
-            else:
-                ocr_data_content = ocr_results
-            
-            if 'original_lines' in ocr_data_content:
-                for element in ocr_data_content['original_lines']:
-                    ocr_elements.append(OcrElementData(
-                        text=element['text'],
-                        confidence=element['confidence'],
-                        bbox=BoundingBoxData(**element['bbox']),
-                        page_num=element['page_num']
-                    ))
-        
-        if llm_data:
-            llm_results = json.loads(llm_data.decode('utf-8'))
-            # Check if data is nested under 'data' key
-            if 'data' in llm_results:
-                llm_data_content = llm_results['data']
-            else:
-                llm_data_content = llm_results
-            
-            extraction_results = llm_data_content.get('extraction_results', {})
-            
-            if 'extracted_fields' in extraction_results:
-                for field_name, field_data in extraction_results['extracted_fields'].items():
-                    # Convert value to string, handling different data types
-                    raw_value = field_data.get('value')
-                    if raw_value is not None:
-                        extracted_value = str(raw_value)
-                    else:
-                        extracted_value = None
-                        
-                    extracted_fields.append(ExtractedFieldData(
-                        field_name=field_name,
-                        extracted_value=extracted_value,
-                        confidence_score=field_data.get('confidence'),
-                        source_ocr_elements=field_data.get('source_ocr_elements', [])
-                    ))
-        
-        # Check if visualization exists (check for page 1)
-        try:
-            has_visualization = storage_client.blob_exists(document_id, Stage.ANNOTATED, "_page_1.png")
-            logger.info(f"Visualization check for {document_id}: {has_visualization}")
-        except Exception as e:
-            logger.warning(f"Error checking visualization for {document_id}: {e}")
-            has_visualization = False
-        
-        # Create processing summary
-        if ocr_data and llm_data:
-            normalized_count = 0
-            validation_errors_count = 0
-            
-            if ocr_results and 'data' in ocr_results:
-                normalized_count = len(ocr_results['data'].get('normalized_lines', []))
-            elif ocr_results:
-                normalized_count = len(ocr_results.get('normalized_lines', []))
-                
-            if llm_results and 'data' in llm_results:
-                llm_content = llm_results['data']
-                validation_errors_count = len(llm_content.get('extraction_results', {}).get('validation_results', []))
-            elif llm_results:
-                validation_errors_count = len(llm_results.get('extraction_results', {}).get('validation_results', []))
-            
-            processing_summary = ProcessingSummaryData(
-                total_ocr_elements=len(ocr_elements),
-                normalized_elements=normalized_count,
-                extracted_fields=len(extracted_fields),
-                validation_errors=validation_errors_count
-            )
-        
         # Map status
         status_mapping = {
             'done': ProcessingStatus.COMPLETED,
@@ -316,21 +369,59 @@ async def get_document_results(document_id: str) -> DocumentResultsResponse:
             'failed': ProcessingStatus.FAILED
         }
         
-        processing_status = document.get('processing_status')
-        textextraction_status = document.get('textextraction_status')
         status_to_map = processing_status if processing_status else textextraction_status
-        
         api_status = status_mapping.get(status_to_map, ProcessingStatus.COMPLETED)
+        filename = document.get('filename', 'unknown')
+        header = {
+            "document_id": document_id,
+            "filename": filename,
+            "status": api_status.value,
+        }
         
-        return DocumentResultsResponse(
-            document_id=document_id,
-            filename=document.get('filename', 'unknown'),
-            status=api_status,
-            processing_summary=processing_summary,
-            extracted_fields=extracted_fields,
-            ocr_elements=ocr_elements,
-            has_visualization=has_visualization
+        if is_projected:
+            loads = [_has_visualization(blob_storage, document_id)]
+            wants_fields = "processing_summary" in sections or "extracted_fields" in sections
+            if wants_fields:
+                loads.append(_load_results_fields(blob_storage, document_id))
+            if "ocr_elements" in sections:
+                loads.append(_load_ocr_elements(blob_storage, document_id, page, start, limit, min_confidence))
+            loaded = await asyncio.gather(*loads)
+            
+            body: Dict[str, Any] = {**header, "has_visualization": loaded[0]}
+            fields_payload = loaded[1] if wants_fields else {}
+            for key in ("processing_summary", "extracted_fields"):
+                if key in sections:
+                    body[key] = fields_payload.get(key)
+            if "ocr_elements" in sections:
+                body["ocr_elements"], body["next_cursor"] = loaded[-1]
+            return Response(content=encode_results_payload(body), media_type="application/json")
+        
+        # Fetch the precomputed results document and check for the visualization concurrently
+        results_data, has_visualization = await asyncio.gather(
+            blob_storage.download_blob(document_id, Stage.RESULTS, RESULTS_EXT),
+            _has_visualization(blob_storage, document_id),
+        )
+        
+        if results_data:
+            # Serve the stored body as is; only the per-request fields are added
+            content = compose_results_response({**header, "has_visualization": has_visualization}, results_data)
+            return Response(content=content, media_type="application/json")
+        
+        # Documents processed before results documents existed: rebuild from the OCR and LLM stages
+        ocr_data, llm_data = await asyncio.gather(
+            _download_ocr_artifact(blob_storage, document_id),
+            blob_storage.download_blob(document_id, Stage.LLM, ".json"),
+        )
+        
+        # JSON parsing and encoding of large OCR dumps happen off the event loop. The body is
+        # built like the precomputed document, so both paths return the same shape.
+        results_data = await asyncio.to_thread(
+            lambda: encode_results_payload(
+                build_results_payload(parse_ocr_artifact(ocr_data), parse_stored_artifact(llm_data))
+            )
         )
+        content = compose_results_response({**header, "has_visualization": has_visualization}, results_data)
+        return Response(content=content, media_type="application/json")
         
     except HTTPException:
         raise
@@ -340,7 +431,12 @@ async def get_document_results(document_id: str) -> DocumentResultsResponse:
 
 
 @router.get("/visualization/{document_id}")
-async def get_document_visualization(document_id: str, page: int = 1) -> StreamingResponse:
+async def get_document_visualization(
+    document_id: str,
+    page: int = 1,
+    metadata_repository: AsyncMetadataRepository = Depends(get_metadata_repository),
+    blob_storage: AsyncBlobStorage = Depends(get_blob_storage)
+) -> StreamingResponse:
     """
     Get visualization image with OCR bounding boxes for a document page.
     
@@ -352,16 +448,13 @@ async def get_document_visualization(document_id: str, page: int = 1) -> Streami
         PNG image with OCR overlays
     """
     try:
-        storage_client = get_storage()
-        
         # Check if document exists
-        dms_service = get_dms_service()
-        document = dms_service.get_document(document_id)
+        document = await metadata_repository.get_document(document_id)
         if not document:
             raise HTTPException(status_code=404, detail="Document not found")
         
         # Get visualization image
-        visualization_data = storage_client.download_blob(
+        visualization_data = await blob_storage.download_blob(
             document_id, Stage.ANNOTATED, f"_page_{page}.png"
         )
         
@@ -385,8 +478,60 @@ async def get_document_visualization(document_id: str, page: int = 1) -> Streami
         raise HTTPException(status_code=500, detail=f"Failed to get visualization: {str(e)}")
 
 
+@router.get("/export/{document_id}/ocr")
+async def export_ocr_elements(
+    document_id: str,
+    include_normalized: bool = Query(False, description="Also export the normalized label/value lines"),
+    metadata_repository: AsyncMetadataRepository = Depends(get_metadata_repository),
+    blob_storage: AsyncBlobStorage = Depends(get_blob_storage)
+) -> StreamingResponse:
+    """
+    Stream the OCR elements of a document as NDJSON.
+    
+    The stored OCR artifact is read in ranges and parsed incrementally, so
+    memory use does not grow with the document.
+    
+    Args:
+        document_id: Document identifier
+        include_normalized: Also export normalized lines
+        
+    Returns:
+        NDJSON stream with one ocr_element (or normalized_line) object per line
+    """
+    try:
+        document = await metadata_repository.get_document(document_id)
+        if not document:
+            raise HTTPException(status_code=404, detail="Document not found")
+        
+        chunks = await blob_storage.open_blob_stream(document_id, Stage.OCR, ".json")
+        if chunks is not None:
+            export_lines = iter_ocr_export_lines(chunks, document_id, include_normalized)
+        else:
+            # Columnar artifacts are compact; they are decoded page by page while streaming
+            columnar_data = await blob_storage.download_blob(document_id, Stage.OCR, OCR_COLUMNAR_EXT)
+            if columnar_data is None:
+                raise HTTPException(status_code=404, detail=f"OCR results not found for document {document_id}")
+            export_lines = iter_columnar_export_lines(columnar_data, document_id, include_normalized)
+        
+        return StreamingResponse(
+            export_lines,
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={"Content-Disposition": f"attachment; filename=ocr_{document_id}.ndjson"}
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error exporting OCR elements: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to export OCR elements: {str(e)}")
+
+
 @router.get("/documents", response_model=List[DocumentStatusResponse])
-async def list_documents(limit: int = 50, offset: int = 0) -> List[DocumentStatusResponse]:
+async def list_documents(
+    limit: int = 50,
+    offset: int = 0,
+    metadata_repository: AsyncMetadataRepository = Depends(get_metadata_repository)
+) -> List[DocumentStatusResponse]:
     """
     List all documents with their processing status.
     
@@ -398,8 +543,7 @@ async def list_documents(limit: int = 50, offset: int = 0) -> List[DocumentStatu
         List of DocumentStatusResponse objects
     """
     try:
-        dms_service = get_dms_service()
-        documents = dms_service.list_documents(limit=limit, offset=offset)
+        documents = await metadata_repository.list_documents_paginated(limit, offset)
         
         result = []
         for doc in documents:
@@ -440,7 +584,10 @@ async def list_documents(limit: int = 50, offset: int = 0) -> List[DocumentStatu
 
 
 @router.get("/health", response_model=HealthCheckResponse)
-async def health_check() -> HealthCheckResponse:
+async def health_check(
+    metadata_repository: AsyncMetadataRepository = Depends(get_metadata_repository),
+    http_session: aiohttp.ClientSession = Depends(get_http_session)
+) -> HealthCheckResponse:
     """
     Health check endpoint to verify service status.
     
@@ -448,22 +595,25 @@ async def health_check() -> HealthCheckResponse:
         HealthCheckResponse with service status
     """
     services = {}
+    metrics = {}
     overall_status = "healthy"
     
     # Check database connection
     try:
-        dms_service = get_dms_service()
         # Try a simple operation to verify connection
-        dms_service.list_documents(limit=1)
+        await metadata_repository.list_documents_paginated(1, 0)
         services["database"] = "healthy"
+        pool_stats = get_connection_pool_stats()
+        if pool_stats is not None:
+            metrics["database_pool"] = pool_stats
     except Exception as e:
         services["database"] = f"unhealthy: {str(e)}"
         overall_status = "unhealthy"
     
-    # Check blob storage
+    # Check blob storage (the sync client runs in a worker thread to keep the event loop free)
     try:
         storage_client = get_storage()
-        storage_client.ensure_all_containers_ready()
+        await asyncio.to_thread(storage_client.ensure_all_containers_ready)
         services["blob_storage"] = "healthy"
     except Exception as e:
         services["blob_storage"] = f"unhealthy: {str(e)}"
@@ -473,7 +623,7 @@ async def health_check() -> HealthCheckResponse:
     try:
         from ..celery_app import celery_app
         # Try to inspect active workers
-        celery_app.control.inspect().active()
+        await asyncio.to_thread(celery_app.control.inspect().active)
         services["celery"] = "healthy"
     except Exception as e:
         services["celery"] = f"unhealthy: {str(e)}"
@@ -481,22 +631,23 @@ async def health_check() -> HealthCheckResponse:
     
     # Check Ollama service and model availability
     try:
-        import requests
-        response = requests.get('http://127.0.0.1:11435/api/tags', timeout=5)
-        if response.status_code == 200:
-            models = response.json().get('models', [])
-            llama_models = [m for m in models if 'llama3.1:8b' in m.get('name', '')]
-            
-            if llama_models:
-                services["ollama"] = "healthy"
+        async with http_session.get(
+            'http://127.0.0.1:11435/api/tags', timeout=aiohttp.ClientTimeout(total=5)
+        ) as response:
+            if response.status == 200:
+                models = (await response.json()).get('models', [])
+                llama_models = [m for m in models if 'llama3.1:8b' in m.get('name', '')]
+                
+                if llama_models:
+                    services["ollama"] = "healthy"
+                else:
+                    services["ollama"] = "downloading: Model llama3.1:8b not found, likely downloading"
+                    overall_status = "degraded"
             else:
-                services["ollama"] = "downloading: Model llama3.1:8b not found, likely downloading"
+                services["ollama"] = f"unhealthy: HTTP {response.status}"
                 overall_status = "degraded"
-        else:
-            services["ollama"] = f"unhealthy: HTTP {response.status_code}"
-            overall_status = "degraded"
     except Exception as e:
-        if "connection" in str(e).lower():
+        if isinstance(e, aiohttp.ClientConnectionError) or "connection" in str(e).lower():
             services["ollama"] = "starting: Service not ready"
         else:
             services["ollama"] = f"unhealthy: {str(e)}"
@@ -505,5 +656,6 @@ async def health_check() -> HealthCheckResponse:
     return HealthCheckResponse(
         status=overall_status,
         timestamp=datetime.now(),
-        services=services
+        services=services,
+        metrics=metrics
     )
@@ -2,42 +2,30 @@ import logging
 from typing import Optional
 from src.dms.service import DmsService
 from src.dms.adapters import AzureBlobStorageClient, PostgresMetadataRepository
-from src.config import AppConfig
-import psycopg2
-from azure.storage.blob import BlobServiceClient
+from src.dms.connection_pool import get_connection_pool
+from src.storage.storage import get_storage
 
 logger = logging.getLogger(__name__)
 
-# Load configuration
-app_config = AppConfig()
-
 
 class AsyncDocumentProcessor:
     """Service for triggering async document processing."""
     
-    def __init__(self):
-        """Initialize the async processor with DMS service."""
-        # Initialize clients
-        connection_string = (
-            "DefaultEndpointsProtocol=http;"
-            f"AccountName={app_config.azure.storage.account_name};"
-            f"AccountKey={app_config.azure.storage.account_key};"
-            f"BlobEndpoint=http://localhost:10000/devstoreaccount1;"
-        )
-        
-        blob_service_client = BlobServiceClient.from_connection_string(connection_string)
-        pg_conn = psycopg2.connect(
-            host=app_config.database.host,
-            port=app_config.database.port,
-            database=app_config.database.name,
-            user=app_config.database.user,
-            password=app_config.database.password,
-        )
+    def __init__(self, dms_service: Optional[DmsService] = None):
+        """
+        Initialize the async processor with DMS service.
         
-        storage_client = AzureBlobStorageClient(blob_service_client)
-        metadata_repo = PostgresMetadataRepository(pg_conn)
+        Args:
+            dms_service: Shared DMS service (e.g. the API's app-scoped one). A
+                service on the process-wide blob client and connection pool is
+                created when omitted.
+        """
+        if dms_service is None:
+            storage_client = AzureBlobStorageClient(get_storage().blob_service_client)
+            metadata_repo = PostgresMetadataRepository(pool=get_connection_pool())
+            dms_service = DmsService(storage_client=storage_client, metadata_repository=metadata_repo)
         
-        self.dms_service = DmsService(storage_client=storage_client, metadata_repository=metadata_repo)
+        self.dms_service = dms_service
     
     def trigger_processing(self, document_id: str) -> Optional[str]:
         """
@@ -1,6 +1,10 @@
+import logging
 from celery import Celery
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown, worker_shutdown
 from src.config import AppConfig
 
+logger = logging.getLogger(__name__)
+
 # Load configuration
 app_config = AppConfig()
 
@@ -26,8 +30,85 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
     task_acks_late=True,
     worker_disable_rate_limits=False,
+    # OCR runs on its own solo-pool worker: prefork children are daemonic and
+    # cannot start the page OCR process pool (src/ocr/parallel.py)
+    task_routes={"src.tasks.pipeline_tasks.process_ocr_task": {"queue": app_config.ocr.task_queue}},
 )
 
+
+def _consumes_ocr_queue() -> bool:
+    """Whether this worker was started with the OCR queue among its --queues."""
+    return app_config.ocr.task_queue in celery_app.amqp.queues.consume_from
+
+
+def _warm_up_ocr() -> None:
+    """
+    Load the EasyOCR models that this process's OCR tasks will use.
+
+    With OCR_WORKERS > 1 pages are recognized in the page OCR process pool, so
+    the pool is started (one reader per pool worker) instead of loading a
+    reader in this process that would never be used.
+    """
+    try:
+        from src.ocr.parallel import can_use_process_pool, get_default_workers, get_ocr_executor
+        workers = get_default_workers()
+        if workers > 1 and can_use_process_pool():
+            get_ocr_executor(workers).warm_up()
+            logger.info(f"OCR process pool warmed up: workers={workers}")
+        else:
+            from src.ocr.reader_registry import get_reader_registry
+            registry = get_reader_registry()
+            registry.warm_up()
+            logger.info(f"OCR reader warmed up: {registry.stats()}")
+    except Exception as e:
+        # A failed warm-up only means the first OCR task loads the models itself
+        logger.warning(f"Failed to warm up OCR: {e}")
+
+
+@worker_process_init.connect
+def warm_up_ocr_in_child(**kwargs) -> None:
+    """Warm up OCR in each prefork child of a worker that consumes the OCR queue."""
+    if app_config.ocr.warm_up_on_worker_start and _consumes_ocr_queue():
+        _warm_up_ocr()
+
+
+@worker_init.connect
+def warm_up_ocr_in_main_process(sender=None, **kwargs) -> None:
+    """
+    Warm up OCR in the main process of a solo/threads worker on the OCR queue.
+
+    These pools run tasks in the main process and never send
+    worker_process_init; prefork workers are handled by their children.
+    """
+    pool_module = getattr(getattr(sender, "pool_cls", None), "__module__", "")
+    if pool_module.endswith(".prefork"):
+        return
+    if app_config.ocr.warm_up_on_worker_start and _consumes_ocr_queue():
+        _warm_up_ocr()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def close_worker_connections(**kwargs) -> None:
+    """
+    Close the pooled LLM connections, the task event loop and the OCR process
+    pool when a worker process exits.
+
+    Prefork children get worker_process_shutdown; solo-pool workers (the OCR
+    queue) run tasks in the main process and only get worker_shutdown.
+    """
+    try:
+        from src.tasks.worker_loop import close_worker_loop
+        close_worker_loop()
+    except Exception as e:
+        logger.warning(f"Failed to close worker connections: {e}")
+    try:
+        from src.ocr.parallel import shutdown_ocr_executors
+        shutdown_ocr_executors()
+    except Exception as e:
+        logger.warning(f"Failed to stop OCR process pool: {e}")
+
+
 if __name__ == "__main__":
     celery_app.start()
 
@@ -1,5 +1,5 @@
 """
-Application configuration objects for database, Redis, and Azure storage settings.
+Application configuration objects for database, Redis, Azure storage, OCR, and cache settings.
 """
 
 import os
@@ -14,6 +14,13 @@ class DatabaseConfig:
     name: str = "dms_meta"
     user: str = "dms"
     password: str = "dms"
+    # Connection pool shared by API requests and tasks in one process
+    pool_min_size: int = 1
+    pool_max_size: int = 10
+    # Seconds to wait for a free connection before failing
+    pool_timeout: float = 30.0
+    # Connections idle for longer than this are checked with SELECT 1 before reuse
+    pool_health_check_interval: float = 30.0
 
 
 @dataclass
@@ -49,12 +56,60 @@ class RedisConfig:
     enable_utc: bool = True
 
 
+@dataclass
+class OcrConfig:
+    """OCR worker configuration."""
+    # Load the EasyOCR models when a worker consuming task_queue starts
+    warm_up_on_worker_start: bool = True
+    # Stored OCR artifact format: "json" or "columnar" (compressed, see src/storage/ocr_codec.py)
+    artifact_format: str = "json"
+    # Celery queue of OCR tasks; its worker runs with --pool=solo so page OCR can use a process pool
+    task_queue: str = "ocr"
+
+
+@dataclass
+class LlmConfig:
+    """LLM client configuration."""
+    # Upper bounds on pooled connections held by one worker process
+    max_connections: int = 10
+    max_connections_per_host: int = 4
+    # Seconds an idle keep-alive connection stays in the pool
+    keepalive_timeout: float = 60.0
+    request_timeout: float = 120.0
+    # Stream completions and stop once the extracted_fields object is complete
+    stream_responses: bool = True
+    # Estimated document tokens per extraction prompt; longer documents are split by page (0 disables)
+    chunk_token_budget: int = 2000
+    # Chunk prompts in flight at once per document
+    max_concurrent_chunks: int = 4
+    # Candidate lines kept per field before prompting (src/llm/prefilter.py; 0 sends every line)
+    prefilter_top_k: int = 2
+    # Prompt-level response cache (src/llm/response_cache.py): process LRU plus optional Redis tier
+    response_cache_enabled: bool = True
+    response_cache_redis: bool = True
+    # Redis database of the shared tier, apart from the Celery broker (db 0), and its byte budget
+    response_cache_redis_db: int = 1
+    response_cache_redis_max_bytes: int = 64 * 1024 * 1024
+    response_cache_max_entries: int = 256
+    response_cache_ttl_seconds: float = 7 * 24 * 3600
+
+
+@dataclass
+class CacheConfig:
+    """Content-hash result cache configuration."""
+    # Reuse OCR/LLM results for documents whose bytes were processed before
+    enabled: bool = True
+
+
 @dataclass
 class AppConfig:
     """Top-level application configuration container."""
     database: DatabaseConfig = field(default_factory=DatabaseConfig)
     azure: AzureConfig = field(default_factory=AzureConfig)
     redis: RedisConfig = field(default_factory=RedisConfig)
+    ocr: OcrConfig = field(default_factory=OcrConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    llm: LlmConfig = field(default_factory=LlmConfig)
 
     def __post_init__(self) -> None:
         """Load environment-aware defaults for local vs Docker execution."""
@@ -78,4 +133,61 @@ class AppConfig:
         self.redis.broker_url = f"redis://{self.redis.host}:{self.redis.port}/{self.redis.db}"
         self.redis.result_backend = f"redis://{self.redis.host}:{self.redis.port}/{self.redis.db}"
 
+        pool_min_size_env: str = os.environ.get("DATABASE_POOL_MIN_SIZE", "").strip()
+        if pool_min_size_env:
+            self.database.pool_min_size = int(pool_min_size_env)
+        pool_max_size_env: str = os.environ.get("DATABASE_POOL_MAX_SIZE", "").strip()
+        if pool_max_size_env:
+            self.database.pool_max_size = int(pool_max_size_env)
+
+        ocr_warm_up_env: str = os.environ.get("OCR_WARM_UP", "").strip().lower()
+        if ocr_warm_up_env:
+            self.ocr.warm_up_on_worker_start = ocr_warm_up_env == "true"
+        ocr_artifact_format_env: str = os.environ.get("OCR_ARTIFACT_FORMAT", "").strip().lower()
+        if ocr_artifact_format_env:
+            self.ocr.artifact_format = ocr_artifact_format_env
+        ocr_task_queue_env: str = os.environ.get("OCR_TASK_QUEUE", "").strip()
+        if ocr_task_queue_env:
+            self.ocr.task_queue = ocr_task_queue_env
+
+        llm_max_connections_env: str = os.environ.get("LLM_MAX_CONNECTIONS", "").strip()
+        if llm_max_connections_env:
+            self.llm.max_connections = int(llm_max_connections_env)
+        llm_max_connections_per_host_env: str = os.environ.get("LLM_MAX_CONNECTIONS_PER_HOST", "").strip()
+        if llm_max_connections_per_host_env:
+            self.llm.max_connections_per_host = int(llm_max_connections_per_host_env)
+        llm_stream_env: str = os.environ.get("LLM_STREAM", "").strip().lower()
+        if llm_stream_env:
+            self.llm.stream_responses = llm_stream_env == "true"
+        llm_chunk_token_budget_env: str = os.environ.get("LLM_CHUNK_TOKEN_BUDGET", "").strip()
+        if llm_chunk_token_budget_env:
+            self.llm.chunk_token_budget = int(llm_chunk_token_budget_env)
+        llm_max_concurrent_chunks_env: str = os.environ.get("LLM_MAX_CONCURRENT_CHUNKS", "").strip()
+        if llm_max_concurrent_chunks_env:
+            self.llm.max_concurrent_chunks = int(llm_max_concurrent_chunks_env)
+
+        llm_prefilter_top_k_env: str = os.environ.get("LLM_PREFILTER_TOP_K", "").strip()
+        if llm_prefilter_top_k_env:
+            self.llm.prefilter_top_k = int(llm_prefilter_top_k_env)
+
+        llm_response_cache_env: str = os.environ.get("LLM_RESPONSE_CACHE_ENABLED", "").strip().lower()
+        if llm_response_cache_env:
+            self.llm.response_cache_enabled = llm_response_cache_env == "true"
+        llm_response_cache_redis_env: str = os.environ.get("LLM_RESPONSE_CACHE_REDIS", "").strip().lower()
+        if llm_response_cache_redis_env:
+            self.llm.response_cache_redis = llm_response_cache_redis_env == "true"
+        llm_response_cache_redis_db_env: str = os.environ.get("LLM_RESPONSE_CACHE_REDIS_DB", "").strip()
+        if llm_response_cache_redis_db_env:
+            self.llm.response_cache_redis_db = int(llm_response_cache_redis_db_env)
+        llm_response_cache_redis_max_bytes_env: str = os.environ.get("LLM_RESPONSE_CACHE_REDIS_MAX_BYTES", "").strip()
+        if llm_response_cache_redis_max_bytes_env:
+            self.llm.response_cache_redis_max_bytes = int(llm_response_cache_redis_max_bytes_env)
+        llm_response_cache_ttl_env: str = os.environ.get("LLM_RESPONSE_CACHE_TTL_SECONDS", "").strip()
+        if llm_response_cache_ttl_env:
+            self.llm.response_cache_ttl_seconds = float(llm_response_cache_ttl_env)
+
+        result_cache_env: str = os.environ.get("RESULT_CACHE_ENABLED", "").strip().lower()
+        if result_cache_env:
+            self.cache.enabled = result_cache_env == "true"
+
 
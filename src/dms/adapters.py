@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional, List, Dict, Any
+import base64
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 
-from azure.storage.blob import BlobServiceClient
+from azure.storage.blob import BlobBlock, BlobServiceClient
 
+from .connection_pool import PostgresConnectionPool
 from .interfaces import StorageClient, MetadataRepository
 
 
@@ -18,6 +21,17 @@ class AzureBlobStorageClient(StorageClient):
         blob_client = container_client.get_blob_client(blob_name)
         blob_client.upload_blob(data, overwrite=True)
 
+    def upload_stream(self, container: str, blob_name: str, chunks: Iterable[bytes]) -> None:
+        container_client = self._client.get_container_client(container)
+        blob_client = container_client.get_blob_client(blob_name)
+        # Stage each chunk as an uncommitted block; the blob appears only once the block list is committed
+        block_list = []
+        for index, chunk in enumerate(chunks):
+            block_id = base64.b64encode(f"{index:08d}".encode("ascii")).decode("ascii")
+            blob_client.stage_block(block_id=block_id, data=chunk, length=len(chunk))
+            block_list.append(BlobBlock(block_id=block_id))
+        blob_client.commit_block_list(block_list)
+
     def download_bytes(self, container: str, blob_name: str) -> Optional[bytes]:
         container_client = self._client.get_container_client(container)
         blob_client = container_client.get_blob_client(blob_name)
@@ -27,18 +41,50 @@ class AzureBlobStorageClient(StorageClient):
         except Exception:
             return None
 
+    def blob_exists(self, container: str, blob_name: str) -> bool:
+        container_client = self._client.get_container_client(container)
+        blob_client = container_client.get_blob_client(blob_name)
+        try:
+            return blob_client.exists()
+        except Exception:
+            return False
+
 
 class PostgresMetadataRepository(MetadataRepository):
     """PostgreSQL implementation of MetadataRepository."""
 
-    def __init__(self, connection) -> None:
+    def __init__(self, connection=None, pool: Optional[PostgresConnectionPool] = None) -> None:
+        """
+        Args:
+            connection: A dedicated psycopg2 connection (notebooks/tests)
+            pool: Connection pool to borrow a connection from per operation
+        """
+        if connection is None and pool is None:
+            raise ValueError("Either a connection or a connection pool is required")
         self._conn = connection
+        self._pool = pool
+        if self._conn is not None:
+            self._enable_autocommit(self._conn)
+
+    @staticmethod
+    def _enable_autocommit(conn) -> None:
         try:
             # Enable autocommit to avoid lingering aborted transactions during notebooks/tests
-            self._conn.autocommit = True
+            if not conn.autocommit:
+                conn.autocommit = True
         except Exception:
             pass
 
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        """Yield the dedicated connection, or borrow one from the pool for this operation."""
+        if self._conn is not None:
+            yield self._conn
+            return
+        with self._pool.connection() as conn:
+            self._enable_autocommit(conn)
+            yield conn
+
     def insert_document(
         self,
         document_id: str,
@@ -54,7 +100,7 @@ class PostgresMetadataRepository(MetadataRepository):
         # Map our fields accordingly; store blob path and filename, derive size and mime_type is not known here
         file_size: Optional[int] = None
         mime_type: Optional[str] = None
-        with self._conn.cursor() as cursor:
+        with self._connection() as conn, conn.cursor() as cursor:
             cursor.execute(
                 """
                 INSERT INTO documents (id, filename, file_path, file_size, mime_type)
@@ -68,10 +114,10 @@ class PostgresMetadataRepository(MetadataRepository):
                     mime_type,
                 ),
             )
-            self._conn.commit()
+            conn.commit()
 
     def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
-        with self._conn.cursor() as cursor:
+        with self._connection() as conn, conn.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT id, file_path, filename, created_at, mime_type, file_size, 
@@ -100,7 +146,7 @@ class PostgresMetadataRepository(MetadataRepository):
 
     def list_documents_by_type(self, document_type: str) -> List[Dict[str, Any]]:
         # Not supported by current schema; return latest documents instead
-        with self._conn.cursor() as cursor:
+        with self._connection() as conn, conn.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT id, file_path, filename, created_at, mime_type, file_size,
@@ -129,7 +175,7 @@ class PostgresMetadataRepository(MetadataRepository):
 
     def update_document_status(self, document_id: str, status: str) -> bool:
         # Update status if column exists (schema adds it)
-        with self._conn.cursor() as cursor:
+        with self._connection() as conn, conn.cursor() as cursor:
             try:
                 cursor.execute(
                     """
@@ -141,14 +187,14 @@ class PostgresMetadataRepository(MetadataRepository):
                     (status, document_id),
                 )
                 updated = cursor.rowcount > 0
-                self._conn.commit()
+                conn.commit()
                 return updated
             except Exception:
-                self._conn.rollback()
+                conn.rollback()
                 return False
 
     def update_processing_status(self, document_id: str, status: str) -> bool:
-        with self._conn.cursor() as cursor:
+        with self._connection() as conn, conn.cursor() as cursor:
             try:
                 cursor.execute(
                     """
@@ -160,14 +206,14 @@ class PostgresMetadataRepository(MetadataRepository):
                     (status, document_id),
                 )
                 updated = cursor.rowcount > 0
-                self._conn.commit()
+                conn.commit()
                 return updated
             except Exception:
-                self._conn.rollback()
+                conn.rollback()
                 return False
 
     def insert_extraction_job(self, job_id: str, document_id: str, status: str) -> None:
-        with self._conn.cursor() as cursor:
+        with self._connection() as conn, conn.cursor() as cursor:
             cursor.execute(
                 """
                 INSERT INTO extraction_jobs (id, document_id, status)
@@ -175,10 +221,10 @@ class PostgresMetadataRepository(MetadataRepository):
                 """,
                 (job_id, document_id, status),
             )
-            self._conn.commit()
+            conn.commit()
 
     def update_extraction_job(self, job_id: str, status: str, error_message: Optional[str]) -> bool:
-        with self._conn.cursor() as cursor:
+        with self._connection() as conn, conn.cursor() as cursor:
             if error_message is not None:
                 cursor.execute(
                     """
@@ -201,11 +247,11 @@ class PostgresMetadataRepository(MetadataRepository):
                     (status, status, job_id),
                 )
             updated = cursor.rowcount > 0
-            self._conn.commit()
+            conn.commit()
             return updated
 
     def list_extraction_jobs(self, document_id: str) -> List[Dict[str, Any]]:
-        with self._conn.cursor() as cursor:
+        with self._connection() as conn, conn.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT id, document_id, created_at, completed_at, status, error_message
@@ -230,7 +276,7 @@ class PostgresMetadataRepository(MetadataRepository):
 
     def list_documents_paginated(self, limit: int, offset: int) -> List[Dict[str, Any]]:
         """List documents with pagination."""
-        with self._conn.cursor() as cursor:
+        with self._connection() as conn, conn.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT id, file_path, filename, created_at, mime_type, file_size,
@@ -0,0 +1,226 @@
+"""
+Asyncio implementations of AsyncMetadataRepository.
+
+The API serves status polls from the event loop; these repositories keep
+database I/O from blocking it. ``AsyncPostgresMetadataRepository`` talks to
+PostgreSQL through an asyncpg pool and returns the same dictionaries as
+``PostgresMetadataRepository``; ``ThreadedMetadataRepository`` runs a
+synchronous repository in worker threads where no asyncpg pool is available.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import asyncpg
+
+from ..config import DatabaseConfig
+from .interfaces import AsyncMetadataRepository, MetadataRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _id_str(value: Any) -> Optional[str]:
+    # asyncpg decodes UUID columns to uuid.UUID; psycopg2 returns str
+    return None if value is None else str(value)
+
+
+def _rows_affected(command_status: str) -> int:
+    """Row count from an asyncpg command status such as 'UPDATE 1'."""
+    try:
+        return int(command_status.rsplit(" ", 1)[-1])
+    except (AttributeError, ValueError):
+        return 0
+
+
+class AsyncPostgresMetadataRepository(AsyncMetadataRepository):
+    """PostgreSQL implementation of AsyncMetadataRepository on an asyncpg pool."""
+
+    def __init__(self, pool: asyncpg.Pool, timeout: Optional[float] = None) -> None:
+        """
+        Args:
+            pool: asyncpg connection pool
+            timeout: Seconds to wait for a free connection (no limit if None)
+        """
+        self._pool = pool
+        self._timeout = timeout
+
+    @classmethod
+    async def create(cls, database: DatabaseConfig) -> "AsyncPostgresMetadataRepository":
+        """
+        Open an asyncpg pool sized by the database pool settings.
+
+        Args:
+            database: Database configuration
+
+        Returns:
+            Repository owning the new pool
+        """
+        pool = await asyncpg.create_pool(
+            host=database.host,
+            port=database.port,
+            database=database.name,
+            user=database.user,
+            password=database.password,
+            min_size=database.pool_min_size,
+            max_size=database.pool_max_size,
+        )
+        logger.info(
+            f"asyncpg pool created (min={database.pool_min_size}, max={database.pool_max_size})"
+        )
+        return cls(pool, timeout=database.pool_timeout)
+
+    async def close(self) -> None:
+        await self._pool.close()
+
+    async def _fetch(self, query: str, *args) -> List[Any]:
+        async with self._pool.acquire(timeout=self._timeout) as conn:
+            return await conn.fetch(query, *args)
+
+    async def _fetchrow(self, query: str, *args) -> Optional[Any]:
+        async with self._pool.acquire(timeout=self._timeout) as conn:
+            return await conn.fetchrow(query, *args)
+
+    async def _execute(self, query: str, *args) -> str:
+        async with self._pool.acquire(timeout=self._timeout) as conn:
+            return await conn.execute(query, *args)
+
+    async def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
+        row = await self._fetchrow(
+            """
+            SELECT id, file_path, filename, created_at, mime_type, file_size,
+                   text_extraction_status, processing_status
+            FROM documents WHERE id = $1
+            """,
+            document_id,
+        )
+        if not row:
+            return None
+        return {
+            "id": _id_str(row["id"]),
+            "blob_path": row["file_path"],
+            "document_type": None,
+            "uploaded_at": row["created_at"],
+            "hash_sha256": None,
+            "source_filename": row["filename"],
+            "linked_entity": None,
+            "linked_entity_id": None,
+            "textextraction_status": row["text_extraction_status"],
+            "processing_status": row["processing_status"],
+            "mime_type": row["mime_type"],
+            "file_size": row["file_size"],
+        }
+
+    async def list_documents_paginated(self, limit: int, offset: int) -> List[Dict[str, Any]]:
+        rows = await self._fetch(
+            """
+            SELECT id, file_path, filename, created_at, mime_type, file_size,
+                   text_extraction_status, processing_status
+            FROM documents
+            ORDER BY created_at DESC
+            LIMIT $1 OFFSET $2
+            """,
+            limit,
+            offset,
+        )
+        return [
+            {
+                "document_id": _id_str(row["id"]),
+                "blob_path": row["file_path"],
+                "filename": row["filename"],
+                "upload_timestamp": row["created_at"],
+                "mime_type": row["mime_type"],
+                "file_size": row["file_size"],
+                "textextraction_status": row["text_extraction_status"],
+                "processing_status": row["processing_status"],
+            }
+            for row in rows
+        ]
+
+    async def insert_extraction_job(self, job_id: str, document_id: str, status: str) -> None:
+        await self._execute(
+            """
+            INSERT INTO extraction_jobs (id, document_id, status)
+            VALUES ($1, $2, $3)
+            """,
+            job_id,
+            document_id,
+            status,
+        )
+
+    async def update_extraction_job(self, job_id: str, status: str, error_message: Optional[str]) -> bool:
+        if error_message is not None:
+            command_status = await self._execute(
+                """
+                UPDATE extraction_jobs
+                SET status = $1,
+                    error_message = $2,
+                    completed_at = CASE WHEN $1 IN ('done', 'failed', 'finished') THEN NOW() ELSE completed_at END
+                WHERE id = $3
+                """,
+                status,
+                error_message,
+                job_id,
+            )
+        else:
+            command_status = await self._execute(
+                """
+                UPDATE extraction_jobs
+                SET status = $1,
+                    completed_at = CASE WHEN $1 IN ('done', 'failed', 'finished') THEN NOW() ELSE completed_at END
+                WHERE id = $2
+                """,
+                status,
+                job_id,
+            )
+        return _rows_affected(command_status) > 0
+
+    async def list_extraction_jobs(self, document_id: str) -> List[Dict[str, Any]]:
+        rows = await self._fetch(
+            """
+            SELECT id, document_id, created_at, completed_at, status, error_message
+            FROM extraction_jobs
+            WHERE document_id = $1
+            ORDER BY created_at DESC
+            """,
+            document_id,
+        )
+        return [
+            {
+                "id": _id_str(row["id"]),
+                "document_id": _id_str(row["document_id"]),
+                "created_at": row["created_at"],
+                "completed_at": row["completed_at"],
+                "status": row["status"],
+                "error_message": row["error_message"],
+            }
+            for row in rows
+        ]
+
+
+class ThreadedMetadataRepository(AsyncMetadataRepository):
+    """AsyncMetadataRepository that runs a synchronous repository in worker threads."""
+
+    def __init__(self, repository: MetadataRepository) -> None:
+        self._repository = repository
+
+    async def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._repository.get_document, document_id)
+
+    async def list_documents_paginated(self, limit: int, offset: int) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._repository.list_documents_paginated, limit, offset)
+
+    async def insert_extraction_job(self, job_id: str, document_id: str, status: str) -> None:
+        await asyncio.to_thread(self._repository.insert_extraction_job, job_id, document_id, status)
+
+    async def update_extraction_job(self, job_id: str, status: str, error_message: Optional[str]) -> bool:
+        return await asyncio.to_thread(self._repository.update_extraction_job, job_id, status, error_message)
+
+    async def list_extraction_jobs(self, document_id: str) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._repository.list_extraction_jobs, document_id)
+
+    async def close(self) -> None:
+        # The wrapped repository's connections belong to the shared pool
+        pass
@@ -0,0 +1,229 @@
+"""
+Shared PostgreSQL connection pool.
+
+API requests, Celery tasks and the async processor borrow connections from
+one pool per process instead of opening (and leaking) a new connection for
+every request or task.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional
+
+import psycopg2
+from psycopg2 import pool as psycopg2_pool
+
+from ..config import AppConfig, DatabaseConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolMetrics:
+    """Counters for one connection pool."""
+    checkouts: int = 0
+    checkout_wait_seconds: float = 0.0
+    timeouts: int = 0
+    health_check_failures: int = 0
+    discarded_connections: int = 0
+
+
+class PostgresConnectionPool:
+    """
+    Thread-safe pool of PostgreSQL connections with health checking.
+
+    Wraps ``psycopg2.pool.ThreadedConnectionPool``. Callers that find the pool
+    exhausted wait up to ``timeout`` seconds instead of failing immediately.
+    Connections idle for longer than ``health_check_interval`` are probed with
+    ``SELECT 1`` before they are handed out; broken ones are discarded and
+    replaced.
+    """
+
+    def __init__(
+        self,
+        database: DatabaseConfig,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        health_check_interval: Optional[float] = None,
+    ) -> None:
+        self.min_size = database.pool_min_size if min_size is None else min_size
+        self.max_size = database.pool_max_size if max_size is None else max_size
+        self.timeout = database.pool_timeout if timeout is None else timeout
+        self.health_check_interval = (
+            database.pool_health_check_interval if health_check_interval is None else health_check_interval
+        )
+        if self.max_size < 1 or self.min_size > self.max_size:
+            raise ValueError(f"Invalid pool size: min={self.min_size}, max={self.max_size}")
+
+        self._pool = psycopg2_pool.ThreadedConnectionPool(
+            self.min_size,
+            self.max_size,
+            host=database.host,
+            port=database.port,
+            database=database.name,
+            user=database.user,
+            password=database.password,
+        )
+        # Bounds concurrent borrowers to max_size so callers wait rather than get PoolError
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._last_used: Dict[int, float] = {}
+        self._in_use = 0
+        self._metrics = PoolMetrics()
+        self._lock = threading.Lock()
+        self.pid = os.getpid()
+        logger.info(f"PostgreSQL connection pool created (min={self.min_size}, max={self.max_size})")
+
+    def _is_healthy(self, conn) -> bool:
+        if conn.closed:
+            return False
+        last_used = self._last_used.get(id(conn))
+        # Freshly opened connections and recently used ones skip the round trip
+        if last_used is None or time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            if not conn.autocommit:
+                conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _checkout(self):
+        start_time = time.monotonic()
+        if not self._slots.acquire(timeout=self.timeout):
+            with self._lock:
+                self._metrics.timeouts += 1
+            raise psycopg2_pool.PoolError(
+                f"Timed out after {self.timeout}s waiting for a database connection (max={self.max_size})"
+            )
+        try:
+            conn = self._pool.getconn()
+            while not self._is_healthy(conn):
+                logger.warning("Discarding unhealthy pooled database connection")
+                with self._lock:
+                    self._metrics.health_check_failures += 1
+                    self._metrics.discarded_connections += 1
+                self._last_used.pop(id(conn), None)
+                self._pool.putconn(conn, close=True)
+                conn = self._pool.getconn()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._in_use += 1
+            self._metrics.checkouts += 1
+            self._metrics.checkout_wait_seconds += time.monotonic() - start_time
+        return conn
+
+    def _checkin(self, conn, discard: bool) -> None:
+        try:
+            if discard or conn.closed:
+                with self._lock:
+                    self._metrics.discarded_connections += 1
+                self._last_used.pop(id(conn), None)
+                self._pool.putconn(conn, close=True)
+            else:
+                self._last_used[id(conn)] = time.monotonic()
+                self._pool.putconn(conn)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        Borrow a connection for the duration of the block.
+
+        An open transaction is rolled back if the block raises; connections
+        broken by the error are closed instead of being returned to the pool.
+        """
+        conn = self._checkout()
+        discard = False
+        try:
+            yield conn
+        except Exception:
+            try:
+                if not conn.closed:
+                    conn.rollback()
+            except psycopg2.Error:
+                discard = True
+            raise
+        finally:
+            self._checkin(conn, discard)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report pool size, usage and counters.
+
+        Returns:
+            Dictionary with size limits, in-use/idle counts and checkout metrics
+        """
+        with self._lock:
+            checkouts = self._metrics.checkouts
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "in_use": self._in_use,
+                # ThreadedConnectionPool keeps its idle connections in _pool
+                "idle": len(self._pool._pool),
+                "checkouts": checkouts,
+                "avg_checkout_wait_ms": (
+                    self._metrics.checkout_wait_seconds / checkouts * 1000 if checkouts else 0.0
+                ),
+                "timeouts": self._metrics.timeouts,
+                "health_check_failures": self._metrics.health_check_failures,
+                "discarded_connections": self._metrics.discarded_connections,
+            }
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self._pool.closeall()
+        self._last_used.clear()
+
+
+_connection_pool: Optional[PostgresConnectionPool] = None
+_connection_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> PostgresConnectionPool:
+    """
+    Get the process-wide connection pool, creating it on first use.
+
+    Connections must not be shared across fork(), so a Celery prefork child
+    that inherits its parent's pool builds its own.
+    """
+    global _connection_pool
+    pool = _connection_pool
+    if pool is not None and pool.pid == os.getpid():
+        return pool
+    with _connection_pool_lock:
+        if _connection_pool is None or _connection_pool.pid != os.getpid():
+            _connection_pool = PostgresConnectionPool(AppConfig().database)
+        return _connection_pool
+
+
+def get_connection_pool_stats() -> Optional[Dict[str, Any]]:
+    """Stats of this process's pool, or None if no pool has been created yet."""
+    pool = _connection_pool
+    if pool is None or pool.pid != os.getpid():
+        return None
+    return pool.stats()
+
+
+def close_connection_pool() -> None:
+    """Close the process-wide pool (on shutdown)."""
+    global _connection_pool
+    with _connection_pool_lock:
+        if _connection_pool is not None and _connection_pool.pid == os.getpid():
+            _connection_pool.close()
+        _connection_pool = None
@@ -4,7 +4,7 @@ Interfaces for DMS components: storage client and metadata repository.
 
 from __future__ import annotations
 
-from typing import Protocol, Optional, List, Dict, Any
+from typing import Protocol, Optional, List, Dict, Any, Iterable
 
 
 class StorageClient(Protocol):
@@ -13,9 +13,15 @@ class StorageClient(Protocol):
     def upload_bytes(self, container: str, blob_name: str, data: bytes) -> None:
         """Upload a blob to the specified container and blob name."""
 
+    def upload_stream(self, container: str, blob_name: str, chunks: Iterable[bytes]) -> None:
+        """Upload a blob from a sequence of chunks without holding the whole content in memory."""
+
     def download_bytes(self, container: str, blob_name: str) -> Optional[bytes]:
         """Download a blob as bytes if it exists, otherwise None."""
 
+    def blob_exists(self, container: str, blob_name: str) -> bool:
+        """Check whether a blob exists without downloading it."""
+
 
 class MetadataRepository(Protocol):
     """Abstraction over metadata persistence for documents and extraction jobs."""
@@ -58,3 +64,23 @@ class MetadataRepository(Protocol):
         """List documents with pagination."""
 
 
+class AsyncMetadataRepository(Protocol):
+    """Asyncio counterpart of MetadataRepository for the read paths and job updates used by the API."""
+
+    async def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a document record by ID."""
+
+    async def list_documents_paginated(self, limit: int, offset: int) -> List[Dict[str, Any]]:
+        """List documents with pagination."""
+
+    async def insert_extraction_job(self, job_id: str, document_id: str, status: str) -> None:
+        """Insert a new extraction job."""
+
+    async def update_extraction_job(self, job_id: str, status: str, error_message: Optional[str]) -> bool:
+        """Update an existing extraction job."""
+
+    async def list_extraction_jobs(self, document_id: str) -> List[Dict[str, Any]]:
+        """List extraction jobs for a document."""
+
+    async def close(self) -> None:
+        """Release the connections held by the repository."""
@@ -4,13 +4,62 @@ import logging
 import uuid
 import hashlib
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, BinaryIO, Iterator, Tuple, Union
 import mimetypes
 
 from .interfaces import StorageClient, MetadataRepository
 
 logger = logging.getLogger(__name__)
 
+# Chunk size for hashing and block uploads of streamed documents
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Prefix of content-addressed upload blobs in the "documents" container
+CONTENT_ADDRESSED_PREFIX = "raw/sha256/"
+
+
+def content_addressed_blob_name(file_hash: str, file_extension: str) -> str:
+    """
+    Canonical blob name for uploaded document bytes, keyed by their SHA-256.
+
+    Args:
+        file_hash: Hex SHA-256 of the document bytes
+        file_extension: File extension including the dot
+
+    Returns:
+        Blob name within the "documents" container
+    """
+    return f"{CONTENT_ADDRESSED_PREFIX}{file_hash}{file_extension}"
+
+
+def iter_file_chunks(file_object: BinaryIO, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a binary file object in chunks until EOF."""
+    while True:
+        chunk = file_object.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def hash_file_object(file_object: BinaryIO) -> Tuple[str, int]:
+    """
+    Hash a seekable binary file object chunk by chunk and rewind it.
+
+    Args:
+        file_object: Seekable binary file object
+
+    Returns:
+        Tuple of (hex SHA-256, size in bytes)
+    """
+    sha256_hash = hashlib.sha256()
+    size = 0
+    file_object.seek(0)
+    for chunk in iter_file_chunks(file_object):
+        sha256_hash.update(chunk)
+        size += len(chunk)
+    file_object.seek(0)
+    return sha256_hash.hexdigest(), size
+
 
 class DmsService:
     """Service for DMS operations."""
@@ -168,14 +217,17 @@ class DmsService:
         """Set processing_status to 'done'."""
         return self.metadata_repository.update_processing_status(document_id, "done")
 
-    def store_document(self, document_id: str, filename: str, file_data: bytes) -> str:
+    def store_document(self, document_id: str, filename: str, file_data: Union[bytes, BinaryIO]) -> str:
         """
         Store a document directly from file data (for API uploads).
         
+        File objects are hashed and uploaded chunk by chunk, so the document is
+        never held in memory as a whole.
+        
         Args:
             document_id: Unique document identifier
             filename: Original filename
-            file_data: File content as bytes
+            file_data: File content as bytes, or a seekable binary file object
             
         Returns:
             Document ID
@@ -185,15 +237,21 @@ class DmsService:
         if not file_extension:
             file_extension = ".pdf"  # Default to PDF
         
-        # Create blob path
-        blob_name = f"raw/credit_request/{document_id}{file_extension}"
-        
-        # Upload to blob storage
-        self.storage_client.upload_bytes("documents", blob_name, file_data)
-        logger.info(f"File uploaded to blob storage: {blob_name}")
+        # Content-addressed blob path: identical uploads share one stored blob
+        if isinstance(file_data, (bytes, bytearray)):
+            file_hash = hashlib.sha256(file_data).hexdigest()
+        else:
+            file_hash, _ = hash_file_object(file_data)
+        blob_name = content_addressed_blob_name(file_hash, file_extension)
         
-        # Calculate hash
-        file_hash = hashlib.sha256(file_data).hexdigest()
+        if self.storage_client.blob_exists("documents", blob_name):
+            logger.info(f"Reusing stored blob for identical content: {blob_name}")
+        elif isinstance(file_data, (bytes, bytearray)):
+            self.storage_client.upload_bytes("documents", blob_name, file_data)
+            logger.info(f"File uploaded to blob storage: {blob_name}")
+        else:
+            self.storage_client.upload_stream("documents", blob_name, iter_file_chunks(file_data))
+            logger.info(f"File streamed to blob storage: {blob_name}")
         
         # Determine MIME type
         mime_type, _ = mimetypes.guess_type(filename)
@@ -0,0 +1,207 @@
+"""
+NDJSON export of the OCR elements of a document.
+
+The stored JSON OCR artifact is read in ranges and scanned incrementally:
+only the element currently being parsed is held in memory, so exporting a
+document costs the same API memory regardless of its size. Columnar artifacts
+are compressed and decoded one page at a time. Each output line is one
+JSON object tagged with its ``type`` and ``document_id``, ready to be
+mirrored into a search index.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..storage.ocr_codec import ColumnarOcrArtifact
+from .results import to_ocr_element
+
+OCR_ELEMENTS_KEY = "original_lines"
+NORMALIZED_LINES_KEY = "normalized_lines"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_STRUCTURAL = re.compile(r'["{}\[\]:,]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_ITEM_SEPARATOR = re.compile(r'[\s,]*')
+
+
+class JsonArrayStreamParser:
+    """
+    Incremental parser yielding the items of selected JSON arrays.
+
+    The document is fed in arbitrary byte chunks. Any array whose key is one
+    of ``keys`` (at any nesting level) has its items decoded with the C JSON
+    decoder and returned as soon as they are complete; all other content is
+    only scanned for structure, without being decoded.
+    """
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        self.keys = set(keys)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start: Optional[int] = None
+        self._last_string: Optional[str] = None
+        self._key: Optional[str] = None
+        self._array_key: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, Any]]:
+        """
+        Consume the next chunk of the document.
+
+        Args:
+            chunk: Next bytes of the JSON document
+
+        Returns:
+            List of (array key, parsed item) for the items completed by this chunk
+        """
+        buffer = self._buffer + self._text_decoder.decode(chunk)
+        position = self._position
+        items: List[Tuple[str, Any]] = []
+
+        while True:
+            if self._array_key is not None:
+                position = _ITEM_SEPARATOR.match(buffer, position).end()
+                if position >= len(buffer):
+                    break
+                if buffer[position] == "]":
+                    self._array_key = None
+                    self._depth -= 1
+                    position += 1
+                    continue
+                try:
+                    item, end = self._json_decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    # The item continues in the next chunk
+                    break
+                if end == len(buffer) and not isinstance(item, (dict, list)):
+                    # A number or literal at the end of the buffer may still be incomplete
+                    break
+                items.append((self._array_key, item))
+                position = end
+                continue
+
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, position)
+                if match is None:
+                    position = len(buffer)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        # The escaped character is in the next chunk
+                        position = match.start()
+                        break
+                    position = match.end() + 1
+                    continue
+                self._in_string = False
+                self._last_string = buffer[self._string_start:match.start()]
+                self._string_start = None
+                position = match.end()
+                continue
+
+            match = _STRUCTURAL.search(buffer, position)
+            if match is None:
+                position = len(buffer)
+                break
+            char = match.group()
+            position = match.end()
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = position
+            elif char == ":":
+                self._key = self._last_string
+            elif char == ",":
+                self._key = None
+            elif char in "{[":
+                self._depth += 1
+                if char == "[" and self._key in self.keys:
+                    self._array_key = self._key
+                self._key = None
+            else:
+                self._depth -= 1
+
+        # Keep only what is still needed: the item or key being read
+        keep_from = position
+        if self._string_start is not None:
+            keep_from = min(keep_from, self._string_start)
+            self._string_start -= keep_from
+        self._buffer = buffer[keep_from:]
+        self._position = position - keep_from
+        return items
+
+    def close(self) -> None:
+        """
+        Check that the document ended cleanly.
+
+        Raises:
+            ValueError: If the document was truncated inside a value
+        """
+        if self._array_key is not None or self._in_string or self._depth != 0 or self._buffer.strip():
+            raise ValueError("JSON document ended unexpectedly")
+
+
+def _export_line(key: str, item: Dict[str, Any], document_id: str) -> str:
+    if key == OCR_ELEMENTS_KEY:
+        record = {"type": "ocr_element", "document_id": document_id, **to_ocr_element(item)}
+    else:
+        record = {"type": "normalized_line", "document_id": document_id, **item}
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+
+
+async def iter_ocr_export_lines(
+    chunks: AsyncIterator[bytes],
+    document_id: str,
+    include_normalized: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Turn a stored OCR artifact into NDJSON lines.
+
+    Args:
+        chunks: Byte chunks of the stored OCR artifact
+        document_id: Document the artifact belongs to
+        include_normalized: Also export the normalized label/value lines
+
+    Yields:
+        One NDJSON line per OCR element (and normalized line), in artifact order
+    """
+    keys = [OCR_ELEMENTS_KEY, NORMALIZED_LINES_KEY] if include_normalized else [OCR_ELEMENTS_KEY]
+    parser = JsonArrayStreamParser(keys)
+    async for chunk in chunks:
+        lines = [_export_line(key, item, document_id) for key, item in parser.feed(chunk)]
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+    parser.close()
+
+
+def iter_columnar_export_lines(
+    blob: bytes,
+    document_id: str,
+    include_normalized: bool = False,
+) -> Iterator[bytes]:
+    """
+    Turn a columnar OCR artifact into NDJSON lines, decoding one page at a time.
+
+    Args:
+        blob: Columnar OCR artifact
+        document_id: Document the artifact belongs to
+        include_normalized: Also export the normalized label/value lines
+
+    Yields:
+        NDJSON lines: normalized lines first (if requested), then the OCR
+        elements page by page
+    """
+    artifact = ColumnarOcrArtifact(blob)
+    if include_normalized:
+        normalized_lines = artifact.to_document(pages=[]).get("data", {}).get(NORMALIZED_LINES_KEY, [])
+        lines = [_export_line(NORMALIZED_LINES_KEY, line, document_id) for line in normalized_lines]
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+    for page_num in artifact.page_numbers:
+        lines = [_export_line(OCR_ELEMENTS_KEY, line, document_id) for line in artifact.read_page(page_num)]
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
@@ -0,0 +1,193 @@
+"""
+Page-sharded OCR elements for paginated and filtered result queries.
+
+The OCR stage writes one shard per page, holding that page's OCR elements in
+the shape served by ``/results``, plus a small index listing every page with
+its element range and confidence bounds. The API answers ``page``,
+``cursor``/``limit`` and ``min_confidence`` queries from the index and reads
+only the shards that can contain matching elements, instead of loading the
+full OCR dump and slicing it.
+
+Cursors are element positions in reading order (page by page, then the order
+the OCR stage produced), so they stay valid when combined with a page or
+confidence filter.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..storage.storage import BlobStorage, Stage, get_storage
+from .results import build_ocr_elements, encode_results_payload
+
+OCR_INDEX_EXT = ".index.json"
+OCR_INDEX_VERSION = 1
+
+
+def page_shard_ext(page_num: int) -> str:
+    """Blob extension of the OCR shard holding one page."""
+    return f".page-{page_num:04d}.json"
+
+
+def build_ocr_page_shards(ocr_content: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[int, List[Dict[str, Any]]]]:
+    """
+    Split OCR results into per-page shards and build their index.
+
+    Args:
+        ocr_content: OCR processing results (original_lines with page_num)
+
+    Returns:
+        Tuple of (index, shards by page number); each shard element carries its
+        global position as ``element_index``
+    """
+    shards: Dict[int, List[Dict[str, Any]]] = {}
+    for element in build_ocr_elements(ocr_content):
+        shards.setdefault(element["page_num"], []).append(element)
+
+    pages = []
+    position = 0
+    for page_num in sorted(shards):
+        elements = shards[page_num]
+        for element in elements:
+            element["element_index"] = position
+            position += 1
+        confidences = [element["confidence"] for element in elements]
+        pages.append({
+            "page_num": page_num,
+            "start": elements[0]["element_index"],
+            "count": len(elements),
+            "min_confidence": min(confidences),
+            "max_confidence": max(confidences),
+        })
+
+    index = {"version": OCR_INDEX_VERSION, "total_elements": position, "pages": pages}
+    return index, shards
+
+
+def save_ocr_page_index(document_id: str, ocr_content: Dict[str, Any], storage: Optional[BlobStorage] = None) -> None:
+    """
+    Write the per-page OCR shards and their index to the OCR stage.
+
+    The index is written last, so readers never see an index pointing at
+    shards that do not exist yet.
+
+    Args:
+        document_id: Unique identifier for the document
+        ocr_content: OCR processing results
+        storage: Blob storage (defaults to the process-wide instance)
+    """
+    storage = storage or get_storage()
+    index, shards = build_ocr_page_shards(ocr_content)
+    for page_num, elements in shards.items():
+        storage.upload_blob(document_id, Stage.OCR, page_shard_ext(page_num), encode_results_payload(elements))
+    storage.upload_blob(document_id, Stage.OCR, OCR_INDEX_EXT, encode_results_payload(index))
+
+
+def delete_ocr_page_index(document_id: str, storage: Optional[BlobStorage] = None) -> bool:
+    """
+    Delete the OCR index and every page shard it lists.
+
+    The index goes first, so readers never see an index pointing at shards
+    that are already gone.
+
+    Args:
+        document_id: Unique identifier for the document
+        storage: Blob storage (defaults to the process-wide instance)
+
+    Returns:
+        True if the index existed and was deleted, False otherwise
+    """
+    storage = storage or get_storage()
+    index_data = storage.download_blob(document_id, Stage.OCR, OCR_INDEX_EXT)
+    if not index_data:
+        return False
+    index = json.loads(index_data)
+    deleted = storage.delete_blob(document_id, Stage.OCR, OCR_INDEX_EXT)
+    for entry in index.get("pages", []):
+        storage.delete_blob(document_id, Stage.OCR, page_shard_ext(entry["page_num"]))
+    return deleted
+
+
+def parse_cursor(cursor: Optional[str]) -> int:
+    """
+    Decode a pagination cursor into an element position.
+
+    Raises:
+        ValueError: If the cursor is not a non-negative element position
+    """
+    if cursor is None or cursor == "":
+        return 0
+    position = int(cursor)
+    if position < 0:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return position
+
+
+def plan_shard_reads(
+    index: Dict[str, Any],
+    page: Optional[int] = None,
+    start: int = 0,
+    min_confidence: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Select the index entries of the shards that can contain matching elements.
+
+    Args:
+        index: OCR page index
+        page: Only this page number, if given
+        start: Cursor position; shards ending before it are skipped
+        min_confidence: Shards whose best element is below this are skipped
+
+    Returns:
+        Page entries in reading order
+    """
+    return [
+        entry for entry in index.get("pages", [])
+        if (page is None or entry["page_num"] == page)
+        and entry["start"] + entry["count"] > start
+        and (min_confidence is None or entry["max_confidence"] >= min_confidence)
+    ]
+
+
+def select_ocr_elements(
+    elements: Iterable[Dict[str, Any]],
+    start: int = 0,
+    min_confidence: Optional[float] = None,
+    limit: Optional[int] = None,
+    page: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Apply cursor, page and confidence filters to OCR elements in reading order.
+
+    Args:
+        elements: Elements carrying ``element_index`` (e.g. shard contents)
+        start: Cursor position of the first element to consider
+        min_confidence: Minimum OCR confidence
+        limit: Maximum number of elements to return (None for all)
+        page: Only elements of this page number, if given
+
+    Returns:
+        Tuple of (selected elements, cursor of the next element or None when
+        no matching element is left)
+    """
+    selected: List[Dict[str, Any]] = []
+    for element in elements:
+        if element["element_index"] < start:
+            continue
+        if page is not None and element["page_num"] != page:
+            continue
+        if min_confidence is not None and element["confidence"] < min_confidence:
+            continue
+        if limit is not None and len(selected) >= limit:
+            return selected, str(element["element_index"])
+        selected.append(element)
+    return selected, None
+
+
+def index_ocr_elements(ocr_elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Number results-shaped OCR elements in the reading order the shards use.
+
+    Used for documents processed before the OCR stage wrote page shards.
+    """
+    ordered = sorted(ocr_elements, key=lambda element: element["page_num"])
+    return [{**element, "element_index": position} for position, element in enumerate(ordered)]
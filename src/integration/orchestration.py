@@ -2,7 +2,7 @@ import logging
 from typing import Dict, Any
 from .pipeline import process_document_with_ocr, process_document_with_llm
 from ..visualization.ocr_visualization import visualize_ocr_results
-from ..storage.storage import get_storage, Stage
+from ..storage.document_source import load_document_pdf
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +25,7 @@ async def integrated_pipeline(document_id: str, filename: str, blob_path: str) -
     
     # Step 1: Load document from blob storage
     print("Step 1: Loading document from blob storage...")
-    storage_client = get_storage()
-    pdf_data = storage_client.download_blob(document_id, Stage.RAW, ".pdf")
+    pdf_data = load_document_pdf(document_id, blob_path)
     if pdf_data is None:
         raise FileNotFoundError(f"Document not found in blob storage: {document_id}")
     print(f"  - Loaded document: {len(pdf_data)} bytes")
@@ -43,7 +42,7 @@ async def integrated_pipeline(document_id: str, filename: str, blob_path: str) -
     
     # Step 4: Generate visualizations
     print("Step 4: Generating OCR visualizations...")
-    visualize_ocr_results(document_id, ocr_results["original_lines"])
+    visualize_ocr_results(document_id, ocr_results["original_lines"], pdf_data=pdf_data)
     print("  - Visualizations generated and saved to blob storage")
     
     # Step 5: Compile final results
@@ -1,20 +1,188 @@
+import hashlib
+import json
 import logging
-from typing import Dict, Any, Optional
-from ..ocr.easyocr_client import extract_text_bboxes_with_ocr
+from typing import Dict, Any, List, Optional
+from ..ocr.easyocr_client import extract_text_bboxes_with_ocr, OCR_DPI
 from ..ocr.postprocess import normalize_ocr_lines, convert_numpy_types
-from ..llm.field_extractor import extract_fields_with_llm
+from ..ocr.rasterization import get_default_backend
+from ..ocr.text_layer import is_text_layer_enabled
+from ..llm.field_extractor import extract_fields_with_llm, create_extraction_prompt
 from ..llm.config import load_document_config, DocumentTypeConfig
-from ..llm.client import OllamaClient
+from ..llm.client import get_ollama_client
+from ..llm.response_cache import CachedLLMClient, get_llm_response_cache
 from ..llm.client import GenerativeLlm
-from ..storage.storage import get_storage, Stage
+from ..storage.storage import get_storage, Stage, build_document_envelope
+from ..storage.ocr_codec import OCR_COLUMNAR_EXT, decode_ocr_artifact, encode_ocr_artifact, is_columnar_artifact
+from ..storage.result_cache import compute_document_hash, compute_pipeline_version
+from .results import save_results_document
+from .ocr_index import save_ocr_page_index
 from ..dms.service import DmsService
 from ..dms.adapters import PostgresMetadataRepository
+from ..config import AppConfig
 from ..config.system import load_system_config
 import psycopg2
 from ..config.system import load_system_config
 
 logger = logging.getLogger(__name__)
 
+# Result cache kinds
+OCR_CACHE_KIND = "ocr"
+LLM_CACHE_KIND = "llm"
+
+DOCUMENT_TYPES_CONFIG_PATH = "config/document_types.conf"
+
+
+def get_ocr_pipeline_version() -> str:
+    """
+    Version of the OCR stage: changes whenever a setting that shapes OCR output changes.
+
+    Returns:
+        Short version string used in result cache keys
+    """
+    return compute_pipeline_version({
+        "engine": "easyocr",
+        "languages": ["en"],
+        "dpi": OCR_DPI,
+        "raster_backend": get_default_backend().value,
+        "text_layer": is_text_layer_enabled(),
+        # 2: normalized lines include the free-text lines outside label/value pairs
+        "normalization": 2,
+    })
+
+
+def get_llm_pipeline_version(
+    system_config: Optional[Dict[str, Any]] = None,
+    doc_config: Optional[Dict[str, DocumentTypeConfig]] = None,
+) -> str:
+    """
+    Version of the LLM stage: OCR version, model name, extraction prompt template, chunk budget and prefilter (if enabled).
+
+    Args:
+        system_config: System configuration (loaded if not provided)
+        doc_config: Document type configuration (loaded if not provided)
+
+    Returns:
+        Short version string used in result cache keys
+    """
+    system_config = system_config or load_system_config()
+    doc_config = doc_config or load_document_config(DOCUMENT_TYPES_CONFIG_PATH)
+    # The prompt without document content is the template plus field descriptions
+    prompt_template = create_extraction_prompt([], doc_config["credit_request"])
+    llm_settings = AppConfig().llm
+    return compute_pipeline_version({
+        "ocr": get_ocr_pipeline_version(),
+        "model_name": system_config['llm']['model_name'],
+        "prompt_sha256": hashlib.sha256(prompt_template.encode("utf-8")).hexdigest(),
+        # Chunked extraction can map fields differently than a single prompt
+        "chunk_token_budget": llm_settings.chunk_token_budget,
+        # Only when enabled, so turning the prefilter off keeps existing cache entries valid
+        **({"prefilter_top_k": llm_settings.prefilter_top_k} if llm_settings.prefilter_top_k else {}),
+    })
+
+
+def save_ocr_results(document_id: str, ocr_processing_results: Dict[str, Any], artifact_format: Optional[str] = None) -> None:
+    """
+    Save OCR results for a document to the OCR stage.
+
+    Args:
+        document_id: Unique identifier for the document
+        ocr_processing_results: Results from process_document_with_ocr (or the result cache)
+        artifact_format: "json" or "columnar" (defaults to the configured OCR artifact format)
+    """
+    ocr_processing_results["document_id"] = document_id
+    artifact_format = artifact_format or AppConfig().ocr.artifact_format
+    metadata = {
+        "stage": "ocr",
+        "notebook": "04_integration",
+        "processing_method": "easyocr"
+    }
+    storage_client = get_storage()
+    if artifact_format == "columnar":
+        envelope = build_document_envelope(document_id, ocr_processing_results, metadata)
+        storage_client.upload_blob(document_id, Stage.OCR, OCR_COLUMNAR_EXT, encode_ocr_artifact(envelope))
+    else:
+        storage_client.upload_document_data(
+            uuid=document_id,
+            stage=Stage.OCR,
+            ext=".json",
+            data=ocr_processing_results,
+            metadata=metadata
+        )
+    # Page shards and index serve paginated/filtered OCR element queries
+    try:
+        save_ocr_page_index(document_id, ocr_processing_results, storage=storage_client)
+    except Exception as e:
+        logger.warning(f"Failed to save OCR page index for {document_id}: {e}")
+
+
+def load_ocr_results(document_id: str, pages: Optional[List[int]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Load the stored OCR artifact of a document, whichever format it was written in.
+
+    The configured format is tried first, so each document normally costs
+    one blob read.
+
+    Args:
+        document_id: Unique identifier for the document
+        pages: Only decode the OCR lines of these pages (columnar artifacts only)
+
+    Returns:
+        The stored artifact (document_uuid, timestamp, data, metadata), or None if missing
+    """
+    storage_client = get_storage()
+    extensions = [OCR_COLUMNAR_EXT, ".json"]
+    if AppConfig().ocr.artifact_format != "columnar":
+        extensions.reverse()
+    for ext in extensions:
+        blob_data = storage_client.download_blob(document_id, Stage.OCR, ext)
+        if blob_data is None:
+            continue
+        if is_columnar_artifact(blob_data):
+            return decode_ocr_artifact(blob_data, pages)
+        return json.loads(blob_data.decode("utf-8"))
+    return None
+
+
+def save_final_results(document_id: str, ocr_processing_results: Dict[str, Any], llm_processing_results: Dict[str, Any]) -> None:
+    """
+    Save the precomputed results document served by the API.
+
+    Failures are logged only: the API rebuilds the results from the OCR and
+    LLM stages when the document is missing.
+
+    Args:
+        document_id: Unique identifier for the document
+        ocr_processing_results: OCR results of the document
+        llm_processing_results: LLM results of the document
+    """
+    try:
+        save_results_document(document_id, ocr_processing_results, llm_processing_results, storage=get_storage())
+    except Exception as e:
+        logger.warning(f"Failed to save results document for {document_id}: {e}")
+
+
+def save_llm_results(document_id: str, llm_processing_results: Dict[str, Any]) -> None:
+    """
+    Save LLM results for a document to the LLM stage.
+
+    Args:
+        document_id: Unique identifier for the document
+        llm_processing_results: Results from process_document_with_llm (or the result cache)
+    """
+    llm_processing_results["document_id"] = document_id
+    storage_client = get_storage()
+    storage_client.upload_document_data(
+        uuid=document_id,
+        stage=Stage.LLM,
+        ext=".json",
+        data=llm_processing_results,
+        metadata={
+            "stage": "llm",
+            "notebook": "04_integration",
+            "processing_method": "llama3.1:8b"
+        }
+    )
+
 
 async def process_document_with_ocr(document_id: str, pdf_data: bytes, dms_service: Optional[DmsService] = None) -> Dict[str, Any]:
     """
@@ -38,7 +206,8 @@ async def process_document_with_ocr(document_id: str, pdf_data: bytes, dms_servi
 
     # Step 1: OCR Processing
     print("  - Extracting text with OCR...")
-    ocr_results, pdf_images = extract_text_bboxes_with_ocr(pdf_data)
+    # Page images are not needed here, so rasterize page by page and drop them
+    ocr_results, _ = extract_text_bboxes_with_ocr(pdf_data, keep_images=False)
     print(f"  - Extracted {len(ocr_results)} text elements")
     
     # Step 2: Normalize OCR results
@@ -58,7 +227,8 @@ async def process_document_with_ocr(document_id: str, pdf_data: bytes, dms_servi
         "processing_metadata": {
             "total_elements": len(ocr_results_converted),
             "normalized_elements": len(normalized_results_converted),
-            "processing_method": "easyocr"
+            "processing_method": "easyocr",
+            "document_sha256": compute_document_hash(pdf_data)
         },
         "normalized_lines": normalized_results_converted,
         "original_lines": ocr_results_converted
@@ -66,18 +236,7 @@ async def process_document_with_ocr(document_id: str, pdf_data: bytes, dms_servi
     
     # Step 5: Save to blob storage
     print("  - Saving OCR results to blob storage...")
-    storage_client = get_storage()
-    storage_client.upload_document_data(
-        uuid=document_id,
-        stage=Stage.OCR,
-        ext=".json",
-        data=ocr_processing_results,
-        metadata={
-            "stage": "ocr",
-            "notebook": "04_integration",
-            "processing_method": "easyocr"
-        }
-    )
+    save_ocr_results(document_id, ocr_processing_results)
     
     print(f"  - OCR processing completed for document {document_id}")
     return ocr_processing_results
@@ -102,7 +261,7 @@ async def process_document_with_llm(document_id: str, ocr_results: Dict[str, Any
         raise ValueError("Failed to load system configuration")
     
     # Step 2: Load document configuration
-    doc_config = load_document_config("config/document_types.conf")
+    doc_config = load_document_config(DOCUMENT_TYPES_CONFIG_PATH)
     
     # Optional: mark processing status in DMS (section 6)
     if dms_service:
@@ -116,7 +275,19 @@ async def process_document_with_llm(document_id: str, ocr_results: Dict[str, Any
         url=system_config['llm']['url'],
         model_name=system_config['llm']['model_name']
     )
-    llm_client = OllamaClient(llm_config.url, llm_config.model_name)
+    # Shared per process: the pooled connections are reused across documents
+    llm_settings = AppConfig().llm
+    llm_client = get_ollama_client(
+        llm_config.url,
+        llm_config.model_name,
+        timeout=llm_settings.request_timeout,
+        max_connections=llm_settings.max_connections,
+        max_connections_per_host=llm_settings.max_connections_per_host,
+        keepalive_timeout=llm_settings.keepalive_timeout
+    )
+    if llm_settings.response_cache_enabled:
+        # Byte-identical prompts (retries, re-uploads) are answered from the response cache
+        llm_client = CachedLLMClient(llm_client, get_llm_response_cache())
     
     # Step 4: Extract fields using LLM
     print("  - Extracting fields with LLM...")
@@ -124,7 +295,11 @@ async def process_document_with_llm(document_id: str, ocr_results: Dict[str, Any
         ocr_lines=ocr_results["normalized_lines"],
         doc_config=doc_config["credit_request"],
         llm_client=llm_client,
-        original_ocr_lines=ocr_results["original_lines"]
+        original_ocr_lines=ocr_results["original_lines"],
+        stream=llm_settings.stream_responses,
+        max_chunk_tokens=llm_settings.chunk_token_budget or None,
+        max_concurrency=llm_settings.max_concurrent_chunks,
+        prefilter_top_k=llm_settings.prefilter_top_k or None
     )
     
     # Step 5: Prepare LLM results
@@ -141,18 +316,11 @@ async def process_document_with_llm(document_id: str, ocr_results: Dict[str, Any
     
     # Step 6: Save to blob storage
     print("  - Saving LLM results to blob storage...")
-    storage_client = get_storage()
-    storage_client.upload_document_data(
-        uuid=document_id,
-        stage=Stage.LLM,
-        ext=".json",
-        data=llm_processing_results,
-        metadata={
-            "stage": "llm",
-            "notebook": "04_integration",
-            "processing_method": "llama3.1:8b"
-        }
-    )
+    save_llm_results(document_id, llm_processing_results)
+    
+    # Step 7: Precompute the API results document
+    print("  - Saving results document...")
+    save_final_results(document_id, ocr_results, llm_processing_results)
     
     print(f"  - LLM processing completed for document {document_id}")
 
@@ -0,0 +1,213 @@
+"""
+Results document served by the API.
+
+Turns the stored OCR and LLM artifacts into the body of ``/results``: OCR
+elements, extracted fields and the processing summary, as plain
+JSON-compatible dictionaries shaped like ``DocumentResultsResponse``.
+
+The pipeline writes this document once, compactly encoded, to the results
+stage when LLM extraction finishes; the API then serves it with a single
+blob read and splices in the per-request fields (status, filename,
+visualization flag) without parsing or re-validating the body.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+from ..storage.ocr_codec import decode_ocr_artifact, is_columnar_artifact
+from ..storage.storage import BlobStorage, Stage, get_storage
+
+BBOX_FIELDS = ("x1", "y1", "width", "height")
+RESULTS_EXT = ".json"
+# Results document without the OCR elements, for requests that leave them out
+RESULTS_FIELDS_EXT = ".fields.json"
+# Section names accepted by the API, mapped to the response keys they select
+RESULTS_SECTIONS = {
+    "summary": "processing_summary",
+    "fields": "extracted_fields",
+    "ocr_elements": "ocr_elements",
+}
+
+
+def parse_stored_artifact(blob_bytes: Optional[bytes]) -> Optional[Dict[str, Any]]:
+    """
+    Parse a stored JSON artifact and unwrap its ``data`` envelope.
+
+    Args:
+        blob_bytes: Raw blob content (None if the blob does not exist)
+
+    Returns:
+        The artifact content, or None if there is no blob
+    """
+    if not blob_bytes:
+        return None
+    payload = json.loads(blob_bytes.decode('utf-8'))
+    # Artifacts written by upload_document_data nest their content under 'data'
+    if 'data' in payload:
+        return payload['data']
+    return payload
+
+
+def parse_ocr_artifact(blob_bytes: Optional[bytes]) -> Optional[Dict[str, Any]]:
+    """
+    Parse a stored OCR artifact written as JSON or in the columnar format.
+
+    Args:
+        blob_bytes: Raw blob content (None if the blob does not exist)
+
+    Returns:
+        The OCR stage content, or None if there is no blob
+    """
+    if blob_bytes and is_columnar_artifact(blob_bytes):
+        document = decode_ocr_artifact(blob_bytes)
+        return document.get('data', document)
+    return parse_stored_artifact(blob_bytes)
+
+
+def to_ocr_element(line: Dict[str, Any]) -> Dict[str, Any]:
+    """Results-document shape of one original OCR line."""
+    return {
+        "text": line['text'],
+        "confidence": line['confidence'],
+        "bbox": {key: line['bbox'][key] for key in BBOX_FIELDS},
+        "page_num": line['page_num'],
+    }
+
+
+def build_ocr_elements(ocr_content: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """OCR elements of the results document, one per original OCR line."""
+    if not ocr_content:
+        return []
+    return [to_ocr_element(line) for line in ocr_content.get('original_lines', [])]
+
+
+def build_extracted_fields(llm_content: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Extracted fields of the results document, values converted to strings."""
+    if not llm_content:
+        return []
+    extracted_fields = llm_content.get('extraction_results', {}).get('extracted_fields', {})
+    fields = []
+    for field_name, field_data in extracted_fields.items():
+        raw_value = field_data.get('value')
+        fields.append({
+            "field_name": field_name,
+            "extracted_value": str(raw_value) if raw_value is not None else None,
+            "confidence_score": field_data.get('confidence'),
+            "source_ocr_elements": field_data.get('source_ocr_elements', []),
+        })
+    return fields
+
+
+def build_results_payload(
+    ocr_content: Optional[Dict[str, Any]],
+    llm_content: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Build the document-independent part of the results document.
+
+    Args:
+        ocr_content: Unwrapped OCR artifact (original_lines, normalized_lines), or None
+        llm_content: Unwrapped LLM artifact (extraction_results), or None
+
+    Returns:
+        Dictionary with ocr_elements, extracted_fields and processing_summary
+        (None unless both artifacts are present)
+    """
+    ocr_elements = build_ocr_elements(ocr_content)
+    extracted_fields = build_extracted_fields(llm_content)
+
+    processing_summary = None
+    if ocr_content is not None and llm_content is not None:
+        processing_summary = {
+            "total_ocr_elements": len(ocr_elements),
+            "normalized_elements": len(ocr_content.get('normalized_lines', [])),
+            "extracted_fields": len(extracted_fields),
+            "validation_errors": len(llm_content.get('extraction_results', {}).get('validation_results', [])),
+        }
+
+    return {
+        "processing_summary": processing_summary,
+        "extracted_fields": extracted_fields,
+        "ocr_elements": ocr_elements,
+    }
+
+
+def resolve_results_sections(include: Optional[str] = None, exclude: Optional[str] = None) -> List[str]:
+    """
+    Resolve comma-separated section selections into response keys.
+
+    Args:
+        include: Sections to return (all sections if None)
+        exclude: Sections to leave out
+
+    Returns:
+        Response keys of the selected sections, in document order
+
+    Raises:
+        ValueError: If a section name is unknown
+    """
+    def parse(value: Optional[str]) -> List[str]:
+        names = [name.strip() for name in (value or "").split(",") if name.strip()]
+        unknown = [name for name in names if name not in RESULTS_SECTIONS]
+        if unknown:
+            raise ValueError(
+                f"Unknown results section(s): {', '.join(unknown)}; expected {', '.join(RESULTS_SECTIONS)}"
+            )
+        return names
+
+    included = parse(include) if include is not None else list(RESULTS_SECTIONS)
+    excluded = set(parse(exclude))
+    return [key for name, key in RESULTS_SECTIONS.items() if name in included and name not in excluded]
+
+
+def encode_results_payload(payload: Dict[str, Any]) -> bytes:
+    """Compact JSON encoding of a results payload (no whitespace, UTF-8)."""
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def save_results_document(
+    document_id: str,
+    ocr_content: Dict[str, Any],
+    llm_content: Dict[str, Any],
+    storage: Optional[BlobStorage] = None,
+) -> None:
+    """
+    Precompute the results document and store it in the results stage.
+
+    Alongside the full document, the summary and extracted fields are stored
+    on their own so requests excluding the OCR elements stay small.
+
+    Args:
+        document_id: Unique identifier for the document
+        ocr_content: OCR processing results
+        llm_content: LLM processing results
+        storage: Blob storage (defaults to the process-wide instance)
+    """
+    storage = storage or get_storage()
+    payload = build_results_payload(ocr_content, llm_content)
+    fields_payload = {key: payload[key] for key in ("processing_summary", "extracted_fields")}
+    storage.upload_blob(document_id, Stage.RESULTS, RESULTS_FIELDS_EXT, encode_results_payload(fields_payload))
+    storage.upload_blob(document_id, Stage.RESULTS, RESULTS_EXT, encode_results_payload(payload))
+
+
+def compose_results_response(header: Dict[str, Any], payload_bytes: bytes) -> bytes:
+    """
+    Prepend per-request fields to a stored results document without decoding it.
+
+    Args:
+        header: JSON-serializable fields such as document_id, filename, status
+        payload_bytes: Stored results document (a JSON object)
+
+    Returns:
+        JSON object bytes containing the header fields followed by the payload fields
+    """
+    payload_bytes = payload_bytes.strip()
+    if not payload_bytes.startswith(b"{") or not payload_bytes.endswith(b"}"):
+        raise ValueError("Stored results document is not a JSON object")
+    header_bytes = encode_results_payload(header)
+    body = payload_bytes[1:-1].strip()
+    if not header:
+        return payload_bytes
+    if not body:
+        return header_bytes
+    return header_bytes[:-1] + b"," + body + b"}"
@@ -0,0 +1,118 @@
+"""
+Splitting of long documents into LLM-sized chunks and merging of the partial results.
+
+Chunks follow page boundaries: whole pages are packed into a chunk until the
+token budget is reached, and only a single page larger than the budget is
+split between lines. Token counts are estimated from the prompt text at
+roughly four characters per token, which is close enough for budgeting.
+"""
+
+from typing import Any, Dict, List, Optional
+
+CHARS_PER_TOKEN = 4
+
+
+def format_ocr_line(line: Dict[str, Any]) -> Optional[str]:
+    """
+    Text of a normalized OCR line as it appears in the extraction prompt.
+
+    Args:
+        line: Normalized line (label_value, text_line or line)
+
+    Returns:
+        Prompt text, or None for line types the prompt leaves out
+    """
+    if line["type"] == "label_value":
+        return f"{line['label']}: {line['value']}"
+    if line["type"] in ("text_line", "line"):
+        return line["text"]
+    return None
+
+
+def estimate_tokens(ocr_lines: List[Dict[str, Any]]) -> int:
+    """Estimated prompt tokens taken up by the given lines."""
+    characters = sum(len(text) + 1 for text in map(format_ocr_line, ocr_lines) if text is not None)
+    return characters // CHARS_PER_TOKEN + 1
+
+
+def split_lines_into_chunks(ocr_lines: List[Dict[str, Any]], max_tokens: int) -> List[List[Dict[str, Any]]]:
+    """
+    Split normalized lines into chunks of whole pages within a token budget.
+
+    Args:
+        ocr_lines: Normalized lines carrying a "page" number
+        max_tokens: Estimated token budget per chunk
+
+    Returns:
+        Chunks in page order; one chunk if the whole document fits
+    """
+    pages: Dict[Any, List[Dict[str, Any]]] = {}
+    for line in ocr_lines:
+        pages.setdefault(line.get("page"), []).append(line)
+
+    chunks: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_tokens = 0
+    for page in sorted(pages, key=lambda page: (page is None, page or 0)):
+        page_lines = pages[page]
+        page_tokens = estimate_tokens(page_lines)
+        if current and current_tokens + page_tokens > max_tokens:
+            chunks.append(current)
+            current, current_tokens = [], 0
+        if page_tokens <= max_tokens:
+            current.extend(page_lines)
+            current_tokens += page_tokens
+            continue
+        # A single page over budget is split between lines
+        for line in page_lines:
+            line_tokens = estimate_tokens([line])
+            if current and current_tokens + line_tokens > max_tokens:
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append(line)
+            current_tokens += line_tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def chunk_pages(chunk: List[Dict[str, Any]]) -> List[Any]:
+    """Page numbers covered by a chunk."""
+    return sorted({line.get("page") for line in chunk if line.get("page") is not None})
+
+
+def merge_extracted_fields(partial_fields: List[Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Merge extracted_fields maps from several chunks.
+
+    When chunks disagree on a field, a value wins over no value, then a value
+    grounded in a matched OCR line (one carrying page/bounding_box) wins over
+    one that is not, then the higher confidence wins; on equal rank the
+    earlier chunk (lower pages) is kept. Every chunk prompt asks for every
+    field, so a chunk without the field can still guess a value; it gets the
+    default confidence of 0.5, which must not beat a real but low-confidence
+    OCR match.
+
+    Args:
+        partial_fields: extracted_fields maps in chunk order
+
+    Returns:
+        Merged extracted_fields map
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    for fields in partial_fields:
+        for field_name, field_data in fields.items():
+            current = merged.get(field_name)
+            if current is None or _field_rank(field_data) > _field_rank(current):
+                merged[field_name] = field_data
+    return merged
+
+
+def _field_rank(field_data: Dict[str, Any]) -> tuple:
+    confidence = field_data.get("confidence")
+    return (
+        field_data.get("value") is not None,
+        # Only fields matched to an OCR line carry these keys
+        "page" in field_data or "bounding_box" in field_data,
+        confidence if isinstance(confidence, (int, float)) else 0.0,
+    )
@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
+import asyncio
+import logging
+import threading
+import json
 import aiohttp
-from typing import Dict, List, Any
+from typing import Dict, List, Any, AsyncIterator, Optional, Tuple
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class GenerativeLlm:
@@ -19,13 +25,105 @@ class LLMClient(ABC):
         """Generate a response from the LLM."""
         pass
 
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Generate a response as a stream of text chunks.
+
+        Clients without native streaming yield the complete response once.
+        Closing the iterator early (aclose) abandons the rest of the response.
+        """
+        yield await self.generate(prompt)
+
 
 class OllamaClient(LLMClient):
-    """Client for Ollama LLM service."""
+    """
+    Client for Ollama LLM service.
+
+    The client owns an aiohttp session with a pooled keep-alive connector,
+    opened on first use, so consecutive calls reuse TCP connections instead of
+    connecting per request. Sessions are bound to an event loop, so the client
+    keeps one per loop it is used from (e.g. one per Celery worker thread).
+    Use it as an async context manager or call close() when done; a session
+    left open is closed when its loop shuts down its async generators, which
+    asyncio.run and close_worker_loop both do.
+    """
     
-    def __init__(self, base_url: str, model_name: str):
+    def __init__(
+        self,
+        base_url: str,
+        model_name: str,
+        timeout: float = 120.0,
+        max_connections: int = 10,
+        max_connections_per_host: int = 4,
+        keepalive_timeout: float = 60.0,
+        options: Optional[Dict[str, Any]] = None
+    ):
         self.base_url = base_url.rstrip('/')
         self.model_name = model_name
+        # Ollama generation options (temperature, seed, num_ctx, ...); server defaults if None
+        self.options = options
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.sessions_opened = 0
+        # Event loop -> (session, generator that closes it at loop shutdown)
+        self._sessions: Dict[asyncio.AbstractEventLoop, Tuple[aiohttp.ClientSession, AsyncIterator[None]]] = {}
+
+    async def __aenter__(self) -> "OllamaClient":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the open session for the running loop, opening one if needed."""
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(loop)
+        if entry is not None and not entry[0].closed:
+            return entry[0]
+        # Loops closed without shutting down their async generators took their connections with them
+        for stale_loop in [other for other in self._sessions if other.is_closed()]:
+            del self._sessions[stale_loop]
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        closer = self._close_at_loop_shutdown(loop, session)
+        # Started on this loop, the generator is finalized by loop.shutdown_asyncgens()
+        await closer.__anext__()
+        self._sessions[loop] = (session, closer)
+        self.sessions_opened += 1
+        return session
+
+    async def _close_at_loop_shutdown(
+        self, loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession
+    ) -> AsyncIterator[None]:
+        """Hold a session until close() or loop shutdown, then close it."""
+        try:
+            yield
+        finally:
+            if self._sessions.get(loop, (None,))[0] is session:
+                del self._sessions[loop]
+            await session.close()
+
+    def _payload(self, prompt: str, stream: bool) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"model": self.model_name, "prompt": prompt, "stream": stream}
+        if self.options:
+            payload["options"] = self.options
+        return payload
+
+    async def close(self) -> None:
+        """Close the running loop's session and its pooled connections."""
+        entry = self._sessions.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
         
     async def generate(self, prompt: str) -> str:
         """
@@ -37,24 +135,94 @@ class OllamaClient(LLMClient):
         Returns:
             The generated response text
         """
-        timeout = aiohttp.ClientTimeout(total=120)  # 2 minutes timeout
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        session = await self._get_session()
+        try:
+            async with session.post(
+                f"{self.base_url}/api/generate",
+                json=self._payload(prompt, stream=False)
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(f"Ollama API error: {error_text}")
+                
+                result = await response.json()
+                return result.get("response", "")
+                
+        except Exception as e:
+            print("Error calling Ollama API")
+            raise
+
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Generate a response from Ollama as it is produced.
+        
+        Ollama streams one JSON object per line, each carrying the next piece
+        of the response. Closing the iterator before the final line closes the
+        connection, which makes Ollama stop generating.
+        
+        Args:
+            prompt: The input prompt for the LLM
+            
+        Yields:
+            Response text chunks in order
+        """
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/api/generate",
+            json=self._payload(prompt, stream=True)
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Ollama API error: {error_text}")
+            
+            is_done = False
             try:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model_name,
-                        "prompt": prompt,
-                        "stream": False
-                    }
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"Ollama API error: {error_text}")
-                    
-                    result = await response.json()
-                    return result.get("response", "")
-                    
-            except Exception as e:
-                print("Error calling Ollama API")
-                raise
+                async for line in response.content:
+                    if not line.strip():
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("error"):
+                        raise Exception(f"Ollama API error: {chunk['error']}")
+                    if chunk.get("response"):
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        is_done = True
+                        break
+            finally:
+                if not is_done:
+                    # Drop the connection instead of returning it to the pool mid-response
+                    response.close()
+
+
+_clients: Dict[Tuple[str, str], OllamaClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_ollama_client(base_url: str, model_name: str, **settings: Any) -> OllamaClient:
+    """
+    Get the process-wide OllamaClient for a server and model.
+
+    Args:
+        base_url: Ollama server URL
+        model_name: Model to generate with
+        **settings: Constructor settings (pool limits, timeout, generation options) for a newly created client
+
+    Returns:
+        Shared OllamaClient instance
+    """
+    key = (base_url.rstrip('/'), model_name)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = OllamaClient(base_url, model_name, **settings)
+            _clients[key] = client
+        return client
+
+
+async def close_ollama_clients() -> None:
+    """Close the running loop's sessions of every shared OllamaClient (worker shutdown)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        await client.close()
@@ -1,7 +1,16 @@
+import asyncio
 import json
+import logging
 import re
-from typing import Dict, List, Any
+import time
+from typing import Dict, List, Any, Optional, Tuple
+from .chunking import chunk_pages, format_ocr_line, merge_extracted_fields, split_lines_into_chunks
 from .config import DocumentTypeConfig
+from .prefilter import select_candidate_lines
+
+logger = logging.getLogger(__name__)
+
+EXTRACTED_FIELDS_KEY = "extracted_fields"
 
 
 def clean_value(value: str, field_type: str) -> Any:
@@ -87,6 +96,133 @@ def extract_json_from_response(response: str) -> Dict[str, Any]:
         raise ValueError(f"Invalid JSON in response: {e}")
 
 
+class ExtractedFieldsScanner:
+    """
+    Incremental scanner that finds the ``extracted_fields`` object in streamed LLM output.
+
+    Text is fed as it arrives. The scanner tracks strings, escapes, ``//``
+    comments and brace depth, and reports the object's complete source as soon
+    as its closing brace arrives, so generation can stop without waiting for
+    the rest of the response.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.first_field_seen = False
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._in_comment = False
+        self._escaped = False
+        self._string_start = 0
+        self._last_key: Optional[str] = None
+        self._awaiting_value = False
+        self._fields_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> Optional[str]:
+        """
+        Scan the next piece of output.
+
+        Args:
+            chunk: Newly generated text
+
+        Returns:
+            Source of the extracted_fields object once it is complete, else None
+        """
+        self.text += chunk
+        text = self.text
+        while self._position < len(text):
+            position = self._position
+            character = text[position]
+            self._position += 1
+            if self._in_comment:
+                if character == "\n":
+                    self._in_comment = False
+            elif self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif character == "\\":
+                    self._escaped = True
+                elif character == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_key = text[self._string_start + 1:position]
+            elif character == '"':
+                self._in_string = True
+                self._string_start = position
+            elif character == "/" and text[position + 1:position + 2] == "/":
+                self._in_comment = True
+            elif character == "/" and position + 1 == len(text):
+                # Might be the start of a comment; wait for the next character
+                self._position = position
+                return None
+            elif character == ":":
+                self._awaiting_value = self._depth == 1 and self._last_key == EXTRACTED_FIELDS_KEY
+                if self._fields_start is not None and self._depth == 2:
+                    self.first_field_seen = True
+            elif character == "{":
+                self._depth += 1
+                if self._awaiting_value and self._depth == 2 and self._fields_start is None:
+                    self._fields_start = position
+                self._awaiting_value = False
+            elif character == "}":
+                self._depth -= 1
+                if self._fields_start is not None and self._depth == 1:
+                    return text[self._fields_start:position + 1]
+            elif not character.isspace():
+                self._awaiting_value = False
+        return None
+
+
+async def generate_extraction_json(llm_client, prompt: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Stream an extraction response and parse it, stopping once extracted_fields is complete.
+
+    Anything the model writes after the ``extracted_fields`` object (missing
+    fields, validation notes, prose) is not waited for. Responses without an
+    ``extracted_fields`` object are parsed in full once the stream ends.
+
+    Args:
+        llm_client: LLM client providing generate_stream
+        prompt: Extraction prompt
+
+    Returns:
+        Tuple of (parsed LLM result, generation metrics with time to first
+        token/field and total latency in seconds)
+    """
+    scanner = ExtractedFieldsScanner()
+    started = time.perf_counter()
+    first_token_seconds = None
+    first_field_seconds = None
+    fields_source = None
+    stream = llm_client.generate_stream(prompt)
+    try:
+        async for chunk in stream:
+            if first_token_seconds is None:
+                first_token_seconds = time.perf_counter() - started
+            fields_source = scanner.feed(chunk)
+            if first_field_seconds is None and scanner.first_field_seen:
+                first_field_seconds = time.perf_counter() - started
+            if fields_source is not None:
+                break
+    finally:
+        # Stops generation on the server when we leave the stream early
+        await stream.aclose()
+
+    metrics = {
+        "time_to_first_token_seconds": first_token_seconds,
+        "time_to_first_field_seconds": first_field_seconds,
+        "total_seconds": time.perf_counter() - started,
+        "stopped_early": fields_source is not None,
+        "response_chars": len(scanner.text),
+    }
+    if fields_source is not None:
+        llm_result = extract_json_from_response(f'{{"{EXTRACTED_FIELDS_KEY}": {fields_source}}}')
+    else:
+        llm_result = extract_json_from_response(scanner.text)
+    return llm_result, metrics
+
+
 def create_extraction_prompt(ocr_lines: List[Dict[str, Any]], config: DocumentTypeConfig) -> str:
     """
     Create a prompt for field extraction.
@@ -108,12 +244,7 @@ def create_extraction_prompt(ocr_lines: List[Dict[str, Any]], config: DocumentTy
     # Format field descriptions: "<db_key>: <human label>"
     field_descriptions = [f"- {field}: {desc}" for field, desc in field_descs.items()]
 
-    formatted_lines = []
-    for line in ocr_lines:
-        if line["type"] == "label_value":
-            formatted_lines.append(f"{line['label']}: {line['value']}")
-        elif line["type"] in ("text_line", "line"):
-            formatted_lines.append(line["text"])
+    formatted_lines = [text for text in map(format_ocr_line, ocr_lines) if text is not None]
 
     # Construct the prompt
     prompt = f"""Extract the following fields from the document content below. Return a valid JSON object with the extracted fields.
@@ -160,21 +291,35 @@ async def extract_fields_with_llm(
     ocr_lines: List[Dict[str, Any]],
     doc_config: DocumentTypeConfig,
     llm_client,
-    original_ocr_lines: List[Dict[str, Any]] = None
+    original_ocr_lines: List[Dict[str, Any]] = None,
+    stream: bool = True,
+    max_chunk_tokens: Optional[int] = None,
+    max_concurrency: int = 4,
+    prefilter_top_k: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Extract fields from OCR lines using LLM.
     The LLM is only used to map OCR text to field names.
     Original OCR data (value, confidence, bounding box, page) is preserved.
     
+    With prefilter_top_k, only the lines that best match each field's
+    description go into the prompt (see src/llm/prefilter.py). Documents
+    whose lines exceed max_chunk_tokens are split into page chunks that are
+    extracted concurrently and merged (see src/llm/chunking.py).
+    
     Args:
         ocr_lines: List of OCR lines with text and metadata
         doc_config: Document type configuration
         llm_client: LLM client for field extraction
         original_ocr_lines: Optional list of original OCR lines for reference
+        stream: Stream the response and stop once extracted_fields is complete
+        max_chunk_tokens: Estimated prompt token budget per chunk (None: one prompt)
+        max_concurrency: Maximum chunk requests in flight at once
+        prefilter_top_k: Candidate lines kept per field (None: every line goes into the prompt)
         
     Returns:
-        Dictionary containing extracted fields, missing fields, and validation results
+        Dictionary containing extracted fields, missing fields, validation results
+        and generation metrics
     """
     if not ocr_lines:
         return {
@@ -182,15 +327,94 @@ async def extract_fields_with_llm(
             "missing_fields": list(doc_config.expected_fields),
             "validation_results": {}
         }
-        
+
+    if prefilter_top_k:
+        field_descs = (
+            doc_config.field_descriptions
+            if hasattr(doc_config, "field_descriptions")
+            else doc_config.get("field_descriptions", {})
+        )
+        candidate_lines = select_candidate_lines(ocr_lines, field_descs, top_k=prefilter_top_k)
+        logger.info(f"Prompt prefilter kept {len(candidate_lines)} of {len(ocr_lines)} lines")
+        ocr_lines = candidate_lines
+
+    chunks = split_lines_into_chunks(ocr_lines, max_chunk_tokens) if max_chunk_tokens else [ocr_lines]
+    if len(chunks) == 1:
+        return await _extract_fields_from_lines(ocr_lines, doc_config, llm_client, original_ocr_lines, stream)
+    return await _extract_fields_in_chunks(
+        chunks, doc_config, llm_client, original_ocr_lines, stream, max_concurrency
+    )
+
+
+async def _extract_fields_in_chunks(
+    chunks: List[List[Dict[str, Any]]],
+    doc_config: DocumentTypeConfig,
+    llm_client,
+    original_ocr_lines: Optional[List[Dict[str, Any]]],
+    stream: bool,
+    max_concurrency: int
+) -> Dict[str, Any]:
+    """Extract each chunk concurrently (bounded by a semaphore) and merge the partial results."""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    started = time.perf_counter()
+
+    async def extract_chunk(chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+        # OCR lines used to locate values are limited to the chunk's pages
+        pages = set(chunk_pages(chunk))
+        chunk_original_lines = None
+        if original_ocr_lines:
+            chunk_original_lines = [line for line in original_ocr_lines if line.get("page_num") in pages]
+        async with semaphore:
+            return await _extract_fields_from_lines(chunk, doc_config, llm_client, chunk_original_lines, stream)
+
+    partial_results = await asyncio.gather(*(extract_chunk(chunk) for chunk in chunks))
+
+    from .validation import validate_extracted_fields
+    merged_fields = merge_extracted_fields([result["extracted_fields"] for result in partial_results])
+    chunk_metrics = [result["generation_metrics"] for result in partial_results]
+    first_field_times = [
+        metrics["time_to_first_field_seconds"] for metrics in chunk_metrics
+        if metrics.get("time_to_first_field_seconds") is not None
+    ]
+    generation_metrics = {
+        "streamed": stream,
+        "chunks": len(chunks),
+        "max_concurrency": max_concurrency,
+        "time_to_first_field_seconds": min(first_field_times) if first_field_times else None,
+        "total_seconds": time.perf_counter() - started,
+        "chunk_metrics": chunk_metrics,
+    }
+    logger.info(
+        f"Chunked LLM extraction: {len(chunks)} chunks, {len(merged_fields)} fields, "
+        f"{generation_metrics['total_seconds']:.2f}s"
+    )
+    return {
+        "extracted_fields": merged_fields,
+        "missing_fields": [field for field in doc_config.expected_fields if field not in merged_fields],
+        "validation_results": validate_extracted_fields(merged_fields, doc_config),
+        "generation_metrics": generation_metrics
+    }
+
+
+async def _extract_fields_from_lines(
+    ocr_lines: List[Dict[str, Any]],
+    doc_config: DocumentTypeConfig,
+    llm_client,
+    original_ocr_lines: Optional[List[Dict[str, Any]]],
+    stream: bool
+) -> Dict[str, Any]:
+    """Extract fields from one prompt's worth of lines."""
     # Step 1: Let LLM map OCR text to field names
     prompt = create_extraction_prompt(ocr_lines, doc_config)
-    response = await llm_client.generate(prompt)
-    
-    try:
+    if stream:
+        llm_result, generation_metrics = await generate_extraction_json(llm_client, prompt)
+    else:
+        started = time.perf_counter()
+        response = await llm_client.generate(prompt)
+        generation_metrics = {"total_seconds": time.perf_counter() - started, "stopped_early": False}
         llm_result = extract_json_from_response(response)
-    except ValueError as e:
-        raise
+    generation_metrics["streamed"] = stream
+    logger.info(f"LLM generation metrics: {generation_metrics}")
         
     # Step 2: Process extracted fields
     extracted_fields = {}
@@ -280,11 +504,18 @@ async def extract_fields_with_llm(
     from .validation import validate_extracted_fields
     validation_results = validate_extracted_fields(mapped_fields, doc_config)
     
+    # Missing fields come after extracted_fields in the response; derive them when generation stopped early
+    if "missing_fields" in llm_result:
+        missing_fields = llm_result["missing_fields"]
+    else:
+        missing_fields = [field for field in doc_config.expected_fields if field not in mapped_fields]
+
     # Prepare final result
     result = {
         "extracted_fields": mapped_fields,
-        "missing_fields": llm_result.get("missing_fields", []),
-        "validation_results": validation_results
+        "missing_fields": missing_fields,
+        "validation_results": validation_results,
+        "generation_metrics": generation_metrics
     }
     
     return result
@@ -0,0 +1,124 @@
+"""
+Candidate-line prefiltering for extraction prompts.
+
+Scores every normalized OCR line against each expected field and keeps only
+the best-matching lines (plus the lines right after them, where values
+usually follow their labels), so boilerplate, footers and disclaimers stay
+out of the prompt. Scoring is TF-IDF cosine similarity over character
+trigrams of words, which tolerates OCR errors and spelling variants such as
+"Adress". The field query is the label part of its description (the text
+before the first "(", "." or "?") plus the words of the field name; example
+values and formatting instructions are left out.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set
+
+from .chunking import format_ocr_line
+
+# Words too common in forms to say anything about a field
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "of", "on", "or", "the", "to",
+    "with", "der", "die", "das", "und", "oder", "von", "für", "mit", "im", "am", "zu", "den", "des", "ein", "eine",
+})
+
+
+def _features(text: str) -> Counter:
+    """Character trigram counts of the non-stopword words in a text."""
+    features: Counter = Counter()
+    for word in re.findall(r"\w+", text.lower()):
+        if word in STOPWORDS:
+            continue
+        padded = f" {word} "
+        features.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return features
+
+
+def field_query(field_name: str, description: str) -> str:
+    """Query text of a field: its description's label part plus its name."""
+    label = re.split(r"[(.?]", description, maxsplit=1)[0]
+    return f"{label} {field_name.replace('_', ' ')}"
+
+
+def _vector(features: Counter, idf: Dict[str, float]) -> Dict[str, float]:
+    vector = {feature: (1 + math.log(count)) * idf.get(feature, 0.0) for feature, count in features.items()}
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    return {feature: weight / norm for feature, weight in vector.items()} if norm else {}
+
+
+def score_lines(ocr_lines: List[Dict[str, Any]], field_descriptions: Dict[str, str]) -> Dict[str, List[float]]:
+    """
+    Score every line against every field.
+
+    Args:
+        ocr_lines: Normalized OCR lines
+        field_descriptions: Field name to description (DocumentTypeConfig.field_descriptions)
+
+    Returns:
+        Field name to one cosine similarity per line
+    """
+    line_features = [_features(format_ocr_line(line) or "") for line in ocr_lines]
+    document_frequency: Counter = Counter()
+    for features in line_features:
+        document_frequency.update(features.keys())
+    line_count = len(ocr_lines)
+    idf = {
+        feature: math.log((1 + line_count) / (1 + frequency)) + 1
+        for feature, frequency in document_frequency.items()
+    }
+    line_vectors = [_vector(features, idf) for features in line_features]
+
+    scores: Dict[str, List[float]] = {}
+    for field_name, description in field_descriptions.items():
+        query = _vector(_features(field_query(field_name, description)), idf)
+        scores[field_name] = [
+            sum(weight * line_vector.get(feature, 0.0) for feature, weight in query.items())
+            for line_vector in line_vectors
+        ]
+    return scores
+
+
+def select_candidate_lines(
+    ocr_lines: List[Dict[str, Any]],
+    field_descriptions: Dict[str, str],
+    top_k: int = 3,
+    context_lines: int = 1,
+    min_score: float = 0.2,
+    scores: Optional[Dict[str, List[float]]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Keep the top-k candidate regions per field, in document order.
+
+    A region is a matching line plus the next context_lines lines on the same
+    page, which covers labels whose value is a separate text line.
+
+    Args:
+        ocr_lines: Normalized OCR lines in reading order
+        field_descriptions: Field name to description
+        top_k: Matching lines kept per field
+        context_lines: Following lines kept with each match
+        min_score: Minimum similarity for a line to count as a match
+        scores: Precomputed score_lines result
+
+    Returns:
+        The selected lines (all lines if there is nothing to score against)
+    """
+    if not ocr_lines or not field_descriptions or top_k <= 0:
+        return list(ocr_lines)
+    scores = scores if scores is not None else score_lines(ocr_lines, field_descriptions)
+
+    selected: Set[int] = set()
+    for field_scores in scores.values():
+        ranked = sorted(range(len(ocr_lines)), key=lambda index: field_scores[index], reverse=True)
+        for index in ranked[:top_k]:
+            if field_scores[index] < min_score:
+                break
+            selected.add(index)
+            page = ocr_lines[index].get("page")
+            for offset in range(1, context_lines + 1):
+                following = index + offset
+                if following < len(ocr_lines) and ocr_lines[following].get("page") == page:
+                    selected.add(following)
+    return [line for index, line in enumerate(ocr_lines) if index in selected]
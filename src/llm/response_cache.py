@@ -0,0 +1,342 @@
+"""
+Prompt-level cache of LLM responses.
+
+Reprocessing a document (a retried task, a crashed worker, a re-upload under
+a new ID) sends byte-identical prompts to the model. Responses are cached
+under the SHA-256 of model name, generation options and prompt, in two
+tiers: an in-process LRU with TTL, and optionally Redis shared by all
+workers, with the same TTL. Both tiers are best-effort: a failing Redis only
+costs the lookup.
+
+The Redis tier lives in its own database index (LlmConfig.response_cache_redis_db),
+apart from the Celery broker and result backend, and is capped at a byte
+budget: entries are indexed by insertion time and the oldest are deleted
+once the recorded total exceeds it. Redis memory limits apply to the whole
+instance, not per database, so without this cap a full Redis under
+``noeviction`` would start refusing broker writes.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from ..config import AppConfig
+from .client import LLMClient
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "llm-response:"
+# Bookkeeping of the Redis byte budget: entry keys by insertion time, their sizes and the total
+REDIS_INDEX_KEY = "llm-response-index"
+REDIS_SIZES_KEY = "llm-response-sizes"
+REDIS_BYTES_KEY = "llm-response-bytes"
+# Entries deleted per round trip when the budget is exceeded
+REDIS_EVICTION_BATCH = 32
+# After a Redis error, skip the Redis tier for this long
+REDIS_RETRY_SECONDS = 30.0
+
+
+def compute_prompt_key(model_name: str, options: Optional[Dict[str, Any]], prompt: str) -> str:
+    """
+    Cache key of a generation request.
+
+    Args:
+        model_name: Model the prompt is sent to
+        options: Generation options (temperature, seed, ...), or None
+        prompt: Full prompt text
+
+    Returns:
+        Hex SHA-256 of the canonical request
+    """
+    prompt_sha256 = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    canonical = json.dumps(
+        {"model": model_name, "options": options or {}, "prompt_sha256": prompt_sha256},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    """A cached generation and what it cost to produce."""
+    text: str
+    # False when the consumer stopped the stream early (text is a prefix of the full response)
+    complete: bool
+    generation_seconds: float
+
+    def to_json(self) -> str:
+        return json.dumps({"text": self.text, "complete": self.complete, "generation_seconds": self.generation_seconds})
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CachedResponse":
+        data = json.loads(raw)
+        return cls(text=data["text"], complete=data["complete"], generation_seconds=data["generation_seconds"])
+
+
+class LruTtlCache:
+    """Thread-safe in-process LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: str, response: CachedResponse) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LlmResponseCache:
+    """
+    Two-tier (process LRU, then Redis) cache of LLM responses with hit statistics.
+
+    Args:
+        max_entries: Entries kept in the in-process LRU
+        ttl_seconds: Lifetime of an entry in either tier
+        redis_client: redis.Redis client for the shared tier, or None for memory only
+        max_response_bytes: Responses larger than this are not cached
+        redis_max_bytes: Byte budget of all entries in the Redis tier
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 7 * 24 * 3600,
+        redis_client: Any = None,
+        max_response_bytes: int = 256 * 1024,
+        redis_max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self.memory = LruTtlCache(max_entries, ttl_seconds)
+        self.ttl_seconds = ttl_seconds
+        self.max_response_bytes = max_response_bytes
+        self.redis_max_bytes = redis_max_bytes
+        self._redis = redis_client
+        self._redis_retry_at = 0.0
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+        self._saved_seconds = 0.0
+        self._redis_evictions = 0
+
+    def _redis_available(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, action: str, error: Exception) -> None:
+        logger.warning(f"LLM response cache: Redis {action} failed, skipping Redis for {REDIS_RETRY_SECONDS:.0f}s: {error}")
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+    async def get(self, key: str, require_complete: bool = False) -> Optional[CachedResponse]:
+        """
+        Look up a response in memory, then Redis (promoting Redis hits to memory).
+
+        Args:
+            key: Key from compute_prompt_key
+            require_complete: Ignore entries cached from a stream that was stopped early
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        response = self.memory.get(key)
+        tier = "memory"
+        if response is None and self._redis_available():
+            try:
+                raw = await asyncio.to_thread(self._redis.get, REDIS_KEY_PREFIX + key)
+            except Exception as e:
+                self._redis_failed("lookup", e)
+                raw = None
+            if raw is not None:
+                response = CachedResponse.from_json(raw.decode("utf-8") if isinstance(raw, bytes) else raw)
+                self.memory.put(key, response)
+                tier = "redis"
+        if response is not None and require_complete and not response.complete:
+            response = None
+
+        with self._lock:
+            if response is None:
+                self._misses += 1
+            else:
+                if tier == "memory":
+                    self._memory_hits += 1
+                else:
+                    self._redis_hits += 1
+                self._saved_seconds += response.generation_seconds
+        return response
+
+    async def put(self, key: str, response: CachedResponse) -> None:
+        """Store a response in both tiers. A complete entry is never replaced by a partial one."""
+        if len(response.text.encode("utf-8")) > self.max_response_bytes:
+            return
+        existing = self.memory.get(key)
+        if existing is not None and existing.complete and not response.complete:
+            return
+        self.memory.put(key, response)
+        if self._redis_available():
+            try:
+                await asyncio.to_thread(self._redis_put, REDIS_KEY_PREFIX + key, response.to_json().encode("utf-8"))
+            except Exception as e:
+                self._redis_failed("store", e)
+
+    def _redis_put(self, redis_key: str, payload: bytes) -> None:
+        """Store an entry in Redis and delete the oldest entries while the byte budget is exceeded."""
+        previous_size = self._redis.hget(REDIS_SIZES_KEY, redis_key)
+        pipeline = self._redis.pipeline()
+        pipeline.set(redis_key, payload, ex=max(1, int(self.ttl_seconds)))
+        pipeline.zadd(REDIS_INDEX_KEY, {redis_key: time.time()})
+        pipeline.hset(REDIS_SIZES_KEY, redis_key, len(payload))
+        pipeline.incrby(REDIS_BYTES_KEY, len(payload) - int(previous_size or 0))
+        total_bytes = pipeline.execute()[-1]
+
+        # Entries expire after the same TTL, so expired ones are always the oldest and go first
+        while total_bytes > self.redis_max_bytes:
+            oldest = self._redis.zpopmin(REDIS_INDEX_KEY, REDIS_EVICTION_BATCH)
+            if not oldest:
+                break
+            names = [name for name, _ in oldest]
+            freed_bytes = sum(int(size or 0) for size in self._redis.hmget(REDIS_SIZES_KEY, names))
+            pipeline = self._redis.pipeline()
+            pipeline.delete(*names)
+            pipeline.hdel(REDIS_SIZES_KEY, *names)
+            pipeline.decrby(REDIS_BYTES_KEY, freed_bytes)
+            total_bytes = pipeline.execute()[-1]
+            with self._lock:
+                self._redis_evictions += len(names)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report hits per tier, misses, hit rate and generation time saved by hits in this process.
+
+        Returns:
+            Dictionary of counters
+        """
+        with self._lock:
+            hits = self._memory_hits + self._redis_hits
+            lookups = hits + self._misses
+            return {
+                "memory_hits": self._memory_hits,
+                "redis_hits": self._redis_hits,
+                "misses": self._misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "saved_seconds": round(self._saved_seconds, 3),
+                "memory_entries": len(self.memory),
+                "memory_evictions": self.memory.evictions,
+                "redis_evictions": self._redis_evictions,
+            }
+
+
+class CachedLLMClient(LLMClient):
+    """
+    LLMClient wrapper that answers repeated prompts from an LlmResponseCache.
+
+    Streams are cached as well: a stream the consumer closed early is stored as
+    an incomplete entry, which only streaming callers are served from, since
+    replaying it stops the consumer at the same point.
+    """
+
+    def __init__(self, client: LLMClient, cache: LlmResponseCache) -> None:
+        self.client = client
+        self.cache = cache
+        self.model_name = getattr(client, "model_name", type(client).__name__)
+        self.options = getattr(client, "options", None)
+
+    def _key(self, prompt: str) -> str:
+        return compute_prompt_key(self.model_name, self.options, prompt)
+
+    async def generate(self, prompt: str) -> str:
+        """Return the cached response for the prompt, generating and caching it on a miss."""
+        key = self._key(prompt)
+        cached = await self.cache.get(key, require_complete=True)
+        if cached is not None:
+            return cached.text
+        started = time.perf_counter()
+        text = await self.client.generate(prompt)
+        await self.cache.put(key, CachedResponse(text, True, time.perf_counter() - started))
+        return text
+
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Replay a cached response as one chunk, or stream from the model and cache what was read."""
+        key = self._key(prompt)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            yield cached.text
+            return
+        started = time.perf_counter()
+        chunks = []
+        complete = False
+        stopped_by_consumer = False
+        stream = self.client.generate_stream(prompt)
+        try:
+            async for chunk in stream:
+                chunks.append(chunk)
+                yield chunk
+            complete = True
+        except GeneratorExit:
+            stopped_by_consumer = True
+            raise
+        finally:
+            await stream.aclose()
+            # A stream that failed mid-way is not cached
+            if chunks and (complete or stopped_by_consumer):
+                response = CachedResponse("".join(chunks), complete, time.perf_counter() - started)
+                await self.cache.put(key, response)
+
+
+_response_cache: Optional[LlmResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LlmResponseCache:
+    """Get the process-wide LlmResponseCache, configured from AppConfig.llm and AppConfig.redis."""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                app_config = AppConfig()
+                redis_client = None
+                if app_config.llm.response_cache_redis:
+                    import redis
+                    redis_client = redis.Redis(
+                        host=app_config.redis.host,
+                        port=app_config.redis.port,
+                        # Kept apart from the Celery broker and result backend
+                        db=app_config.llm.response_cache_redis_db,
+                        socket_connect_timeout=0.5,
+                        socket_timeout=0.5,
+                    )
+                _response_cache = LlmResponseCache(
+                    max_entries=app_config.llm.response_cache_max_entries,
+                    ttl_seconds=app_config.llm.response_cache_ttl_seconds,
+                    redis_client=redis_client,
+                    redis_max_bytes=app_config.llm.response_cache_redis_max_bytes,
+                )
+    return _response_cache
@@ -1,85 +1,198 @@
-from typing import List, Dict, Any, Tuple
+import logging
+from typing import List, Dict, Any, Tuple, Iterator, Optional, Union
 import numpy as np
-from pdf2image import convert_from_path
-import easyocr
+from .rasterization import RasterBackend, get_page_count, iter_page_images
+from .reader_registry import get_reader
+from .text_layer import extract_text_layer, is_text_layer_enabled
+from .parallel import can_use_process_pool, get_default_workers, get_ocr_executor
 
+logger = logging.getLogger(__name__)
 
-def extract_text_bboxes_with_ocr(pdf_input) -> Tuple[List[Dict[str, Any]], List[Any]]:
+# Rasterization resolution shared with the visualization step
+OCR_DPI = 150
+
+
+def _ocr_page(reader, image: np.ndarray, page_num: int) -> List[Dict[str, Any]]:
+    """
+    Run EasyOCR on a single page image.
+
+    Args:
+        reader: EasyOCR reader
+        image: RGB page image as a numpy array
+        page_num: Page number (1-based)
+
+    Returns:
+        List of dictionaries with text, bbox, confidence, page_num
+    """
+    # Extract text with EasyOCR
+    ocr_results = reader.readtext(np.asarray(image))
+
+    page_results: List[Dict[str, Any]] = []
+    for result in ocr_results:
+        bbox_points = result[0]  # List of 4 corner points
+        text = result[1]
+        confidence = result[2]
+
+        # Convert bbox points to x1, y1, x2, y2 format
+        x_coords = [point[0] for point in bbox_points]
+        y_coords = [point[1] for point in bbox_points]
+        x1, x2 = min(x_coords), max(x_coords)
+        y1, y2 = min(y_coords), max(y_coords)
+
+        page_results.append({
+            "page_num": page_num,
+            "text": text,
+            "confidence": confidence,
+            "bbox": {
+                "x1": x1,
+                "y1": y1,
+                "x2": x2,
+                "y2": y2,
+                "width": x2 - x1,
+                "height": y2 - y1
+            }
+        })
+
+    return page_results
+
+
+def _iter_ocr_pages(
+    pdf_input: Union[str, bytes],
+    dpi: int,
+    backend: Optional[RasterBackend],
+    use_text_layer: Optional[bool] = None,
+    executor=None,
+) -> Iterator[Tuple[int, Optional[np.ndarray], List[Dict[str, Any]]]]:
+    """
+    Yield (page_num, image, page_results) for each page in page order.
+
+    Pages with a usable native text layer are emitted without rasterization
+    (image is None); only the remaining pages are rendered and run through
+    EasyOCR. With a ParallelOcrExecutor the OCR pages are recognized in worker
+    processes and no images are returned.
+    """
+    if use_text_layer is None:
+        use_text_layer = is_text_layer_enabled()
+
+    text_layer_pages: Dict[int, Optional[List[Dict[str, Any]]]] = {}
+    if use_text_layer:
+        try:
+            text_layer_pages = extract_text_layer(pdf_input, dpi)
+        except Exception as e:
+            logger.warning(f"Text layer check failed, running OCR on all pages: {e}")
+
+    ocr_pages = None
+    if text_layer_pages:
+        ocr_pages = {page_num for page_num, records in text_layer_pages.items() if records is None}
+        logger.info(
+            f"Text layer found on {len(text_layer_pages) - len(ocr_pages)} of {len(text_layer_pages)} pages, "
+            f"running OCR on {len(ocr_pages)}"
+        )
+
+    # Emit text-layer pages that precede the next OCR page so output stays in page order
+    pending_text_pages = sorted(
+        page_num for page_num, records in text_layer_pages.items() if records is not None
+    )
+
+    def flush_text_pages(before_page: Optional[int]):
+        while pending_text_pages and (before_page is None or pending_text_pages[0] < before_page):
+            page_num = pending_text_pages.pop(0)
+            yield page_num, None, text_layer_pages[page_num]
+
+    if executor is not None and (ocr_pages is None or ocr_pages):
+        if ocr_pages is None:
+            ocr_pages = range(1, get_page_count(pdf_input) + 1)
+        for page_num, page_results in executor.iter_pages(pdf_input, dpi, ocr_pages, backend):
+            yield from flush_text_pages(page_num)
+            yield page_num, None, page_results
+    elif ocr_pages is None or ocr_pages:
+        # Reuse the process-wide EasyOCR reader for English (loaded once per worker)
+        reader = get_reader(['en'])
+
+        for page_num, image in iter_page_images(pdf_input, dpi, backend, pages=ocr_pages):
+            yield from flush_text_pages(page_num)
+            page_results = _ocr_page(reader, image, page_num)
+            yield page_num, image, page_results
+            del image
+
+    yield from flush_text_pages(None)
+
+
+def iter_text_bboxes_with_ocr(
+    pdf_input: Union[str, bytes],
+    dpi: int = OCR_DPI,
+    backend: Optional[RasterBackend] = None,
+    use_text_layer: Optional[bool] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Stream OCR results page by page.
+
+    Each page is rasterized, recognized and released before the next one is
+    touched, so peak memory does not grow with the number of pages.
+
+    Args:
+        pdf_input: Either a path to the PDF file (str) or PDF bytes
+        dpi: Rasterization resolution
+        backend: Rasterization backend (defaults to OCR_RASTER_BACKEND)
+        use_text_layer: Read digital pages from the PDF text layer instead of
+            running OCR on them (defaults to OCR_USE_TEXT_LAYER)
+
+    Yields:
+        List of dictionaries with text, bbox, confidence, page_num for one page
+    """
+    for _, image, page_results in _iter_ocr_pages(pdf_input, dpi, backend, use_text_layer):
+        # Drop the bitmap before the next page is rasterized
+        del image
+        yield page_results
+
+
+def extract_text_bboxes_with_ocr(
+    pdf_input,
+    keep_images: bool = True,
+    backend: Optional[RasterBackend] = None,
+    use_text_layer: Optional[bool] = None,
+    workers: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], List[Any]]:
     """
     Extract text, bounding boxes, confidence scores, and page number using EasyOCR.
-    
+
+    Pages of digitally generated PDFs are read from the native text layer;
+    only scanned or image-only pages go through EasyOCR.
+
     Args:
         pdf_input: Either a path to the PDF file (str) or PDF bytes
-        
+        keep_images: Whether to keep the rasterized pages for the caller. Pass
+            False when only the OCR results are needed to keep memory flat.
+        backend: Rasterization backend (defaults to OCR_RASTER_BACKEND)
+        use_text_layer: Read digital pages from the PDF text layer instead of
+            running OCR on them (defaults to OCR_USE_TEXT_LAYER)
+        workers: Number of OCR worker processes (defaults to OCR_WORKERS). Pages
+            are only recognized in parallel when keep_images is False, since page
+            bitmaps are not sent back from the workers.
+
     Returns:
         Tuple of (ocr_results, pdf_images)
         - ocr_results: List of dictionaries with text, bbox, confidence, page_num
-        - pdf_images: List of PIL images for visualization
+        - pdf_images: List of RGB page arrays for OCR'd pages (empty if keep_images is False).
+          Text-layer pages are not rasterized and therefore not included.
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    # Initialize EasyOCR reader for English
-    reader = easyocr.Reader(['en'])
-    
-    # Handle both file path and bytes input
-    if isinstance(pdf_input, str):
-        # File path
-        logger.info(f"Processing PDF from file path: {pdf_input}")
-        pdf_images: List[Any] = convert_from_path(pdf_input, dpi=150)
-    else:
-        # PDF bytes - save to temporary file
-        import tempfile
-        import os
-        logger.info(f"Processing PDF from bytes (size: {len(pdf_input)} bytes)")
-        temp_file = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
-        temp_path = temp_file.name
-        temp_file.write(pdf_input)
-        temp_file.close()
-        
-        try:
-            pdf_images: List[Any] = convert_from_path(temp_path, dpi=150)
-            logger.info(f"Successfully converted PDF to {len(pdf_images)} images")
-        except Exception as e:
-            logger.error(f"Failed to convert PDF: {e}")
-            raise
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-    
     all_results: List[Dict[str, Any]] = []
-    
-    for page_index, image in enumerate(pdf_images):
-        # Convert PIL image to numpy array
-        image_array = np.array(image)
-        
-        # Extract text with EasyOCR
-        ocr_results = reader.readtext(image_array)
-        
-        for result in ocr_results:
-            bbox_points = result[0]  # List of 4 corner points
-            text = result[1]
-            confidence = result[2]
-            
-            # Convert bbox points to x1, y1, x2, y2 format
-            x_coords = [point[0] for point in bbox_points]
-            y_coords = [point[1] for point in bbox_points]
-            x1, x2 = min(x_coords), max(x_coords)
-            y1, y2 = min(y_coords), max(y_coords)
-            
-            all_results.append({
-                "page_num": page_index + 1,
-                "text": text,
-                "confidence": confidence,
-                "bbox": {
-                    "x1": x1,
-                    "y1": y1,
-                    "x2": x2,
-                    "y2": y2,
-                    "width": x2 - x1,
-                    "height": y2 - y1
-                }
-            })
-    
+    pdf_images: List[Any] = []
+
+    executor = None
+    if workers is None:
+        workers = get_default_workers()
+    if workers > 1 and not keep_images:
+        if can_use_process_pool():
+            executor = get_ocr_executor(workers)
+        else:
+            logger.warning("OCR process pool not available in a daemonic process, running OCR sequentially")
+
+    for _, image, page_results in _iter_ocr_pages(pdf_input, OCR_DPI, backend, use_text_layer, executor):
+        all_results.extend(page_results)
+        if keep_images and image is not None:
+            pdf_images.append(image)
+        del image
+
+    logger.info(f"Extracted {len(all_results)} text elements")
     return all_results, pdf_images
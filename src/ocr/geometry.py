@@ -0,0 +1,53 @@
+"""
+Array-backed geometry for OCR boxes.
+
+OCR records are dicts with a nested ``bbox``. ``BoxArray`` keeps their
+coordinates in one contiguous ``(n, 4)`` float64 array so row grouping can
+compute centers and heights for a whole page in a single vectorized pass.
+"""
+
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+BBOX_KEYS = ("x1", "y1", "x2", "y2")
+
+
+class BoxArray:
+    """Axis-aligned boxes stored as an (n, 4) float64 array of x1, y1, x2, y2."""
+
+    __slots__ = ("coords",)
+
+    def __init__(self, coords: np.ndarray) -> None:
+        coords = np.asarray(coords, dtype=np.float64)
+        if coords.ndim != 2 or coords.shape[1] != 4:
+            coords = coords.reshape(-1, 4)
+        self.coords = coords
+
+    @classmethod
+    def from_bboxes(cls, bboxes: Sequence[Dict[str, Any]]) -> "BoxArray":
+        """Build from bbox dicts with x1, y1, x2, y2."""
+        return cls(np.array([[bbox[key] for key in BBOX_KEYS] for bbox in bboxes], dtype=np.float64))
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    @property
+    def x1(self) -> np.ndarray:
+        return self.coords[:, 0]
+
+    @property
+    def y1(self) -> np.ndarray:
+        return self.coords[:, 1]
+
+    @property
+    def y2(self) -> np.ndarray:
+        return self.coords[:, 3]
+
+    @property
+    def heights(self) -> np.ndarray:
+        return self.y2 - self.y1
+
+    @property
+    def y_centers(self) -> np.ndarray:
+        return (self.y1 + self.y2) / 2
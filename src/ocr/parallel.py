@@ -0,0 +1,245 @@
+"""
+Parallel page OCR on a process pool.
+
+Pages are fanned out to a ``ProcessPoolExecutor`` whose workers each hold
+their own warm EasyOCR reader. PDF bytes are written to a temporary file
+once per document and every task ships only its path and a page number;
+the worker rasterizes that single page itself, so neither the PDF nor page
+bitmaps are copied per page. Results come back in page order.
+
+Celery prefork children are daemonic and cannot start the pool, so OCR
+tasks are routed to their own queue (``OcrConfig.task_queue``), consumed by
+a worker running with ``--pool=solo`` (see the celery-ocr-worker service in
+compose.yml).
+"""
+
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Collection, Deque, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .rasterization import RasterBackend, get_default_backend, iter_page_images
+from .reader_registry import DEFAULT_LANGUAGES, get_reader
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for OCR_WORKERS=auto; every worker holds its own EasyOCR model in memory
+MAX_AUTO_WORKERS = 4
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (respects container cpusets, unlike os.cpu_count)."""
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_default_workers() -> int:
+    """Resolve the OCR worker count from OCR_WORKERS (1, i.e. sequential, if unset)."""
+    workers_env = os.environ.get("OCR_WORKERS", "").strip()
+    if not workers_env:
+        return 1
+    if workers_env.lower() == "auto":
+        return min(available_cpus(), MAX_AUTO_WORKERS)
+    try:
+        return max(1, int(workers_env))
+    except ValueError:
+        logger.warning(f"Invalid OCR_WORKERS '{workers_env}', running OCR sequentially")
+        return 1
+
+
+def get_default_max_in_flight(workers: int) -> int:
+    """Resolve the in-flight page limit from OCR_MAX_IN_FLIGHT (twice the worker count if unset)."""
+    limit_env = os.environ.get("OCR_MAX_IN_FLIGHT", "").strip()
+    try:
+        return max(1, int(limit_env)) if limit_env else 2 * workers
+    except ValueError:
+        logger.warning(f"Invalid OCR_MAX_IN_FLIGHT '{limit_env}', using {2 * workers}")
+        return 2 * workers
+
+
+def can_use_process_pool() -> bool:
+    """
+    Whether this process may start a process pool.
+
+    Daemonic processes (e.g. Celery prefork children) are not allowed to have
+    children, so OCR stays sequential there; the OCR queue worker runs with
+    the solo pool for this reason.
+    """
+    return not multiprocessing.current_process().daemon
+
+
+def _init_worker(languages: Tuple[str, ...], torch_threads: int) -> None:
+    """Pool initializer: split the CPU between workers and load the reader up front."""
+    try:
+        import torch
+        torch.set_num_threads(torch_threads)
+    except ImportError:
+        pass
+    get_reader(languages)
+
+
+def _warm_up_task() -> int:
+    """No-op task; the pool initializer has already loaded the reader."""
+    return os.getpid()
+
+
+def _ocr_page_task(
+    pdf_input: Union[str, bytes],
+    page_num: int,
+    dpi: int,
+    backend_value: str,
+    languages: Tuple[str, ...],
+) -> List[Dict[str, Any]]:
+    """Rasterize and OCR a single page inside a pool worker."""
+    from .easyocr_client import _ocr_page
+
+    reader = get_reader(languages)
+    for _, image in iter_page_images(pdf_input, dpi, RasterBackend(backend_value), pages={page_num}):
+        return _ocr_page(reader, image, page_num)
+    return []
+
+
+class ParallelOcrExecutor:
+    """
+    Run page OCR on a pool of worker processes.
+
+    At most ``max_in_flight`` pages are submitted at once, which bounds both the
+    number of tasks queued for the workers and the number of finished pages
+    buffered while an earlier page is still being recognized.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_in_flight: Optional[int] = None,
+        languages: Sequence[str] = DEFAULT_LANGUAGES,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.max_in_flight = max(1, max_in_flight or 2 * self.workers)
+        self.languages = tuple(languages)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                torch_threads = max(1, available_cpus() // self.workers)
+                logger.info(
+                    f"Starting OCR process pool: workers={self.workers}, "
+                    f"max_in_flight={self.max_in_flight}, torch_threads={torch_threads}"
+                )
+                # Spawn rather than fork so workers do not inherit torch thread pools
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.languages, torch_threads),
+                )
+            return self._pool
+
+    def warm_up(self) -> None:
+        """
+        Start every worker process and wait until each has loaded its reader.
+
+        Workers are spawned on demand, so one task is submitted per worker
+        before any of them is up; each submit then starts a new process.
+        """
+        pool = self._get_pool()
+        futures = [pool.submit(_warm_up_task) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+
+    def iter_pages(
+        self,
+        pdf_input: Union[str, bytes],
+        dpi: int,
+        pages: Collection[int],
+        backend: Optional[RasterBackend] = None,
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        OCR the given pages in parallel and yield results in page order.
+
+        Args:
+            pdf_input: Either a path to the PDF file (str) or PDF bytes
+            dpi: Rasterization resolution
+            pages: Page numbers (1-based) to OCR
+            backend: Rasterization backend used by the workers (defaults to OCR_RASTER_BACKEND)
+
+        Yields:
+            Tuples of (page_num, list of text/bbox/confidence/page_num dictionaries)
+        """
+        pool = self._get_pool()
+        backend_value = (backend or get_default_backend()).value
+        remaining = iter(sorted(pages))
+        in_flight: Deque[Tuple[int, Future]] = deque()
+        temp_path: Optional[str] = None
+        if not isinstance(pdf_input, str):
+            # Workers open the file themselves instead of each task pickling the whole PDF
+            fd, temp_path = tempfile.mkstemp(suffix=".pdf")
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(pdf_input)
+            pdf_input = temp_path
+
+        def submit_next() -> None:
+            page_num = next(remaining, None)
+            if page_num is not None:
+                future = pool.submit(_ocr_page_task, pdf_input, page_num, dpi, backend_value, self.languages)
+                in_flight.append((page_num, future))
+
+        try:
+            for _ in range(self.max_in_flight):
+                submit_next()
+            while in_flight:
+                page_num, future = in_flight.popleft()
+                page_results = future.result()
+                submit_next()
+                yield page_num, page_results
+        finally:
+            # Abandoned iteration (error or early exit) should not leave queued pages running
+            for _, future in in_flight:
+                future.cancel()
+            if temp_path is not None:
+                # Tasks still running at this point belong to an abandoned iteration
+                os.unlink(temp_path)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+
+_executors: Dict[Tuple[int, int], ParallelOcrExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_ocr_executor(workers: int, max_in_flight: Optional[int] = None) -> ParallelOcrExecutor:
+    """
+    Get a shared executor for the given pool size.
+
+    The pool and its warm readers are reused across documents, so the model
+    load is paid once per worker process rather than once per document.
+    """
+    max_in_flight = max_in_flight or get_default_max_in_flight(workers)
+    key = (workers, max_in_flight)
+    with _executors_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            executor = ParallelOcrExecutor(workers, max_in_flight)
+            _executors[key] = executor
+        return executor
+
+
+def shutdown_ocr_executors() -> None:
+    """Stop every shared executor (mainly for tests and benchmarks)."""
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown()
+        _executors.clear()
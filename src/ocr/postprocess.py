@@ -72,7 +72,7 @@ def normalize_ocr_lines(ocr_lines: List[Dict[str, Any]]) -> List[Dict[str, Any]]
     for line in converted_lines:
         if line["type"] != "line":
             continue
-        if line.get("bounding_box") is None:
+        if line.get("bbox") is None:
             continue
         
         # Skip if this text was already used in a label-value pair
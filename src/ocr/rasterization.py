@@ -0,0 +1,184 @@
+"""
+PDF rasterization backends.
+
+Pages are rendered one at a time into RGB numpy arrays. The PyMuPDF backend
+renders straight from the byte buffer in-process; the pdf2image backend
+shells out to poppler and needs a file on disk.
+"""
+
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from enum import Enum
+from typing import Collection, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class RasterBackend(Enum):
+    """Available PDF rasterization backends."""
+    PYMUPDF = "pymupdf"
+    PDF2IMAGE = "pdf2image"
+
+
+def get_default_backend() -> RasterBackend:
+    """Resolve the default backend from OCR_RASTER_BACKEND (pymupdf if unset)."""
+    backend_name = os.environ.get("OCR_RASTER_BACKEND", RasterBackend.PYMUPDF.value).strip().lower()
+    try:
+        return RasterBackend(backend_name)
+    except ValueError:
+        logger.warning(f"Unknown OCR_RASTER_BACKEND '{backend_name}', falling back to pymupdf")
+        return RasterBackend.PYMUPDF
+
+
+def _iter_pages_pymupdf(
+    pdf_input: Union[str, bytes],
+    dpi: int,
+    pages: Optional[Collection[int]],
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Render pages with PyMuPDF directly from a path or an in-memory buffer."""
+    import pymupdf
+
+    if isinstance(pdf_input, str):
+        document = pymupdf.open(pdf_input)
+    else:
+        document = pymupdf.open(stream=pdf_input, filetype="pdf")
+
+    try:
+        for page_index in range(document.page_count):
+            if pages is not None and page_index + 1 not in pages:
+                continue
+            page = document.load_page(page_index)
+            pixmap = page.get_pixmap(dpi=dpi, colorspace=pymupdf.csRGB, alpha=False)
+            # Copy once out of the pixmap buffer so the array owns its memory
+            image = np.frombuffer(pixmap.samples_mv, dtype=np.uint8).reshape(
+                pixmap.height, pixmap.width, pixmap.n
+            ).copy()
+            del pixmap, page
+            yield page_index + 1, image
+            del image
+    finally:
+        document.close()
+
+
+@contextmanager
+def _pdf_path(pdf_input: Union[str, bytes]) -> Iterator[str]:
+    """Yield a filesystem path for the PDF, spilling bytes to a temporary file if needed."""
+    if isinstance(pdf_input, str):
+        yield pdf_input
+        return
+
+    temp_file = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+    temp_path = temp_file.name
+    temp_file.write(pdf_input)
+    temp_file.close()
+
+    try:
+        yield temp_path
+    finally:
+        # Clean up temporary file
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+
+def _iter_pages_pdf2image(
+    pdf_input: Union[str, bytes],
+    dpi: int,
+    pages: Optional[Collection[int]],
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Render pages with poppler via pdf2image, one page per subprocess call."""
+    from pdf2image import convert_from_path, pdfinfo_from_path
+
+    with _pdf_path(pdf_input) as pdf_path:
+        try:
+            page_count = int(pdfinfo_from_path(pdf_path)["Pages"])
+        except Exception as e:
+            logger.error(f"Failed to read PDF info: {e}")
+            raise
+
+        for page_num in range(1, page_count + 1):
+            if pages is not None and page_num not in pages:
+                continue
+            try:
+                page_images = convert_from_path(pdf_path, dpi=dpi, first_page=page_num, last_page=page_num)
+            except Exception as e:
+                logger.error(f"Failed to convert page {page_num} of PDF: {e}")
+                raise
+            if not page_images:
+                continue
+            image = np.asarray(page_images[0].convert("RGB"))
+            del page_images
+            yield page_num, image
+            # Release this page before the next one is rasterized
+            del image
+
+
+def get_page_count(pdf_input: Union[str, bytes]) -> int:
+    """Return the number of pages in a PDF without rendering anything."""
+    import pymupdf
+
+    if isinstance(pdf_input, str):
+        document = pymupdf.open(pdf_input)
+    else:
+        document = pymupdf.open(stream=pdf_input, filetype="pdf")
+    try:
+        return document.page_count
+    finally:
+        document.close()
+
+
+def iter_page_images(
+    pdf_input: Union[str, bytes],
+    dpi: int,
+    backend: Optional[RasterBackend] = None,
+    pages: Optional[Collection[int]] = None,
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Rasterize a PDF one page at a time.
+
+    Only a single page bitmap is alive at any point, so memory stays flat
+    regardless of the page count.
+
+    Args:
+        pdf_input: Either a path to the PDF file (str) or PDF bytes
+        dpi: Rasterization resolution
+        backend: Rasterization backend (defaults to OCR_RASTER_BACKEND)
+        pages: Optional page numbers (1-based) to render; all pages if None
+
+    Yields:
+        Tuples of (page_num, RGB image as HxWx3 uint8 array), page numbers starting at 1
+    """
+    backend = backend or get_default_backend()
+    if isinstance(pdf_input, str):
+        logger.info(f"Rasterizing PDF from file path with {backend.value}: {pdf_input}")
+    else:
+        logger.info(f"Rasterizing PDF from bytes with {backend.value} (size: {len(pdf_input)} bytes)")
+
+    if backend == RasterBackend.PDF2IMAGE:
+        yield from _iter_pages_pdf2image(pdf_input, dpi, pages)
+    else:
+        yield from _iter_pages_pymupdf(pdf_input, dpi, pages)
+
+
+def render_page_images(
+    pdf_input: Union[str, bytes],
+    dpi: int,
+    backend: Optional[RasterBackend] = None,
+) -> List[np.ndarray]:
+    """
+    Rasterize every page of a PDF into a list of RGB arrays.
+
+    Prefer iter_page_images for large documents; this holds all pages in memory.
+
+    Args:
+        pdf_input: Either a path to the PDF file (str) or PDF bytes
+        dpi: Rasterization resolution
+        backend: Rasterization backend (defaults to OCR_RASTER_BACKEND)
+
+    Returns:
+        List of RGB images as HxWx3 uint8 arrays
+    """
+    return [image for _, image in iter_page_images(pdf_input, dpi, backend)]
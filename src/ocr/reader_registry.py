@@ -0,0 +1,123 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LANGUAGES: Tuple[str, ...] = ("en",)
+
+ReaderKey = Tuple[Tuple[str, ...], Tuple[Tuple[str, Any], ...]]
+
+
+@dataclass
+class ReaderStats:
+    """Load and usage statistics for a single cached EasyOCR reader."""
+    load_seconds: float
+    hits: int = 0
+
+
+class ReaderRegistry:
+    """
+    Process-wide cache of EasyOCR readers.
+
+    Loading an ``easyocr.Reader`` pulls the detector and recognizer weights from
+    disk, which takes seconds. The registry loads each reader once per process,
+    keyed by language list and model options, and hands out the same instance
+    to every subsequent caller.
+    """
+
+    def __init__(self) -> None:
+        self._readers: Dict[ReaderKey, Any] = {}
+        self._stats: Dict[ReaderKey, ReaderStats] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(languages: Sequence[str], options: Dict[str, Any]) -> ReaderKey:
+        return tuple(languages), tuple(sorted(options.items()))
+
+    def get_reader(self, languages: Sequence[str] = DEFAULT_LANGUAGES, **options: Any) -> Any:
+        """
+        Return a cached EasyOCR reader, loading it on first use.
+
+        Args:
+            languages: Language codes passed to ``easyocr.Reader``
+            **options: Additional ``easyocr.Reader`` keyword arguments (e.g. gpu)
+
+        Returns:
+            The shared ``easyocr.Reader`` instance for this key
+        """
+        key = self._make_key(languages, options)
+
+        reader = self._readers.get(key)
+        if reader is not None:
+            with self._lock:
+                self._stats[key].hits += 1
+            return reader
+
+        with self._lock:
+            reader = self._readers.get(key)
+            if reader is not None:
+                self._stats[key].hits += 1
+                return reader
+
+            import easyocr
+
+            logger.info(f"Loading EasyOCR reader for languages={list(languages)} options={options}")
+            start_time = time.perf_counter()
+            reader = easyocr.Reader(list(languages), **options)
+            load_seconds = time.perf_counter() - start_time
+            logger.info(f"EasyOCR reader loaded in {load_seconds:.2f}s")
+
+            self._readers[key] = reader
+            self._stats[key] = ReaderStats(load_seconds=load_seconds)
+            return reader
+
+    def warm_up(self, languages: Sequence[str] = DEFAULT_LANGUAGES, **options: Any) -> None:
+        """Load a reader ahead of the first document so no request pays the load cost."""
+        self.get_reader(languages, **options)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Report load time and hit counts for every cached reader.
+
+        Returns:
+            Dictionary keyed by a readable reader description with load_seconds and hits
+        """
+        with self._lock:
+            report = {}
+            for (languages, options), reader_stats in self._stats.items():
+                description = "+".join(languages)
+                if options:
+                    description += " " + ",".join(f"{name}={value}" for name, value in options)
+                report[description] = {
+                    "load_seconds": reader_stats.load_seconds,
+                    "hits": reader_stats.hits,
+                }
+            return report
+
+    def clear(self) -> None:
+        """Drop all cached readers (mainly for tests)."""
+        with self._lock:
+            self._readers.clear()
+            self._stats.clear()
+
+
+_registry: Optional[ReaderRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_reader_registry() -> ReaderRegistry:
+    """Get the process-wide ReaderRegistry instance."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ReaderRegistry()
+    return _registry
+
+
+def get_reader(languages: Sequence[str] = DEFAULT_LANGUAGES, **options: Any) -> Any:
+    """Get a cached EasyOCR reader from the process-wide registry."""
+    return get_reader_registry().get_reader(languages, **options)
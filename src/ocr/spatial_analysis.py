@@ -1,10 +1,21 @@
 from typing import List, Dict, Any
 
+import numpy as np
+
+from .geometry import BoxArray
+
 
 def detect_lines_on_same_row(ocr_lines: List[Dict[str, Any]], tolerance: float = 15.0) -> List[List[Dict[str, Any]]]:
     """
     Simple and conservative row detection to avoid mixing up table structure.
     
+    Lines are taken as seeds in their original order; each seed collects every
+    not yet grouped line whose vertical center is within tolerance and within
+    half the average height of the seed's center. Centers, heights and each
+    seed's tolerance window over the sorted y-centers are computed up front in
+    one vectorized pass; the window walk skips lines that are already grouped,
+    so dense pages stay close to O(n log n).
+    
     Args:
         ocr_lines: List of OCR results with bbox information
         tolerance: Maximum vertical distance for same-row detection
@@ -12,37 +23,77 @@ def detect_lines_on_same_row(ocr_lines: List[Dict[str, Any]], tolerance: float =
     Returns:
         List of grouped lines, where each group contains elements on the same row
     """
+    line_count = len(ocr_lines)
+    if line_count == 0:
+        return []
+    
+    boxes = BoxArray.from_bboxes([line['bbox'] for line in ocr_lines])
+    y_centers = boxes.y_centers
+    order = np.argsort(y_centers, kind="stable")
+    sorted_y_centers = y_centers[order]
+    
+    # Widen the search windows slightly; the exact criteria are applied below
+    margin = tolerance + 1e-9 * np.maximum(1.0, np.maximum(np.abs(y_centers), abs(tolerance)))
+    window_starts = np.searchsorted(sorted_y_centers, y_centers - margin, side="left").tolist()
+    window_ends = np.searchsorted(sorted_y_centers, y_centers + margin, side="right").tolist()
+    
+    # Plain Python scalars are much faster than NumPy scalars in the walk below
+    centers = y_centers.tolist()
+    heights = boxes.heights.tolist()
+    x1 = boxes.x1.tolist()
+    order = order.tolist()
+    sorted_position = [0] * line_count
+    for position, index in enumerate(order):
+        sorted_position[index] = position
+    
+    # next_free[p] points at the next sorted position that may still be ungrouped,
+    # so grouped lines are skipped instead of rescanned
+    next_free = list(range(line_count + 1))
+    
+    def find_free(position: int) -> int:
+        root = position
+        while next_free[root] != root:
+            root = next_free[root]
+        while next_free[position] != root:
+            next_free[position], position = root, next_free[position]
+        return root
+    
+    grouped = [False] * line_count
     grouped_lines = []
-    remaining_lines = ocr_lines.copy()
     
-    while remaining_lines:
-        current_line = remaining_lines.pop(0)
-        current_group = [current_line]
-        current_y_center = (current_line['bbox']['y1'] + current_line['bbox']['y2']) / 2
-        current_height = current_line['bbox']['y2'] - current_line['bbox']['y1']
+    for seed_index in range(line_count):
+        if grouped[seed_index]:
+            continue
+        grouped[seed_index] = True
+        next_free[sorted_position[seed_index]] = sorted_position[seed_index] + 1
+        
+        current_y_center = centers[seed_index]
+        current_height = heights[seed_index]
+        window_end = window_ends[seed_index]
+        position = find_free(window_starts[seed_index])
         
-        # Find lines that are clearly on the same row (conservative approach)
-        lines_to_remove = []
-        for i, line in enumerate(remaining_lines):
-            line_y_center = (line['bbox']['y1'] + line['bbox']['y2']) / 2
-            line_height = line['bbox']['y2'] - line['bbox']['y1']
+        members = []
+        while position < window_end:
+            index = order[position]
             
             # Conservative same-row criteria
-            center_distance = abs(current_y_center - line_y_center)
-            avg_height = (current_height + line_height) / 2
+            center_distance = abs(current_y_center - centers[index])
+            avg_height = (current_height + heights[index]) / 2
             
             # Only group if centers are very close
             if center_distance < tolerance and center_distance < avg_height * 0.5:
-                current_group.append(line)
-                lines_to_remove.append(i)
+                members.append(index)
+                grouped[index] = True
+                next_free[position] = position + 1
+            position = find_free(position + 1)
         
-        # Remove grouped lines
-        for i in reversed(lines_to_remove):
-            remaining_lines.pop(i)
+        # Keep the original order within the row before the stable x sort
+        members.sort()
+        group_indices = [seed_index] + members
         
         # Sort by x-coordinate
-        current_group.sort(key=lambda x: x['bbox']['x1'])
-        grouped_lines.append(current_group)
+        group_indices.sort(key=x1.__getitem__)
+        grouped_lines.append([ocr_lines[index] for index in group_indices])
     
     return grouped_lines
 
@@ -0,0 +1,147 @@
+"""
+Native text-layer extraction for digitally generated PDFs.
+
+Pages that already carry extractable text are turned into OCR-style records
+({text, confidence, bbox, page_num}) straight from the PDF, so they never go
+through neural OCR. Scanned or image-only pages return None and fall back to
+EasyOCR.
+"""
+
+import logging
+import os
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Pages with fewer visible characters are treated as scanned / image-only
+MIN_TEXT_CHARS = 20
+# Pages where more than this share of characters failed to decode are re-OCR'd
+MAX_UNDECODABLE_RATIO = 0.1
+# Words on the same PDF line are split into separate elements at gaps wider
+# than this multiple of the line height (mirrors EasyOCR phrase boxes)
+PHRASE_GAP_FACTOR = 1.0
+# Text-layer records are exact, so they get full confidence
+TEXT_LAYER_CONFIDENCE = 1.0
+
+_INVISIBLE_CHARS = {"\u200b": "", "\u200c": "", "\u200d": "", "\ufeff": "", "\u2003": " ", "\u00a0": " "}
+
+
+def is_text_layer_enabled() -> bool:
+    """Whether the text-layer fast path is enabled (OCR_USE_TEXT_LAYER, default true)."""
+    return os.environ.get("OCR_USE_TEXT_LAYER", "true").strip().lower() == "true"
+
+
+def _clean_word(word: str) -> str:
+    for char, replacement in _INVISIBLE_CHARS.items():
+        word = word.replace(char, replacement)
+    return word.strip()
+
+
+def _has_usable_text(words: List[Tuple]) -> bool:
+    """Decide whether a page's text layer is good enough to skip OCR."""
+    text = "".join(_clean_word(word[4]) for word in words)
+    if len(text) < MIN_TEXT_CHARS:
+        return False
+    undecodable = text.count("\ufffd")
+    return undecodable / len(text) <= MAX_UNDECODABLE_RATIO
+
+
+def _words_to_records(words: List[Tuple], page_num: int, scale: float) -> List[Dict[str, Any]]:
+    """
+    Merge PDF words into phrase-level records in OCR pixel coordinates.
+
+    Args:
+        words: PyMuPDF word tuples (x0, y0, x1, y1, text, block_no, line_no, word_no)
+        page_num: Page number (1-based)
+        scale: Factor from PDF points to pixels at the OCR resolution
+
+    Returns:
+        List of dictionaries with text, bbox, confidence, page_num
+    """
+    records: List[Dict[str, Any]] = []
+
+    def flush(phrase: List[Tuple]) -> None:
+        text = " ".join(_clean_word(word[4]) for word in phrase).strip()
+        if not text:
+            return
+        x1 = min(word[0] for word in phrase) * scale
+        y1 = min(word[1] for word in phrase) * scale
+        x2 = max(word[2] for word in phrase) * scale
+        y2 = max(word[3] for word in phrase) * scale
+        records.append({
+            "page_num": page_num,
+            "text": text,
+            "confidence": TEXT_LAYER_CONFIDENCE,
+            "bbox": {
+                "x1": x1,
+                "y1": y1,
+                "x2": x2,
+                "y2": y2,
+                "width": x2 - x1,
+                "height": y2 - y1
+            }
+        })
+
+    for _, line_words in groupby(words, key=lambda word: (word[5], word[6])):
+        line_words = sorted(line_words, key=lambda word: word[0])
+        line_height = max(word[3] - word[1] for word in line_words)
+        phrase = [line_words[0]]
+        for previous_word, word in zip(line_words, line_words[1:]):
+            if word[0] - previous_word[2] > PHRASE_GAP_FACTOR * line_height:
+                flush(phrase)
+                phrase = []
+            phrase.append(word)
+        flush(phrase)
+
+    return records
+
+
+def extract_text_layer_page(page, page_num: int, dpi: int) -> Optional[List[Dict[str, Any]]]:
+    """
+    Extract OCR-style records from one PyMuPDF page's text layer.
+
+    Args:
+        page: PyMuPDF page
+        page_num: Page number (1-based)
+        dpi: OCR resolution the bounding boxes are scaled to
+
+    Returns:
+        List of records, or None if the page needs neural OCR
+    """
+    words = [word for word in page.get_text("words") if _clean_word(word[4])]
+    if not _has_usable_text(words):
+        return None
+    return _words_to_records(words, page_num, dpi / 72.0)
+
+
+def extract_text_layer(pdf_input: Union[str, bytes], dpi: int) -> Dict[int, Optional[List[Dict[str, Any]]]]:
+    """
+    Run the text-layer check on every page of a PDF.
+
+    Args:
+        pdf_input: Either a path to the PDF file (str) or PDF bytes
+        dpi: OCR resolution the bounding boxes are scaled to
+
+    Returns:
+        Mapping of page number to records, or to None for pages that need OCR
+    """
+    import pymupdf
+
+    if isinstance(pdf_input, str):
+        document = pymupdf.open(pdf_input)
+    else:
+        document = pymupdf.open(stream=pdf_input, filetype="pdf")
+
+    try:
+        pages: Dict[int, Optional[List[Dict[str, Any]]]] = {}
+        for page_index in range(document.page_count):
+            page_num = page_index + 1
+            try:
+                pages[page_num] = extract_text_layer_page(document.load_page(page_index), page_num, dpi)
+            except Exception as e:
+                logger.warning(f"Text layer extraction failed on page {page_num}, falling back to OCR: {e}")
+                pages[page_num] = None
+        return pages
+    finally:
+        document.close()
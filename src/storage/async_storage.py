@@ -0,0 +1,291 @@
+"""
+Asyncio blob storage on the ``azure.storage.blob.aio`` SDK.
+
+Mirrors the read/write surface of ``BlobStorage`` for code running on an
+event loop (the API routes and upload background task), so blob round trips
+do not block the loop and independent downloads can run concurrently. All
+clients share one aiohttp session, i.e. one connection pool to the storage
+account.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+import aiohttp
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.storage.blob.aio import BlobClient, BlobServiceClient
+
+from .encoding import (
+    CONTENT_ENCODING_METADATA_KEY, IDENTITY, ContentDecoder, decode_content, default_content_encoding,
+    encode_content, encoding_from_metadata
+)
+from .storage import Stage, build_blob_path, build_document_envelope, get_storage
+
+logger = logging.getLogger(__name__)
+
+# Range size of streamed reads; bounds the memory held per open stream
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class AsyncBlobStorage:
+    """
+    Blob storage operations for async code.
+
+    The aiohttp session and service client are bound to the event loop they
+    were created on; they are created lazily on first use and recreated if
+    the storage is used from a different loop.
+    """
+
+    def __init__(self, connection_string: Optional[str] = None) -> None:
+        """
+        Args:
+            connection_string: Storage connection string (defaults to the one
+                resolved by BlobStorage for the current environment)
+        """
+        self._connection_string = connection_string
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._blob_service_client: Optional[BlobServiceClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._initialized_containers: Set[str] = set()
+        self._container_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def connection_string(self) -> str:
+        if self._connection_string is None:
+            self._connection_string = get_storage().connection_string
+        return self._connection_string
+
+    @property
+    def blob_service_client(self) -> BlobServiceClient:
+        """Service client for the running event loop, creating the shared session if needed."""
+        loop = asyncio.get_running_loop()
+        if self._blob_service_client is None or self._loop is not loop:
+            if self._loop is not None and self._loop is not loop:
+                # The old session cannot be closed from another loop; drop it
+                logger.warning("AsyncBlobStorage used from a new event loop, recreating its session")
+            self._session = aiohttp.ClientSession()
+            transport = AioHttpTransport(session=self._session, session_owner=False)
+            self._blob_service_client = BlobServiceClient.from_connection_string(
+                self.connection_string, transport=transport
+            )
+            self._loop = loop
+            self._container_lock = asyncio.Lock()
+        return self._blob_service_client
+
+    async def close(self) -> None:
+        """Close the service client and the shared session."""
+        if self._blob_service_client is not None:
+            await self._blob_service_client.close()
+        if self._session is not None:
+            await self._session.close()
+        self._blob_service_client = None
+        self._session = None
+        self._loop = None
+
+    async def _ensure_container_exists(self, container_name: str) -> None:
+        """Create a container once per process (subsequent calls are free)."""
+        if container_name in self._initialized_containers:
+            return
+        client = self.blob_service_client
+        async with self._container_lock:
+            if container_name in self._initialized_containers:
+                return
+            try:
+                await client.get_container_client(container_name).create_container()
+                logger.info(f"Container '{container_name}' created successfully")
+            except ResourceExistsError:
+                pass
+            self._initialized_containers.add(container_name)
+
+    def blob_client(self, uuid: str, stage: Stage, ext: str) -> BlobClient:
+        """
+        Get an async blob client for a document at a specific stage.
+
+        Args:
+            uuid: Document UUID
+            stage: Processing stage
+            ext: File extension (e.g., '.pdf', '.json')
+
+        Returns:
+            BlobClient for the specified blob
+        """
+        container_client = self.blob_service_client.get_container_client(stage.value)
+        return container_client.get_blob_client(str(build_blob_path(uuid, ext)))
+
+    async def upload_blob(
+        self,
+        uuid: str,
+        stage: Stage,
+        ext: str,
+        data: bytes,
+        overwrite: bool = True,
+        content_encoding: Optional[str] = None
+    ) -> None:
+        """
+        Upload data to a blob at a specific stage.
+
+        Args:
+            uuid: Document UUID
+            stage: Processing stage
+            ext: File extension
+            data: Data to upload
+            overwrite: Whether to overwrite existing blob
+            content_encoding: Compress with gzip or zstd and record it in the blob metadata
+        """
+        await self._ensure_container_exists(stage.value)
+        blob_client = self.blob_client(uuid, stage, ext)
+        if content_encoding and content_encoding != IDENTITY:
+            await blob_client.upload_blob(
+                encode_content(data, content_encoding),
+                overwrite=overwrite,
+                metadata={CONTENT_ENCODING_METADATA_KEY: content_encoding}
+            )
+        else:
+            await blob_client.upload_blob(data, overwrite=overwrite)
+        logger.info(f"Uploaded blob: {stage.value}/{build_blob_path(uuid, ext)}")
+
+    async def upload_document_data(
+        self,
+        uuid: str,
+        stage: Stage,
+        ext: str,
+        data: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+        overwrite: bool = True,
+        content_encoding: Optional[str] = None
+    ) -> None:
+        """
+        Upload document data with the standardized structure used by BlobStorage.
+
+        Args:
+            uuid: Document UUID
+            stage: Processing stage
+            ext: File extension
+            data: The actual data to store
+            metadata: Optional metadata
+            overwrite: Whether to overwrite existing blob
+            content_encoding: gzip, zstd or identity (defaults to BLOB_CONTENT_ENCODING, gzip)
+        """
+        standardized_data = build_document_envelope(uuid, data, metadata)
+        blob_data = json.dumps(standardized_data, indent=2, ensure_ascii=False).encode('utf-8')
+        await self.upload_blob(uuid, stage, ext, blob_data, overwrite, content_encoding or default_content_encoding())
+
+    async def download_blob(self, uuid: str, stage: Stage, ext: str) -> Optional[bytes]:
+        """
+        Download data from a blob at a specific stage.
+
+        Args:
+            uuid: Document UUID
+            stage: Processing stage
+            ext: File extension
+
+        Returns:
+            Blob data as bytes or None if not found
+        """
+        try:
+            stream = await self.blob_client(uuid, stage, ext).download_blob()
+            # Compressed blobs record their encoding; older blobs are returned as stored
+            return decode_content(await stream.readall(), encoding_from_metadata(stream.properties.metadata))
+        except ResourceNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to download blob {stage.value}/{build_blob_path(uuid, ext)}: {e}")
+            return None
+
+    async def open_blob_stream(
+        self, uuid: str, stage: Stage, ext: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Optional[AsyncIterator[bytes]]:
+        """
+        Open a blob for reading in fixed-size ranges, decoding compressed blobs on the fly.
+
+        The first range is requested immediately so a missing blob is reported
+        before any data is consumed; each further range is one request, made
+        when the previous chunk has been consumed.
+
+        Args:
+            uuid: Document UUID
+            stage: Processing stage
+            ext: File extension
+            chunk_size: Bytes per range request
+
+        Returns:
+            Async iterator over the blob content, or None if not found
+        """
+        blob_client = self.blob_client(uuid, stage, ext)
+        try:
+            first_range = await blob_client.download_blob(offset=0, length=chunk_size)
+        except ResourceNotFoundError:
+            return None
+        # content_range is "bytes <start>-<end>/<blob size>"
+        blob_size = int(first_range.properties.content_range.rsplit("/", 1)[1])
+        decoder = ContentDecoder(encoding_from_metadata(first_range.properties.metadata))
+
+        async def iter_ranges() -> AsyncIterator[bytes]:
+            yield decoder.decode(await first_range.readall())
+            offset = chunk_size
+            while offset < blob_size:
+                next_range = await blob_client.download_blob(offset=offset, length=chunk_size)
+                yield decoder.decode(await next_range.readall())
+                offset += chunk_size
+
+        return iter_ranges()
+
+    async def download_document_data(self, uuid: str, stage: Stage, ext: str) -> Optional[Dict[str, Any]]:
+        """
+        Download and parse document data with standardized structure.
+
+        Args:
+            uuid: Document UUID
+            stage: Processing stage
+            ext: File extension
+
+        Returns:
+            Parsed document data dictionary or None if not found
+        """
+        blob_bytes = await self.download_blob(uuid, stage, ext)
+        if blob_bytes is None:
+            return None
+        try:
+            return json.loads(blob_bytes.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to parse document data: {e}")
+            return None
+
+    async def blob_exists(self, uuid: str, stage: Stage, ext: str) -> bool:
+        """
+        Check if a blob exists at a specific stage.
+
+        Args:
+            uuid: Document UUID
+            stage: Processing stage
+            ext: File extension
+
+        Returns:
+            True if blob exists, False otherwise
+        """
+        try:
+            return await self.blob_client(uuid, stage, ext).exists()
+        except Exception:
+            return False
+
+    async def list_blobs_in_stage(self, stage: Stage) -> List[str]:
+        """
+        List all blobs in a specific stage container.
+
+        Args:
+            stage: Processing stage
+
+        Returns:
+            List of blob names in the stage container
+        """
+        container_client = self.blob_service_client.get_container_client(stage.value)
+        try:
+            return [name async for name in container_client.list_blob_names()]
+        except ResourceNotFoundError:
+            return []
+        except Exception as e:
+            logger.warning(f"Failed to list blobs in container {stage.value}: {e}")
+            return []
@@ -3,12 +3,20 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 
 from .storage import get_storage, Stage
+from .ocr_codec import OCR_COLUMNAR_EXT
+from ..integration.ocr_index import delete_ocr_page_index
+
+# OCR artifact extensions: JSON and the columnar format
+OCR_ARTIFACT_EXTS = (".json", OCR_COLUMNAR_EXT)
 
 
 def delete_ocr_results_from_bucket(document_uuid: str) -> bool:
     """
     Delete OCR results from blob storage bucket.
     
+    Removes the OCR artifact in every stored format, and the page index used
+    by paginated /results queries together with all of its page shards.
+    
     Args:
         document_uuid: Unique identifier for the document
         
@@ -17,7 +25,9 @@ def delete_ocr_results_from_bucket(document_uuid: str) -> bool:
     """
     storage_client = get_storage()
     
-    success = storage_client.delete_blob(document_uuid, Stage.OCR, ".json")
+    deleted = [storage_client.delete_blob(document_uuid, Stage.OCR, ext) for ext in OCR_ARTIFACT_EXTS]
+    deleted.append(delete_ocr_page_index(document_uuid, storage_client))
+    success = any(deleted)
     
     if success:
         print(f"OCR results deleted from bucket for document: {document_uuid}")
@@ -39,12 +49,13 @@ def list_ocr_results_in_bucket() -> list[str]:
     try:
         blob_names = storage_client.list_blobs_in_stage(Stage.OCR)
         
-        # Extract UUIDs from blob names (remove .json extension)
+        # Extract UUIDs from artifact names (page shards and indexes carry a second suffix)
         document_uuids = []
         for blob_name in blob_names:
-            if blob_name.endswith('.json'):
-                uuid_part = blob_name.replace('.json', '')
-                document_uuids.append(uuid_part)
+            for ext in OCR_ARTIFACT_EXTS:
+                uuid_part = blob_name[:-len(ext)]
+                if blob_name.endswith(ext) and '.' not in uuid_part and uuid_part not in document_uuids:
+                    document_uuids.append(uuid_part)
         
         print(f"Found {len(document_uuids)} OCR result files in bucket")
         return document_uuids
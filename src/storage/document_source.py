@@ -0,0 +1,33 @@
+import logging
+from typing import Optional
+
+from ..dms.adapters import AzureBlobStorageClient
+from ..dms.service import CONTENT_ADDRESSED_PREFIX
+from .storage import Stage, get_storage
+
+logger = logging.getLogger(__name__)
+
+
+def load_document_pdf(document_id: str, blob_path: Optional[str] = None) -> Optional[bytes]:
+    """
+    Read the PDF a pipeline run works on.
+
+    Documents uploaded through the API exist only in the DMS "documents"
+    container, at the content-addressed ``blob_path`` of their DMS record
+    (raw/sha256/<hash>.pdf). Documents written straight to the processing
+    storage (the notebook flow) are read from the raw stage.
+
+    Args:
+        document_id: Unique identifier for the document
+        blob_path: blob_path of the document's DMS record, if known
+
+    Returns:
+        PDF bytes, or None if the document is in neither location
+    """
+    storage_client = get_storage()
+    if blob_path and blob_path.startswith(CONTENT_ADDRESSED_PREFIX):
+        pdf_data = AzureBlobStorageClient(storage_client.blob_service_client).download_bytes("documents", blob_path)
+        if pdf_data is not None:
+            return pdf_data
+        logger.warning(f"DMS blob {blob_path} not found for document {document_id}, trying the raw stage")
+    return storage_client.download_blob(document_id, Stage.RAW, ".pdf")
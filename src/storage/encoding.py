@@ -0,0 +1,117 @@
+"""
+Content encodings for stored blobs.
+
+Blobs written with an encoding carry it in their blob metadata under
+``content_encoding``; readers decode them transparently. Blobs without the
+metadata entry (everything written before compression existed) are read as
+stored. gzip is always available; zstd needs the optional ``zstandard``
+package.
+"""
+
+import gzip
+import os
+import zlib
+from typing import Dict, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CONTENT_ENCODING_METADATA_KEY = "content_encoding"
+IDENTITY = "identity"
+GZIP = "gzip"
+ZSTD = "zstd"
+CONTENT_ENCODINGS = (IDENTITY, GZIP, ZSTD)
+
+
+def default_content_encoding() -> str:
+    """
+    Encoding for new JSON artifacts, from BLOB_CONTENT_ENCODING (gzip by default).
+
+    Returns:
+        One of CONTENT_ENCODINGS
+    """
+    encoding = os.environ.get("BLOB_CONTENT_ENCODING", GZIP).strip().lower() or GZIP
+    if encoding in ("none", ""):
+        return IDENTITY
+    if encoding not in CONTENT_ENCODINGS:
+        raise ValueError(f"Unknown blob content encoding: {encoding}")
+    return encoding
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise ValueError("zstd content encoding requires the zstandard package")
+
+
+def encode_content(data: bytes, encoding: str) -> bytes:
+    """
+    Compress data with a content encoding.
+
+    Args:
+        data: Raw bytes
+        encoding: One of CONTENT_ENCODINGS
+
+    Returns:
+        Encoded bytes
+    """
+    if encoding == GZIP:
+        # mtime=0 keeps the output deterministic for identical input
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if encoding == ZSTD:
+        _require_zstandard()
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    if encoding == IDENTITY:
+        return data
+    raise ValueError(f"Unknown blob content encoding: {encoding}")
+
+
+def decode_content(data: bytes, encoding: Optional[str]) -> bytes:
+    """
+    Decompress data stored with a content encoding.
+
+    Args:
+        data: Stored bytes
+        encoding: Recorded encoding (None or identity for uncompressed blobs)
+
+    Returns:
+        Raw bytes
+    """
+    if encoding in (None, "", IDENTITY):
+        return data
+    if encoding == GZIP:
+        return gzip.decompress(data)
+    if encoding == ZSTD:
+        _require_zstandard()
+        # Streaming decompression also handles frames written without a content size
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    raise ValueError(f"Unknown blob content encoding: {encoding}")
+
+
+def encoding_from_metadata(metadata: Optional[Dict[str, str]]) -> Optional[str]:
+    """Content encoding recorded in blob metadata, if any."""
+    if not isinstance(metadata, dict):
+        return None
+    return metadata.get(CONTENT_ENCODING_METADATA_KEY)
+
+
+class ContentDecoder:
+    """Incremental decoder for blobs read in chunks."""
+
+    def __init__(self, encoding: Optional[str]) -> None:
+        if encoding in (None, "", IDENTITY):
+            self._decompressor = None
+        elif encoding == GZIP:
+            self._decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        elif encoding == ZSTD:
+            _require_zstandard()
+            self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+        else:
+            raise ValueError(f"Unknown blob content encoding: {encoding}")
+
+    def decode(self, chunk: bytes) -> bytes:
+        """Decode the next chunk of the stored blob."""
+        if self._decompressor is None:
+            return chunk
+        return self._decompressor.decompress(chunk)
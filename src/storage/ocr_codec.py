@@ -0,0 +1,232 @@
+"""
+Columnar, compressed storage format for OCR artifacts.
+
+The JSON artifact stores every OCR line as a pretty-printed object with its
+bounding box twice (corners and width/height) and must be parsed as a whole.
+This format stores the lines of each page as columns (float64 corner
+coordinates and confidences, plus a string table for the text) in an
+independently compressed block. A small header lists the page blocks, so a
+reader can decode one page without touching the others.
+
+Layout (little-endian)::
+
+    b"OCRC" | version u8 | codec u8 | header length u32 | header | page blocks
+
+The header is a compressed JSON object holding the artifact without its
+``original_lines`` (envelope, metadata, normalized lines) and the page table
+(``page_num``, ``count``, ``offset``, ``length`` of each block, offsets
+relative to the end of the header). A page block holds the line count (u32),
+the x1, y1, x2, y2 and confidence columns (float64), the text offsets (u32,
+count + 1) and the UTF-8 text. width/height are recomputed on decode.
+
+Lines are grouped by page, keeping their order within each page. Compression
+is gzip, or zstd when the optional ``zstandard`` package is installed.
+"""
+
+import json
+import struct
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .encoding import GZIP, ZSTD, decode_content, encode_content, zstandard
+
+OCR_COLUMNAR_EXT = ".ocrc"
+MAGIC = b"OCRC"
+FORMAT_VERSION = 1
+CODECS = {GZIP: 0, ZSTD: 1}
+
+_PREAMBLE = struct.Struct("<4sBBI")
+_COUNT = struct.Struct("<I")
+_COLUMNS = ("x1", "y1", "x2", "y2")
+
+
+def default_codec() -> str:
+    """zstd when available, gzip otherwise."""
+    return ZSTD if zstandard is not None else GZIP
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    return encode_content(data, codec)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    return decode_content(data, codec)
+
+
+def _columns_size(count: int) -> int:
+    """Bytes taken by the float64 columns of a page with count lines."""
+    return 8 * (len(_COLUMNS) + 1) * count
+
+
+def _encode_page(lines: List[Dict[str, Any]]) -> bytes:
+    count = len(lines)
+    columns = np.empty((len(_COLUMNS) + 1, count), dtype="<f8")
+    for row, key in enumerate(_COLUMNS):
+        columns[row] = [line["bbox"][key] for line in lines]
+    columns[-1] = [line["confidence"] for line in lines]
+
+    texts = [line["text"].encode("utf-8") for line in lines]
+    offsets = np.zeros(count + 1, dtype="<u4")
+    offsets[1:] = np.cumsum([len(text) for text in texts])
+    return _COUNT.pack(count) + columns.tobytes() + offsets.tobytes() + b"".join(texts)
+
+
+def _decode_page(block: bytes, page_num: int) -> List[Dict[str, Any]]:
+    (count,) = _COUNT.unpack_from(block)
+    position = _COUNT.size
+    columns = np.frombuffer(block, dtype="<f8", count=(len(_COLUMNS) + 1) * count, offset=position)
+    columns = columns.reshape(len(_COLUMNS) + 1, count).tolist()
+    position += _columns_size(count)
+    offsets = np.frombuffer(block, dtype="<u4", count=count + 1, offset=position).tolist()
+    text_blob = block[position + 4 * (count + 1):]
+
+    x1s, y1s, x2s, y2s, confidences = columns
+    return [
+        {
+            "page_num": page_num,
+            "text": text_blob[offsets[index]:offsets[index + 1]].decode("utf-8"),
+            "confidence": confidences[index],
+            "bbox": {
+                "x1": x1s[index],
+                "y1": y1s[index],
+                "x2": x2s[index],
+                "y2": y2s[index],
+                "width": x2s[index] - x1s[index],
+                "height": y2s[index] - y1s[index],
+            },
+        }
+        for index in range(count)
+    ]
+
+
+def encode_ocr_artifact(document: Dict[str, Any], codec: Optional[str] = None) -> bytes:
+    """
+    Encode a stored OCR artifact in the columnar format.
+
+    Args:
+        document: Artifact as written by upload_document_data (lines under
+            ``data.original_lines``) or the bare OCR results
+        codec: "gzip" or "zstd" (defaults to default_codec())
+
+    Returns:
+        Encoded artifact
+    """
+    codec = codec or default_codec()
+    if codec not in CODECS:
+        raise ValueError(f"Unknown OCR artifact codec: {codec}")
+
+    has_envelope = "data" in document
+    data = document["data"] if has_envelope else document
+    pages: Dict[int, List[Dict[str, Any]]] = {}
+    for line in data.get("original_lines", []):
+        pages.setdefault(line["page_num"], []).append(line)
+
+    blocks = []
+    page_table = []
+    offset = 0
+    for page_num in sorted(pages):
+        block = _compress(_encode_page(pages[page_num]), codec)
+        page_table.append({"page_num": page_num, "count": len(pages[page_num]), "offset": offset, "length": len(block)})
+        blocks.append(block)
+        offset += len(block)
+
+    rest = {key: value for key, value in data.items() if key != "original_lines"}
+    if has_envelope:
+        rest = {**document, "data": rest}
+    header = {"has_envelope": has_envelope, "document": rest, "pages": page_table}
+    header_bytes = _compress(json.dumps(header, separators=(",", ":"), ensure_ascii=False).encode("utf-8"), codec)
+    preamble = _PREAMBLE.pack(MAGIC, FORMAT_VERSION, CODECS[codec], len(header_bytes))
+    return preamble + header_bytes + b"".join(blocks)
+
+
+def is_columnar_artifact(blob: bytes) -> bool:
+    """Whether blob starts like a columnar OCR artifact."""
+    return blob[:len(MAGIC)] == MAGIC
+
+
+class ColumnarOcrArtifact:
+    """
+    Lazily decoded columnar OCR artifact.
+
+    Only the header is decompressed on construction; page blocks are
+    decompressed when their lines are requested.
+    """
+
+    def __init__(self, blob: bytes) -> None:
+        """
+        Args:
+            blob: Encoded artifact
+
+        Raises:
+            ValueError: If blob is not a supported columnar OCR artifact
+        """
+        if len(blob) < _PREAMBLE.size:
+            raise ValueError("Blob is too short to be a columnar OCR artifact")
+        magic, version, codec_id, header_length = _PREAMBLE.unpack_from(blob)
+        if magic != MAGIC:
+            raise ValueError("Blob is not a columnar OCR artifact")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported columnar OCR artifact version: {version}")
+        self.codec = {value: name for name, value in CODECS.items()}[codec_id]
+        header_end = _PREAMBLE.size + header_length
+        header = json.loads(_decompress(blob[_PREAMBLE.size:header_end], self.codec))
+        self._blob = blob
+        self._blocks_start = header_end
+        self._has_envelope = header["has_envelope"]
+        self._document = header["document"]
+        self.pages: List[Dict[str, Any]] = header["pages"]
+
+    @property
+    def page_numbers(self) -> List[int]:
+        return [entry["page_num"] for entry in self.pages]
+
+    def read_page(self, page_num: int) -> List[Dict[str, Any]]:
+        """
+        Decode the OCR lines of one page.
+
+        Args:
+            page_num: Page number (1-based)
+
+        Returns:
+            OCR lines of the page (empty if the page has none)
+        """
+        for entry in self.pages:
+            if entry["page_num"] == page_num:
+                start = self._blocks_start + entry["offset"]
+                block = _decompress(self._blob[start:start + entry["length"]], self.codec)
+                return _decode_page(block, page_num)
+        return []
+
+    def to_document(self, pages: Optional[Iterable[int]] = None) -> Dict[str, Any]:
+        """
+        Rebuild the artifact in its JSON shape.
+
+        Args:
+            pages: Page numbers whose lines to include (all pages if None)
+
+        Returns:
+            The artifact as written, with ``original_lines`` restricted to pages
+        """
+        selected = set(pages) if pages is not None else None
+        lines = []
+        for page_num in self.page_numbers:
+            if selected is None or page_num in selected:
+                lines.extend(self.read_page(page_num))
+        if not self._has_envelope:
+            return {**self._document, "original_lines": lines}
+        return {**self._document, "data": {**self._document["data"], "original_lines": lines}}
+
+
+def decode_ocr_artifact(blob: bytes, pages: Optional[Iterable[int]] = None) -> Dict[str, Any]:
+    """
+    Decode a columnar OCR artifact back to its JSON shape.
+
+    Args:
+        blob: Encoded artifact
+        pages: Page numbers to decode (all pages if None)
+
+    Returns:
+        The artifact as passed to encode_ocr_artifact (lines of other pages left out)
+    """
+    return ColumnarOcrArtifact(blob).to_document(pages)
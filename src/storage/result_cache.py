@@ -0,0 +1,184 @@
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .storage import BlobStorage, Stage, get_storage
+
+logger = logging.getLogger(__name__)
+
+CACHE_EXT = ".json"
+
+
+def compute_document_hash(file_data: bytes) -> str:
+    """SHA-256 hex digest of the raw document bytes."""
+    return hashlib.sha256(file_data).hexdigest()
+
+
+def compute_pipeline_version(components: Dict[str, Any]) -> str:
+    """
+    Derive a short, stable version string from the settings that shape a result.
+
+    Args:
+        components: JSON-serializable settings (engine, DPI, model name, prompt hash, ...)
+
+    Returns:
+        First 16 hex characters of the SHA-256 of the canonical JSON encoding
+    """
+    canonical = json.dumps(components, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class CacheCounters:
+    """Hit and miss counts for one cache kind."""
+    hits: int = 0
+    misses: int = 0
+
+
+class ResultCache:
+    """
+    Blob-backed cache of pipeline results keyed by document content.
+
+    Entries live in the cache container under ``<kind>/<pipeline_version>/<sha256>.json``,
+    so identical uploads share one result per pipeline version. Changing the
+    pipeline version makes old entries unreachable; ``invalidate`` removes them.
+    """
+
+    def __init__(self, storage: Optional[BlobStorage] = None) -> None:
+        self._storage = storage
+        self._counters: Dict[str, CacheCounters] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def storage(self) -> BlobStorage:
+        if self._storage is None:
+            self._storage = get_storage()
+        return self._storage
+
+    @staticmethod
+    def cache_key(kind: str, document_hash: str, pipeline_version: str) -> str:
+        return f"{kind}/{pipeline_version}/{document_hash}"
+
+    def _count(self, kind: str, hit: bool) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(kind, CacheCounters())
+            if hit:
+                counters.hits += 1
+            else:
+                counters.misses += 1
+
+    def get(self, kind: str, document_hash: str, pipeline_version: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Args:
+            kind: Result kind, e.g. "ocr" or "llm"
+            document_hash: SHA-256 of the document bytes
+            pipeline_version: Version string of the pipeline that produced the result
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        key = self.cache_key(kind, document_hash, pipeline_version)
+        try:
+            # A missing blob comes back as None, so a miss costs one round trip
+            cached = self.storage.download_document_data(key, Stage.CACHE, CACHE_EXT)
+        except Exception as e:
+            logger.warning(f"Result cache lookup failed for {key}: {e}")
+            cached = None
+
+        if not cached or "data" not in cached:
+            self._count(kind, hit=False)
+            return None
+
+        self._count(kind, hit=True)
+        logger.info(f"Result cache hit: {key}")
+        return cached["data"]
+
+    def put(self, kind: str, document_hash: str, pipeline_version: str, data: Dict[str, Any]) -> None:
+        """
+        Store a result. Failures are logged and swallowed; the cache is best-effort.
+
+        Args:
+            kind: Result kind, e.g. "ocr" or "llm"
+            document_hash: SHA-256 of the document bytes
+            pipeline_version: Version string of the pipeline that produced the result
+            data: Result to cache
+        """
+        key = self.cache_key(kind, document_hash, pipeline_version)
+        try:
+            self.storage.upload_document_data(
+                uuid=key,
+                stage=Stage.CACHE,
+                ext=CACHE_EXT,
+                data=data,
+                metadata={
+                    "stage": "cache",
+                    "kind": kind,
+                    "pipeline_version": pipeline_version,
+                    "document_sha256": document_hash,
+                },
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store result cache entry {key}: {e}")
+
+    def invalidate(self, kind: Optional[str] = None, keep_version: Optional[str] = None) -> int:
+        """
+        Delete cache entries.
+
+        Args:
+            kind: Only delete entries of this kind (all kinds if None)
+            keep_version: Keep entries of this pipeline version, e.g. the current one
+
+        Returns:
+            Number of deleted entries
+        """
+        deleted = 0
+        for blob_name in self.storage.list_blobs_in_stage(Stage.CACHE):
+            parts = blob_name.split("/")
+            if len(parts) != 3 or not blob_name.endswith(CACHE_EXT):
+                continue
+            entry_kind, entry_version, _ = parts
+            if kind is not None and entry_kind != kind:
+                continue
+            if keep_version is not None and entry_version == keep_version:
+                continue
+            if self.storage.delete_blob(blob_name[:-len(CACHE_EXT)], Stage.CACHE, CACHE_EXT):
+                deleted += 1
+        logger.info(f"Invalidated {deleted} result cache entries (kind={kind}, kept version={keep_version})")
+        return deleted
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Report hit and miss counts per kind for this process.
+
+        Returns:
+            Dictionary keyed by kind with hits, misses and hit_rate
+        """
+        with self._lock:
+            report = {}
+            for kind, counters in self._counters.items():
+                lookups = counters.hits + counters.misses
+                report[kind] = {
+                    "hits": counters.hits,
+                    "misses": counters.misses,
+                    "hit_rate": counters.hits / lookups if lookups else 0.0,
+                }
+            return report
+
+
+_result_cache: Optional[ResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Get the process-wide ResultCache instance."""
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                _result_cache = ResultCache()
+    return _result_cache
@@ -9,6 +9,11 @@ from datetime import datetime
 from azure.storage.blob import BlobServiceClient, BlobClient
 from azure.core.exceptions import ResourceExistsError
 
+from .encoding import (
+    CONTENT_ENCODING_METADATA_KEY, IDENTITY, decode_content, default_content_encoding, encode_content,
+    encoding_from_metadata
+)
+
 
 class Stage(Enum):
     """Processing stages for credit documents."""
@@ -16,6 +21,45 @@ class Stage(Enum):
     OCR = "ocr"
     LLM = "llm"
     ANNOTATED = "annotated"
+    CACHE = "cache"
+    RESULTS = "results"
+
+
+def build_blob_path(uuid: str, ext: str) -> PurePosixPath:
+    """
+    Build the blob path of a document within a stage container.
+    
+    Args:
+        uuid: Document UUID
+        ext: File extension (e.g., '.pdf', '.json')
+        
+    Returns:
+        PurePosixPath representing the blob path
+    """
+    if not ext.startswith('.'):
+        ext = f'.{ext}'
+    
+    return PurePosixPath(f"{uuid}{ext}")
+
+
+def build_document_envelope(uuid: str, data: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Wrap stage data in the standardized structure stored for documents.
+    
+    Args:
+        uuid: Document UUID
+        data: The actual data to store
+        metadata: Optional metadata
+        
+    Returns:
+        Dictionary with document_uuid, timestamp, data and metadata
+    """
+    return {
+        "document_uuid": uuid,
+        "timestamp": datetime.now().isoformat(),
+        "data": data,
+        "metadata": metadata or {}
+    }
 
 
 class BlobStorage:
@@ -127,11 +171,7 @@ class BlobStorage:
         Returns:
             PurePosixPath representing the blob path
         """
-        if not ext.startswith('.'):
-            ext = f'.{ext}'
-        
-        path = PurePosixPath(f"{uuid}{ext}")
-        return path
+        return build_blob_path(uuid, ext)
     
     def blob_client(self, uuid: str, stage: Stage, ext: str) -> BlobClient:
         """
@@ -151,7 +191,15 @@ class BlobStorage:
         container_client = self.blob_service_client.get_container_client(container_name)
         return container_client.get_blob_client(str(blob_path))
     
-    def upload_blob(self, uuid: str, stage: Stage, ext: str, data: bytes, overwrite: bool = True) -> None:
+    def upload_blob(
+        self,
+        uuid: str,
+        stage: Stage,
+        ext: str,
+        data: bytes,
+        overwrite: bool = True,
+        content_encoding: Optional[str] = None
+    ) -> None:
         """
         Upload data to a blob at a specific stage.
         
@@ -161,9 +209,17 @@ class BlobStorage:
             ext: File extension
             data: Data to upload
             overwrite: Whether to overwrite existing blob
+            content_encoding: Compress with gzip or zstd and record it in the blob metadata
         """
         blob_client = self.blob_client(uuid, stage, ext)
-        blob_client.upload_blob(data, overwrite=overwrite)
+        if content_encoding and content_encoding != IDENTITY:
+            blob_client.upload_blob(
+                encode_content(data, content_encoding),
+                overwrite=overwrite,
+                metadata={CONTENT_ENCODING_METADATA_KEY: content_encoding}
+            )
+        else:
+            blob_client.upload_blob(data, overwrite=overwrite)
         print(f"Uploaded blob: {stage.value}/{self.blob_path(uuid, stage, ext)}")
 
     def upload_document_data(
@@ -173,7 +229,8 @@ class BlobStorage:
         ext: str, 
         data: Dict[str, Any], 
         metadata: Optional[Dict[str, Any]] = None,
-        overwrite: bool = True
+        overwrite: bool = True,
+        content_encoding: Optional[str] = None
     ) -> None:
         """
         Upload document data with standardized structure.
@@ -185,16 +242,12 @@ class BlobStorage:
             data: The actual data to store
             metadata: Optional metadata
             overwrite: Whether to overwrite existing blob
+            content_encoding: gzip, zstd or identity (defaults to BLOB_CONTENT_ENCODING, gzip)
         """
-        standardized_data = {
-            "document_uuid": uuid,
-            "timestamp": datetime.now().isoformat(),
-            "data": data,
-            "metadata": metadata or {}
-        }
+        standardized_data = build_document_envelope(uuid, data, metadata)
         
         blob_data = json.dumps(standardized_data, indent=2, ensure_ascii=False).encode('utf-8')
-        self.upload_blob(uuid, stage, ext, blob_data, overwrite)
+        self.upload_blob(uuid, stage, ext, blob_data, overwrite, content_encoding or default_content_encoding())
 
     def download_document_data(self, uuid: str, stage: Stage, ext: str) -> Optional[Dict[str, Any]]:
         """
@@ -233,7 +286,8 @@ class BlobStorage:
         try:
             blob_client = self.blob_client(uuid, stage, ext)
             blob_data = blob_client.download_blob()
-            data = blob_data.readall()
+            # Compressed blobs record their encoding; older blobs are returned as stored
+            data = decode_content(blob_data.readall(), encoding_from_metadata(blob_data.properties.metadata))
             print(f"Downloaded blob: {stage.value}/{self.blob_path(uuid, stage, ext)}")
             return data
         except Exception as e:
@@ -1,13 +1,27 @@
-import asyncio
 import logging
 import traceback
 from celery import chain
 from src.celery_app import celery_app
-from src.integration.pipeline import process_document_with_ocr, process_document_with_llm
+from src.integration.pipeline import (
+    process_document_with_ocr,
+    process_document_with_llm,
+    save_ocr_results,
+    load_ocr_results,
+    save_llm_results,
+    save_final_results,
+    get_ocr_pipeline_version,
+    get_llm_pipeline_version,
+    OCR_CACHE_KIND,
+    LLM_CACHE_KIND,
+)
+from src.llm.response_cache import get_llm_response_cache
+from src.ocr.reader_registry import get_reader_registry
+from src.tasks.worker_loop import run_in_worker_loop
+from src.storage.result_cache import compute_document_hash, get_result_cache
 from src.dms.service import DmsService
 from src.dms.adapters import AzureBlobStorageClient, PostgresMetadataRepository
+from src.dms.connection_pool import get_connection_pool
 from src.config import AppConfig
-import psycopg2
 from azure.storage.blob import BlobServiceClient
 
 logger = logging.getLogger(__name__)
@@ -21,19 +35,11 @@ def _get_dms_service() -> DmsService:
     # Use environment-aware storage configuration
     from src.storage.storage import get_storage
     
-    # Initialize database connection
-    pg_conn = psycopg2.connect(
-        host=app_config.database.host,
-        port=app_config.database.port,
-        database=app_config.database.name,
-        user=app_config.database.user,
-        password=app_config.database.password,
-    )
-    
     # Use the singleton storage instance
     storage = get_storage()
     storage_client = AzureBlobStorageClient(storage.blob_service_client)
-    metadata_repo = PostgresMetadataRepository(pg_conn)
+    # Borrow connections from the per-process pool instead of opening one per task
+    metadata_repo = PostgresMetadataRepository(pool=get_connection_pool())
     
     return DmsService(storage_client=storage_client, metadata_repository=metadata_repo)
 
@@ -81,9 +87,37 @@ def process_ocr_task(self, document_id: str) -> str:
         if not blob_data:
             raise ValueError(f"Could not download document {document_id}")
         
-        # Process with OCR
-        asyncio.run(process_document_with_ocr(document_id, blob_data, dms_service))
-        
+        # Identical bytes under the same pipeline version reuse the earlier OCR result
+        document_hash = compute_document_hash(blob_data)
+        cached_results = None
+        if app_config.cache.enabled:
+            result_cache = get_result_cache()
+            ocr_version = get_ocr_pipeline_version()
+            cached_results = result_cache.get(OCR_CACHE_KIND, document_hash, ocr_version)
+
+        if cached_results is not None:
+            logger.info(f"Reusing cached OCR results for document {document_id} (sha256 {document_hash})")
+            save_ocr_results(document_id, cached_results)
+            ocr_results = cached_results
+        else:
+            # Process with OCR
+            ocr_results = run_in_worker_loop(process_document_with_ocr(document_id, blob_data, dms_service))
+            if app_config.cache.enabled:
+                result_cache.put(OCR_CACHE_KIND, document_hash, ocr_version, ocr_results)
+            logger.info(f"OCR reader stats: {get_reader_registry().stats()}")
+
+        # Generate visualization from the bytes already in memory (the document is read once per run)
+        try:
+            from src.visualization.ocr_visualization import visualize_ocr_results
+            logger.info(f"Generating visualization for document {document_id}")
+            visualize_ocr_results(document_id, ocr_results.get("original_lines", []), pdf_data=blob_data)
+            logger.info(f"Visualization generated for document {document_id}")
+        except Exception as viz_error:
+            logger.warning(f"Failed to generate visualization for document {document_id}: {viz_error}")
+            # Don't fail the entire task if visualization fails
+
+        if app_config.cache.enabled:
+            logger.info(f"Result cache stats: {result_cache.stats()}")
         logger.info(f"Successfully completed {task_name} for document {document_id}")
         return document_id
     except Exception as e:
@@ -99,11 +133,8 @@ def process_llm_task(self, document_id: str) -> str:
     logger.info(f"Starting {task_name} for document {document_id}")
     
     try:
-        # Get OCR results from storage
-        from src.storage.storage import get_storage, Stage
-        
-        storage = get_storage()
-        ocr_document_data = storage.download_document_data(document_id, Stage.OCR, ".json")
+        # Get OCR results from storage (JSON or columnar artifact)
+        ocr_document_data = load_ocr_results(document_id)
         
         if not ocr_document_data:
             raise ValueError(f"OCR results not found for document {document_id}")
@@ -113,19 +144,35 @@ def process_llm_task(self, document_id: str) -> str:
         if not ocr_results:
             raise ValueError(f"Invalid OCR data structure for document {document_id}")
         
-        # Process with LLM
         dms_service = _get_dms_service()
-        asyncio.run(process_document_with_llm(document_id, ocr_results, dms_service))
-        
-        # Generate visualization with OCR bounding boxes
-        try:
-            from src.visualization.ocr_visualization import visualize_ocr_results
-            logger.info(f"Generating visualization for document {document_id}")
-            visualize_ocr_results(document_id, ocr_results.get("original_lines", []))
-            logger.info(f"Visualization generated for document {document_id}")
-        except Exception as viz_error:
-            logger.warning(f"Failed to generate visualization for document {document_id}: {viz_error}")
-            # Don't fail the entire task if visualization fails
+
+        # OCR results carry the document hash; documents processed before it was recorded are not cached
+        document_hash = ocr_results.get("processing_metadata", {}).get("document_sha256")
+        use_cache = app_config.cache.enabled and bool(document_hash)
+        cached_results = None
+        if use_cache:
+            result_cache = get_result_cache()
+            llm_version = get_llm_pipeline_version()
+            cached_results = result_cache.get(LLM_CACHE_KIND, document_hash, llm_version)
+
+        if cached_results is not None:
+            logger.info(f"Reusing cached LLM results for document {document_id} (sha256 {document_hash})")
+            save_llm_results(document_id, cached_results)
+            save_final_results(document_id, ocr_results, cached_results)
+            try:
+                dms_service.mark_processing_done(document_id)
+            except Exception as e:
+                logger.warning(f"Failed to mark processing done for document {document_id}: {e}")
+        else:
+            # Process with LLM
+            llm_results = run_in_worker_loop(process_document_with_llm(document_id, ocr_results, dms_service))
+            if use_cache:
+                result_cache.put(LLM_CACHE_KIND, document_hash, llm_version, llm_results)
+
+        if use_cache:
+            logger.info(f"Result cache stats: {result_cache.stats()}")
+        if app_config.llm.response_cache_enabled:
+            logger.info(f"LLM response cache stats: {get_llm_response_cache().stats()}")
         
         logger.info(f"Successfully completed {task_name} for document {document_id}")
         return document_id
@@ -181,3 +228,13 @@ def process_document_async(self, document_id: str) -> str:
         raise
 
 
+@celery_app.task(bind=True)
+def prune_result_cache_task(self) -> dict:
+    """Delete result cache entries written by other pipeline versions (run after a pipeline change)."""
+    result_cache = get_result_cache()
+    deleted = {
+        OCR_CACHE_KIND: result_cache.invalidate(OCR_CACHE_KIND, keep_version=get_ocr_pipeline_version()),
+        LLM_CACHE_KIND: result_cache.invalidate(LLM_CACHE_KIND, keep_version=get_llm_pipeline_version()),
+    }
+    logger.info(f"Pruned result cache entries: {deleted}")
+    return deleted
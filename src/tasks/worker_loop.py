@@ -0,0 +1,42 @@
+import asyncio
+import threading
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+_local = threading.local()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop owned by the current worker thread.
+
+    ``asyncio.run`` creates and closes a loop per call, which also discards
+    anything bound to that loop, such as the pooled aiohttp session of the
+    shared Ollama client. Tasks run their coroutines on this long-lived loop
+    instead so those connections survive from one document to the next.
+    """
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _local.loop = loop
+    return loop
+
+
+def run_in_worker_loop(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the worker thread's event loop."""
+    return get_worker_loop().run_until_complete(coroutine)
+
+
+def close_worker_loop() -> None:
+    """Close the current thread's worker loop and the shared LLM clients bound to it."""
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        return
+    from src.llm.client import close_ollama_clients
+    try:
+        loop.run_until_complete(close_ollama_clients())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+        _local.loop = None
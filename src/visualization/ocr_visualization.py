@@ -1,29 +1,33 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from io import BytesIO
-from pdf2image import convert_from_bytes
+from ..ocr.easyocr_client import OCR_DPI
+from ..ocr.rasterization import iter_page_images
+from ..storage.document_source import load_document_pdf
 from ..storage.storage import get_storage, Stage
 
 
-def visualize_ocr_results(document_id: str, ocr_results: List[Dict[str, Any]]) -> None:
+def visualize_ocr_results(
+    document_id: str,
+    ocr_results: List[Dict[str, Any]],
+    pdf_data: Optional[bytes] = None,
+    blob_path: Optional[str] = None
+) -> None:
     """
     Visualize OCR bounding boxes, text, and confidence on images and save to blob storage.
     
     Args:
         document_id: Unique identifier for the document
         ocr_results: List of OCR results with bounding boxes and confidence scores
+        pdf_data: Document bytes the caller already holds; loaded from storage if omitted
+        blob_path: blob_path of the document's DMS record, used when pdf_data is omitted
     """
-    # Download PDF from blob storage
     storage_client = get_storage()
-    pdf_data = storage_client.download_blob(document_id, Stage.RAW, ".pdf")
     if pdf_data is None:
-        raise FileNotFoundError(f"PDF not found in blob storage: {document_id}")
-    
-    # Convert PDF to images with SAME DPI as OCR processing (150)
-    print("  - Converting PDF to images for visualization...")
-    pdf_images = convert_from_bytes(pdf_data, dpi=150)
-    print(f"  - Converted PDF to {len(pdf_images)} images")
+        pdf_data = load_document_pdf(document_id, blob_path)
+        if pdf_data is None:
+            raise FileNotFoundError(f"PDF not found in blob storage: {document_id}")
     
     # Group OCR results by page
     page_to_elements: Dict[int, List[Dict[str, Any]]] = {}
@@ -33,9 +37,14 @@ def visualize_ocr_results(document_id: str, ocr_results: List[Dict[str, Any]]) -
             page_to_elements[page_num] = []
         page_to_elements[page_num].append(result)
     
-    # Create visualizations for each page
-    for page_num, elements in page_to_elements.items():
-        image = pdf_images[page_num - 1]
+    # Render pages one at a time with the SAME DPI as OCR processing;
+    # pages without OCR elements have nothing to draw and are not rendered
+    print("  - Rendering PDF pages for visualization...")
+    for page_num, image in iter_page_images(pdf_data, dpi=OCR_DPI, pages=set(page_to_elements)):
+        elements = page_to_elements.get(page_num)
+        if not elements:
+            continue
+        image_height, image_width = image.shape[:2]
         fig, ax = plt.subplots(1, 1, figsize=(15, 20))
         ax.imshow(image)
         ax.set_title(f'Page {page_num} - OCR Text Extraction', fontsize=16)
@@ -75,8 +84,8 @@ def visualize_ocr_results(document_id: str, ocr_results: List[Dict[str, Any]]) -
             patches.Patch(color='red', label='Low (<70%)')
         ]
         ax.legend(handles=legend_elements, loc='upper right')
-        ax.set_xlim(0, image.width)
-        ax.set_ylim(image.height, 0)
+        ax.set_xlim(0, image_width)
+        ax.set_ylim(image_height, 0)
         ax.axis('off')
         plt.tight_layout()
         
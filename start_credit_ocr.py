@@ -202,7 +202,7 @@ class CreditOCRStarter:
             # Start Celery worker
             python_cmd = sys.executable
             celery_cmd = [python_cmd, "-m", "celery", "-A", "src.celery_app", 
-                         "worker", "--loglevel=info", "--concurrency=2"]
+                         "worker", "--loglevel=info", "--concurrency=2", "--queues=celery,ocr"]
             
             process = subprocess.Popen(
                 celery_cmd,
@@ -1,9 +1,12 @@
 import pytest
 import uuid
+from contextlib import contextmanager
 from io import BytesIO
+from unittest.mock import AsyncMock, Mock, patch
 from fastapi.testclient import TestClient
 
 from src.api.main import app
+from src.api.dependencies import get_blob_storage, get_dms_service, get_metadata_repository
 from src.api.models import ProcessingStatus
 
 
@@ -13,6 +16,52 @@ def client(setup_test_database, setup_test_storage):
     return TestClient(app)
 
 
+@contextmanager
+def override_dms_service():
+    """
+    Override the injected DMS service; the service is the yielded mock's return_value.
+
+    Metadata reads go through the async repository, which is routed to the same mock.
+    """
+    mock_get_dms = Mock()
+    metadata_repository = Mock()
+    metadata_repository.get_document = AsyncMock(
+        side_effect=lambda document_id: mock_get_dms.return_value.get_document(document_id)
+    )
+    metadata_repository.list_documents_paginated = AsyncMock(
+        side_effect=lambda limit, offset: mock_get_dms.return_value.list_documents(limit=limit, offset=offset)
+    )
+    app.dependency_overrides[get_dms_service] = lambda: mock_get_dms.return_value
+    app.dependency_overrides[get_metadata_repository] = lambda: metadata_repository
+    try:
+        yield mock_get_dms
+    finally:
+        app.dependency_overrides.pop(get_dms_service, None)
+        app.dependency_overrides.pop(get_metadata_repository, None)
+
+
+@contextmanager
+def override_blob_storage():
+    """
+    Override the injected async blob storage.
+
+    Blob calls are routed to the yielded mock's return_value, so tests configure
+    a plain synchronous storage mock.
+    """
+    mock_get_storage = Mock()
+    blob_storage = Mock()
+    for method_name in ("upload_blob", "download_blob", "blob_exists", "download_document_data"):
+        setattr(blob_storage, method_name, AsyncMock(
+            side_effect=lambda *args, _name=method_name, **kwargs:
+                getattr(mock_get_storage.return_value, _name)(*args, **kwargs)
+        ))
+    app.dependency_overrides[get_blob_storage] = lambda: blob_storage
+    try:
+        yield mock_get_storage
+    finally:
+        app.dependency_overrides.pop(get_blob_storage, None)
+
+
 @pytest.fixture
 def mock_pdf_content():
     """Mock PDF file content for testing."""
@@ -30,7 +79,7 @@ class TestAPIHealth:
     
     def test_health_check_success(self, client):
         """Test successful health check."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms, \
+        with override_dms_service() as mock_get_dms, \
              patch('src.api.routes.get_storage') as mock_get_storage:
             
             # Mock successful DMS service
@@ -59,8 +108,8 @@ class TestDocumentUpload:
     
     def test_upload_pdf_success(self, client, mock_pdf_content, mock_document_id):
         """Test successful PDF upload."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms, \
-             patch('src.api.routes.get_storage') as mock_get_storage, \
+        with override_dms_service() as mock_get_dms, \
+             override_blob_storage() as mock_get_storage, \
              patch('uuid.uuid4') as mock_uuid:
             
             # Mock UUID generation
@@ -102,7 +151,7 @@ class TestDocumentUpload:
     
     def test_upload_empty_file(self, client):
         """Test upload of empty file fails."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms:
+        with override_dms_service() as mock_get_dms:
             files = {"file": ("test.pdf", BytesIO(b""), "application/pdf")}
             
             response = client.post("/api/v1/upload", files=files)
@@ -116,7 +165,7 @@ class TestDocumentStatus:
     
     def test_get_status_success(self, client, mock_document_id):
         """Test successful status retrieval."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms:
+        with override_dms_service() as mock_get_dms:
             # Mock DMS service with document data
             mock_dms = Mock()
             mock_document = {
@@ -139,7 +188,7 @@ class TestDocumentStatus:
     
     def test_get_status_not_found(self, client, mock_document_id):
         """Test status retrieval for non-existent document."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms:
+        with override_dms_service() as mock_get_dms:
             # Mock DMS service returning None
             mock_dms = Mock()
             mock_dms.get_document.return_value = None
@@ -156,8 +205,8 @@ class TestDocumentResults:
     
     def test_get_results_success(self, client, mock_document_id):
         """Test successful results retrieval."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms, \
-             patch('src.api.routes.get_storage') as mock_get_storage:
+        with override_dms_service() as mock_get_dms, \
+             override_blob_storage() as mock_get_storage:
             
             # Mock DMS service with completed document
             mock_dms = Mock()
@@ -215,7 +264,7 @@ class TestDocumentResults:
     
     def test_get_results_processing_incomplete(self, client, mock_document_id):
         """Test results retrieval for incomplete processing."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms:
+        with override_dms_service() as mock_get_dms:
             # Mock DMS service with processing document
             mock_dms = Mock()
             mock_document = {
@@ -231,6 +280,13 @@ class TestDocumentResults:
             
             assert response.status_code == 202
             assert "not yet complete" in response.json()["detail"]
+    
+    def test_results_schema_documents_pagination(self):
+        """The OpenAPI schema describes the cursor and element index of projected responses."""
+        schemas = app.openapi()["components"]["schemas"]
+        
+        assert "next_cursor" in schemas["DocumentResultsResponse"]["properties"]
+        assert "element_index" in schemas["OcrElementData"]["properties"]
 
 
 class TestDocumentVisualization:
@@ -238,8 +294,8 @@ class TestDocumentVisualization:
     
     def test_get_visualization_success(self, client, mock_document_id):
         """Test successful visualization retrieval."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms, \
-             patch('src.api.routes.get_storage') as mock_get_storage:
+        with override_dms_service() as mock_get_dms, \
+             override_blob_storage() as mock_get_storage:
             
             # Mock DMS service
             mock_dms = Mock()
@@ -261,8 +317,8 @@ class TestDocumentVisualization:
     
     def test_get_visualization_not_found(self, client, mock_document_id):
         """Test visualization retrieval when not available."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms, \
-             patch('src.api.routes.get_storage') as mock_get_storage:
+        with override_dms_service() as mock_get_dms, \
+             override_blob_storage() as mock_get_storage:
             
             # Mock DMS service
             mock_dms = Mock()
@@ -286,7 +342,7 @@ class TestDocumentListing:
     
     def test_list_documents_success(self, client):
         """Test successful document listing."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms:
+        with override_dms_service() as mock_get_dms:
             # Mock DMS service with document list
             mock_dms = Mock()
             mock_documents = [
@@ -320,7 +376,7 @@ class TestDocumentListing:
     
     def test_list_documents_with_pagination(self, client):
         """Test document listing with pagination parameters."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms:
+        with override_dms_service() as mock_get_dms:
             # Mock DMS service
             mock_dms = Mock()
             mock_dms.list_documents.return_value = []
@@ -351,7 +407,7 @@ class TestErrorHandling:
     
     def test_upload_with_dms_service_error(self, client, mock_pdf_content):
         """Test upload when DMS service fails."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms:
+        with override_dms_service() as mock_get_dms:
             # Mock DMS service raising an exception
             mock_dms = Mock()
             mock_dms.store_document.side_effect = Exception("DMS Error")
@@ -366,7 +422,7 @@ class TestErrorHandling:
     
     def test_status_with_service_error(self, client, mock_document_id):
         """Test status endpoint when service fails."""
-        with patch('src.api.routes.get_dms_service') as mock_get_dms:
+        with override_dms_service() as mock_get_dms:
             # Mock DMS service raising an exception
             mock_dms = Mock()
             mock_dms.get_document.side_effect = Exception("Database Error")
@@ -0,0 +1,84 @@
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.dms.async_adapters import ThreadedMetadataRepository
+
+
+def _document(document_id):
+    return {
+        'document_id': document_id,
+        'filename': 'test.pdf',
+        'textextraction_status': 'ready',
+        'processing_status': 'done',
+    }
+
+
+def test_services_are_created_once_in_lifespan():
+    """Every request gets the services created at startup."""
+    dms_service = Mock()
+    dms_service.metadata_repository.get_document.side_effect = _document
+
+    with patch('src.api.main.get_storage'), \
+         patch('src.api.dependencies.create_dms_service', return_value=dms_service) as mock_create, \
+         patch('src.api.dependencies.AsyncPostgresMetadataRepository.create', side_effect=OSError("no database")), \
+         patch('src.api.dependencies.close_connection_pool') as mock_close_pool:
+        with TestClient(app) as client:
+            assert app.state.dms_service is dms_service
+            # Without a reachable database for asyncpg the sync repository runs in threads
+            assert isinstance(app.state.metadata_repository, ThreadedMetadataRepository)
+            for index in range(3):
+                response = client.get(f"/api/v1/status/doc-{index}")
+                assert response.status_code == 200
+                assert response.json()["document_id"] == f"doc-{index}"
+
+        mock_create.assert_called_once()
+        assert dms_service.metadata_repository.get_document.call_count == 3
+        # Shutdown releases the shared services
+        mock_close_pool.assert_called_once()
+        assert app.state.dms_service is None
+        assert app.state.metadata_repository is None
+        assert app.state.http_session is None
+
+
+def test_service_is_created_lazily_without_lifespan():
+    """Without the lifespan the service is created on first use and then reused."""
+    dms_service = Mock()
+    dms_service.metadata_repository.get_document.side_effect = _document
+    app.state.dms_service = None
+    app.state.metadata_repository = None
+
+    try:
+        with patch('src.api.dependencies.create_dms_service', return_value=dms_service) as mock_create:
+            client = TestClient(app)
+            assert client.get("/api/v1/status/doc-1").status_code == 200
+            assert client.get("/api/v1/status/doc-2").status_code == 200
+
+        mock_create.assert_called_once()
+        assert dms_service.metadata_repository.get_document.call_count == 2
+    finally:
+        app.state.dms_service = None
+        app.state.metadata_repository = None
+
+
+def test_health_check_uses_shared_http_session():
+    """The Ollama probe goes through the app's aiohttp session."""
+    ollama_response = Mock(status=200)
+    ollama_response.json = AsyncMock(return_value={'models': [{'name': 'llama3.1:8b'}]})
+    http_session = MagicMock(closed=False)
+    http_session.get.return_value.__aenter__.return_value = ollama_response
+    app.state.http_session = http_session
+    app.state.metadata_repository = AsyncMock()
+
+    try:
+        with patch('src.api.routes.get_storage'), \
+             patch('src.api.routes.get_connection_pool_stats', return_value=None):
+            response = TestClient(app).get("/api/v1/health")
+
+        assert response.status_code == 200
+        assert response.json()["services"]["ollama"] == "healthy"
+        http_session.get.assert_called_once()
+    finally:
+        app.state.http_session = None
+        app.state.metadata_repository = None
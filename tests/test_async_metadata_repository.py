@@ -0,0 +1,166 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from src.dms.async_adapters import AsyncPostgresMetadataRepository, ThreadedMetadataRepository
+
+
+class FakeConnection:
+    """asyncpg connection stand-in that records queries and returns canned rows."""
+
+    def __init__(self, rows=None, command_status="UPDATE 1"):
+        self.rows = rows or []
+        self.command_status = command_status
+        self.queries = []
+
+    async def fetch(self, query, *args):
+        self.queries.append((query, args))
+        return self.rows
+
+    async def fetchrow(self, query, *args):
+        self.queries.append((query, args))
+        return self.rows[0] if self.rows else None
+
+    async def execute(self, query, *args):
+        self.queries.append((query, args))
+        return self.command_status
+
+
+class FakeAcquire:
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def __aenter__(self):
+        self.pool.in_use += 1
+        self.pool.max_in_use = max(self.pool.max_in_use, self.pool.in_use)
+        await asyncio.sleep(0)
+        return self.pool.connection
+
+    async def __aexit__(self, *exc_info):
+        self.pool.in_use -= 1
+
+
+class FakePool:
+    def __init__(self, connection):
+        self.connection = connection
+        self.in_use = 0
+        self.max_in_use = 0
+        self.closed = False
+
+    def acquire(self, timeout=None):
+        return FakeAcquire(self)
+
+    async def close(self):
+        self.closed = True
+
+
+DOCUMENT_ID = uuid.UUID("8a6c1c2e-4f0b-4c1e-9f59-2d1f3c5a7b90")
+CREATED_AT = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _document_row():
+    return {
+        "id": DOCUMENT_ID,
+        "file_path": "raw/credit_request/doc.pdf",
+        "filename": "doc.pdf",
+        "created_at": CREATED_AT,
+        "mime_type": "application/pdf",
+        "file_size": 1234,
+        "text_extraction_status": "ready",
+        "processing_status": "ocr running",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_document_matches_sync_repository_shape():
+    """Rows map to the same keys as PostgresMetadataRepository, with UUIDs as strings."""
+    connection = FakeConnection(rows=[_document_row()])
+    repository = AsyncPostgresMetadataRepository(FakePool(connection))
+
+    document = await repository.get_document(str(DOCUMENT_ID))
+
+    assert document["id"] == str(DOCUMENT_ID)
+    assert document["blob_path"] == "raw/credit_request/doc.pdf"
+    assert document["source_filename"] == "doc.pdf"
+    assert document["textextraction_status"] == "ready"
+    assert document["processing_status"] == "ocr running"
+    assert connection.queries[0][1] == (str(DOCUMENT_ID),)
+
+
+@pytest.mark.asyncio
+async def test_get_document_missing_returns_none():
+    repository = AsyncPostgresMetadataRepository(FakePool(FakeConnection(rows=[])))
+    assert await repository.get_document(str(DOCUMENT_ID)) is None
+
+
+@pytest.mark.asyncio
+async def test_list_documents_paginated():
+    connection = FakeConnection(rows=[_document_row()])
+    repository = AsyncPostgresMetadataRepository(FakePool(connection))
+
+    documents = await repository.list_documents_paginated(10, 20)
+
+    assert documents[0]["document_id"] == str(DOCUMENT_ID)
+    assert documents[0]["upload_timestamp"] == CREATED_AT
+    assert "LIMIT $1 OFFSET $2" in connection.queries[0][0]
+    assert connection.queries[0][1] == (10, 20)
+
+
+@pytest.mark.asyncio
+async def test_update_extraction_job_reports_affected_rows():
+    connection = FakeConnection(command_status="UPDATE 1")
+    repository = AsyncPostgresMetadataRepository(FakePool(connection))
+    assert await repository.update_extraction_job("job-1", "done", None) is True
+    assert connection.queries[-1][1] == ("done", "job-1")
+
+    connection.command_status = "UPDATE 0"
+    assert await repository.update_extraction_job("job-1", "failed", "boom") is False
+    assert connection.queries[-1][1] == ("failed", "boom", "job-1")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_polls_share_the_pool():
+    """Many concurrent lookups run on the event loop through the pool."""
+    pool = FakePool(FakeConnection(rows=[_document_row()]))
+    repository = AsyncPostgresMetadataRepository(pool)
+
+    documents = await asyncio.gather(*(repository.get_document(str(DOCUMENT_ID)) for _ in range(200)))
+
+    assert len(documents) == 200
+    assert pool.max_in_use > 1
+    await repository.close()
+    assert pool.closed
+
+
+class RecordingRepository:
+    def __init__(self):
+        self.calls = []
+
+    def get_document(self, document_id):
+        self.calls.append(("get_document", document_id))
+        return {"id": document_id}
+
+    def list_documents_paginated(self, limit, offset):
+        self.calls.append(("list_documents_paginated", limit, offset))
+        return []
+
+    def list_extraction_jobs(self, document_id):
+        self.calls.append(("list_extraction_jobs", document_id))
+        return []
+
+
+@pytest.mark.asyncio
+async def test_threaded_repository_delegates():
+    sync_repository = RecordingRepository()
+    repository = ThreadedMetadataRepository(sync_repository)
+
+    assert await repository.get_document("doc-1") == {"id": "doc-1"}
+    assert await repository.list_documents_paginated(5, 0) == []
+    assert await repository.list_extraction_jobs("doc-1") == []
+    assert sync_repository.calls == [
+        ("get_document", "doc-1"),
+        ("list_documents_paginated", 5, 0),
+        ("list_extraction_jobs", "doc-1"),
+    ]
@@ -0,0 +1,202 @@
+import asyncio
+import gzip
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+
+from src.storage.async_storage import AsyncBlobStorage
+from src.storage.storage import Stage
+
+CONNECTION_STRING = (
+    "DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;AccountKey=a2V5;"
+    "BlobEndpoint=http://127.0.0.1:10000/devstoreaccount1;"
+)
+
+
+class FakeDownloader:
+    def __init__(self, data, content_range=None, metadata=None):
+        self.data = data
+        self.properties = Mock(content_range=content_range, metadata=metadata or {})
+
+    async def readall(self):
+        return self.data
+
+
+class FakeBlobClient:
+    def __init__(self, blobs, container, name, ranges, metadata):
+        self.blobs = blobs
+        self.key = (container, name)
+        self.ranges = ranges
+        self.metadata = metadata
+
+    async def upload_blob(self, data, overwrite=True, metadata=None):
+        self.blobs[self.key] = data
+        self.metadata[self.key] = metadata or {}
+
+    async def download_blob(self, offset=None, length=None):
+        await asyncio.sleep(0.05)
+        if self.key not in self.blobs:
+            raise ResourceNotFoundError("missing")
+        data = self.blobs[self.key]
+        metadata = self.metadata.get(self.key)
+        if offset is None:
+            return FakeDownloader(data, metadata=metadata)
+        self.ranges.append((offset, length))
+        end = min(offset + length, len(data))
+        return FakeDownloader(data[offset:end], f"bytes {offset}-{end - 1}/{len(data)}", metadata)
+
+    async def exists(self):
+        return self.key in self.blobs
+
+
+class FakeContainerClient:
+    def __init__(self, service, name):
+        self.service = service
+        self.name = name
+
+    async def create_container(self):
+        self.service.created_containers.append(self.name)
+        if self.name in self.service.existing_containers:
+            raise ResourceExistsError("exists")
+        self.service.existing_containers.add(self.name)
+
+    def get_blob_client(self, blob_name):
+        return FakeBlobClient(self.service.blobs, self.name, blob_name, self.service.ranges, self.service.metadata)
+
+    async def list_blob_names(self):
+        for container, name in sorted(self.service.blobs):
+            if container == self.name:
+                yield name
+
+
+class FakeBlobServiceClient:
+    instances = []
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.blobs = {}
+        self.metadata = {}
+        self.ranges = []
+        self.created_containers = []
+        self.existing_containers = set()
+        self.closed = False
+        FakeBlobServiceClient.instances.append(self)
+
+    @classmethod
+    def from_connection_string(cls, connection_string, transport=None):
+        return cls(transport)
+
+    def get_container_client(self, name):
+        return FakeContainerClient(self, name)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_service():
+    FakeBlobServiceClient.instances = []
+    with patch('src.storage.async_storage.BlobServiceClient', FakeBlobServiceClient):
+        yield FakeBlobServiceClient
+
+
+@pytest.mark.asyncio
+async def test_round_trip_and_missing_blobs(fake_service):
+    storage = AsyncBlobStorage(CONNECTION_STRING)
+
+    await storage.upload_blob("doc-1", Stage.OCR, "json", b"payload")
+    await storage.upload_blob("doc-1", Stage.LLM, ".json", b"other")
+
+    assert await storage.download_blob("doc-1", Stage.OCR, ".json") == b"payload"
+    assert await storage.download_blob("doc-2", Stage.OCR, ".json") is None
+    assert await storage.blob_exists("doc-1", Stage.LLM, ".json")
+    assert not await storage.blob_exists("doc-1", Stage.ANNOTATED, "_page_1.png")
+    assert await storage.list_blobs_in_stage(Stage.OCR) == ["doc-1.json"]
+    # Containers are created once per process, not per upload
+    assert fake_service.instances[0].created_containers == ["ocr", "llm"]
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_document_data_uses_standard_envelope(fake_service):
+    storage = AsyncBlobStorage(CONNECTION_STRING)
+
+    await storage.upload_document_data("doc-1", Stage.OCR, ".json", {"lines": [1, 2]}, metadata={"stage": "ocr"})
+    document = await storage.download_document_data("doc-1", Stage.OCR, ".json")
+
+    assert document["document_uuid"] == "doc-1"
+    assert document["data"] == {"lines": [1, 2]}
+    assert document["metadata"] == {"stage": "ocr"}
+    # JSON artifacts are stored gzip-compressed, with the encoding in the blob metadata
+    assert json.loads(gzip.decompress(fake_service.instances[0].blobs[("ocr", "doc-1.json")]))["data"] == {
+        "lines": [1, 2]
+    }
+    assert fake_service.instances[0].metadata[("ocr", "doc-1.json")] == {"content_encoding": "gzip"}
+    assert await storage.download_document_data("doc-2", Stage.OCR, ".json") is None
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_open_blob_stream_reads_in_ranges(fake_service):
+    storage = AsyncBlobStorage(CONNECTION_STRING)
+    await storage.upload_blob("doc-1", Stage.OCR, ".json", b"0123456789")
+
+    chunks = await storage.open_blob_stream("doc-1", Stage.OCR, ".json", chunk_size=4)
+
+    assert [chunk async for chunk in chunks] == [b"0123", b"4567", b"89"]
+    assert fake_service.instances[0].ranges == [(0, 4), (4, 4), (8, 4)]
+    assert await storage.open_blob_stream("doc-2", Stage.OCR, ".json") is None
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_compressed_blobs_are_decoded_when_streamed(fake_service):
+    storage = AsyncBlobStorage(CONNECTION_STRING)
+    payload = json.dumps({"lines": list(range(5000))}).encode("utf-8")
+    await storage.upload_blob("doc-1", Stage.OCR, ".json", payload, content_encoding="gzip")
+    # Blobs written before compression have no encoding metadata
+    await storage.upload_blob("doc-2", Stage.OCR, ".json", payload)
+
+    chunks = await storage.open_blob_stream("doc-1", Stage.OCR, ".json", chunk_size=256)
+
+    assert b"".join([chunk async for chunk in chunks]) == payload
+    assert len(fake_service.instances[0].blobs[("ocr", "doc-1.json")]) < len(payload)
+    assert await storage.download_blob("doc-1", Stage.OCR, ".json") == payload
+    assert await storage.download_blob("doc-2", Stage.OCR, ".json") == payload
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_downloads_run_concurrently_on_one_session(fake_service):
+    storage = AsyncBlobStorage(CONNECTION_STRING)
+    for index in range(10):
+        await storage.upload_blob(f"doc-{index}", Stage.OCR, ".json", b"x")
+
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    results = await asyncio.gather(*(storage.download_blob(f"doc-{index}", Stage.OCR, ".json") for index in range(10)))
+    elapsed = loop.time() - start_time
+
+    assert results == [b"x"] * 10
+    # Ten 50 ms downloads overlap instead of adding up
+    assert elapsed < 0.3
+    assert len(fake_service.instances) == 1
+    session = storage._session
+    await storage.close()
+    assert session.closed
+    assert fake_service.instances[0].closed
+
+
+def test_client_is_recreated_for_a_new_event_loop(fake_service):
+    storage = AsyncBlobStorage(CONNECTION_STRING)
+
+    async def touch():
+        return storage.blob_service_client
+
+    first = asyncio.run(touch())
+    second = asyncio.run(touch())
+
+    assert first is not second
+    assert len(fake_service.instances) == 2
@@ -0,0 +1,71 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.storage import encoding
+from src.storage.encoding import ContentDecoder, decode_content, default_content_encoding, encode_content
+from src.storage.storage import BlobStorage, Stage
+
+PAYLOAD = json.dumps({"original_lines": [{"text": f"line {index}"} for index in range(1000)]}, indent=2).encode()
+
+
+class FakeBlobClient:
+    def __init__(self, blobs, key):
+        self.blobs = blobs
+        self.key = key
+
+    def upload_blob(self, data, overwrite=True, metadata=None):
+        self.blobs[self.key] = (data, metadata or {})
+
+    def download_blob(self):
+        data, metadata = self.blobs[self.key]
+        return Mock(readall=Mock(return_value=data), properties=Mock(metadata=metadata))
+
+
+@pytest.fixture
+def storage():
+    blobs = {}
+    storage = BlobStorage()
+    fake_blob_client = lambda uuid, stage, ext: FakeBlobClient(blobs, (stage, ext))
+    with patch.object(storage, "blob_client", side_effect=fake_blob_client):
+        storage.stored_blobs = blobs
+        yield storage
+    del storage.stored_blobs
+
+
+@pytest.mark.parametrize("content_encoding", ["gzip", "identity"] + (["zstd"] if encoding.zstandard else []))
+def test_content_encodings_round_trip(content_encoding):
+    encoded = encode_content(PAYLOAD, content_encoding)
+    decoder = ContentDecoder(content_encoding)
+
+    assert decode_content(encoded, content_encoding) == PAYLOAD
+    assert b"".join(decoder.decode(encoded[offset:offset + 100]) for offset in range(0, len(encoded), 100)) == PAYLOAD
+
+
+def test_unknown_encodings_are_rejected(monkeypatch):
+    with pytest.raises(ValueError):
+        encode_content(PAYLOAD, "br")
+    monkeypatch.setenv("BLOB_CONTENT_ENCODING", "none")
+    assert default_content_encoding() == "identity"
+    monkeypatch.setenv("BLOB_CONTENT_ENCODING", "br")
+    with pytest.raises(ValueError):
+        default_content_encoding()
+
+
+def test_document_data_is_stored_compressed(storage, monkeypatch):
+    monkeypatch.delenv("BLOB_CONTENT_ENCODING", raising=False)
+
+    storage.upload_document_data("doc-1", Stage.OCR, ".json", {"original_lines": [1, 2]})
+
+    stored, metadata = storage.stored_blobs[(Stage.OCR, ".json")]
+    assert metadata == {"content_encoding": "gzip"}
+    assert not stored.startswith(b"{")
+    assert storage.download_document_data("doc-1", Stage.OCR, ".json")["data"] == {"original_lines": [1, 2]}
+
+
+def test_uncompressed_blobs_stay_readable(storage):
+    storage.upload_blob("doc-1", Stage.LLM, ".json", PAYLOAD)
+
+    assert storage.stored_blobs[(Stage.LLM, ".json")] == (PAYLOAD, {})
+    assert storage.download_blob("doc-1", Stage.LLM, ".json") == PAYLOAD
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from src.llm.chunking import estimate_tokens, merge_extracted_fields, split_lines_into_chunks
+from src.llm.client import LLMClient
+from src.llm.config import DocumentTypeConfig
+from src.llm.field_extractor import extract_fields_with_llm
+
+DOC_CONFIG = DocumentTypeConfig(
+    name="credit_request",
+    expected_fields=["company_name", "purchase_price", "term"],
+    field_descriptions={"company_name": "Company Name", "purchase_price": "Purchase Price", "term": "Term"},
+    validation_rules={},
+)
+
+
+def _pages(page_count, lines_per_page=20):
+    return [
+        {"type": "text_line", "text": f"Seite {page} Zeile {index} Lorem ipsum dolor", "page": page, "confidence": 0.9}
+        for page in range(1, page_count + 1)
+        for index in range(lines_per_page)
+    ]
+
+
+def test_whole_pages_are_packed_within_the_budget():
+    lines = _pages(10)
+    page_tokens = estimate_tokens([line for line in lines if line["page"] == 1])
+
+    chunks = split_lines_into_chunks(lines, max_tokens=page_tokens * 3)
+
+    assert [sorted({line["page"] for line in chunk}) for chunk in chunks] == [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10]]
+    assert [line for chunk in chunks for line in chunk] == lines
+    assert split_lines_into_chunks(lines, max_tokens=10 ** 6) == [lines]
+
+
+def test_oversized_page_is_split_between_lines():
+    lines = _pages(1, lines_per_page=100)
+
+    chunks = split_lines_into_chunks(lines, max_tokens=estimate_tokens(lines) // 4)
+
+    assert len(chunks) >= 4
+    assert all(estimate_tokens(chunk) <= estimate_tokens(lines) // 4 for chunk in chunks)
+    assert [line for chunk in chunks for line in chunk] == lines
+
+
+def test_merge_prefers_values_then_confidence_then_earlier_chunks():
+    merged = merge_extracted_fields([
+        {"company_name": {"value": "Demo", "confidence": 0.5}, "term": {"value": None, "confidence": 0.9}},
+        {"company_name": {"value": "DemoTech GmbH", "confidence": 0.95}, "term": {"value": "20 Jahre", "confidence": 0.5}},
+        {"company_name": {"value": "Other", "confidence": 0.95}},
+    ])
+
+    assert merged == {
+        "company_name": {"value": "DemoTech GmbH", "confidence": 0.95},
+        "term": {"value": "20 Jahre", "confidence": 0.5},
+    }
+
+
+def test_grounded_value_beats_an_ungrounded_guess():
+    merged = merge_extracted_fields([
+        {"term": {"value": "15 years", "confidence": 0.5}},
+        {"term": {"value": "Term 20 Jahre", "confidence": 0.31, "bounding_box": {"x1": 1}, "page": 2}},
+        {"term": {"value": "30 years", "confidence": 0.5}},
+    ])
+
+    assert merged == {"term": {"value": "Term 20 Jahre", "confidence": 0.31, "bounding_box": {"x1": 1}, "page": 2}}
+
+
+class PageAwareLLMClient(LLMClient):
+    """Answers each chunk with the fields found on its pages and tracks concurrency."""
+
+    def __init__(self):
+        self.prompts = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, prompt):
+        self.prompts += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        fields = {}
+        if "Seite 1 " in prompt:
+            fields["company_name"] = "Demo"
+        if "Kaufpreis" in prompt:
+            fields["purchase_price"] = "€500.000"
+        if "Seite 7 " in prompt:
+            fields["company_name"] = "DemoTech GmbH"
+        pairs = ", ".join(f'"{name}": "{value}"' for name, value in fields.items())
+        return '{"extracted_fields": {' + pairs + '}, "missing_fields": []}'
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_extracted_concurrently_and_merged():
+    lines = _pages(8)
+    lines.append({"type": "label_value", "label": "Kaufpreis", "value": "€500.000", "page": 5, "confidence": 0.99})
+    original_lines = [
+        {"text": "DemoTech GmbH", "page_num": 7, "confidence": 0.97, "bounding_box": None},
+        {"text": "Demo", "page_num": 1, "confidence": 0.6, "bounding_box": None},
+    ]
+    client = PageAwareLLMClient()
+    page_tokens = estimate_tokens([line for line in lines if line["page"] == 1])
+
+    result = await extract_fields_with_llm(
+        lines, DOC_CONFIG, client, original_lines, max_chunk_tokens=page_tokens * 2 + 20, max_concurrency=2
+    )
+
+    assert client.prompts == 4
+    assert client.max_in_flight == 2
+    assert result["extracted_fields"]["company_name"]["value"] == "DemoTech GmbH"
+    assert result["extracted_fields"]["company_name"]["confidence"] == 0.97
+    assert result["extracted_fields"]["purchase_price"]["value"] == "€500.000"
+    assert result["missing_fields"] == ["term"]
+    assert result["generation_metrics"]["chunks"] == 4
+    assert len(result["generation_metrics"]["chunk_metrics"]) == 4
+
+
+@pytest.mark.asyncio
+async def test_documents_within_budget_use_one_prompt():
+    client = PageAwareLLMClient()
+
+    result = await extract_fields_with_llm(_pages(2), DOC_CONFIG, client, max_chunk_tokens=10 ** 6)
+
+    assert client.prompts == 1
+    assert "chunks" not in result["generation_metrics"]
+    assert result["extracted_fields"]["company_name"]["value"] == "Demo"
@@ -0,0 +1,122 @@
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+from psycopg2 import pool as psycopg2_pool
+
+from src.config import DatabaseConfig
+from src.dms import connection_pool
+from src.dms.adapters import PostgresMetadataRepository
+from src.dms.connection_pool import PostgresConnectionPool
+
+
+class FakeThreadedPool:
+    """In-memory stand-in for psycopg2's ThreadedConnectionPool."""
+
+    def __init__(self, minconn, maxconn, **connect_kwargs):
+        self._pool = []
+        self.created = []
+        self.closed = []
+
+    def _connect(self):
+        conn = MagicMock(closed=0, autocommit=False)
+        conn.cursor.return_value.__enter__.return_value.rowcount = 1
+        self.created.append(conn)
+        return conn
+
+    def getconn(self):
+        return self._pool.pop() if self._pool else self._connect()
+
+    def putconn(self, conn, close=False):
+        if close:
+            conn.closed = 1
+            self.closed.append(conn)
+        else:
+            self._pool.append(conn)
+
+    def closeall(self):
+        for conn in self._pool:
+            conn.closed = 1
+
+
+@pytest.fixture
+def fake_pool():
+    with patch.object(connection_pool.psycopg2_pool, "ThreadedConnectionPool", FakeThreadedPool):
+        yield
+
+
+class TestPostgresConnectionPool:
+    """Test connection reuse, waiting, health checks and metrics."""
+
+    def test_repository_reuses_pooled_connection(self, fake_pool):
+        """Repository operations borrow one connection and hand it back."""
+        pool = PostgresConnectionPool(DatabaseConfig(), min_size=1, max_size=2)
+        repository = PostgresMetadataRepository(pool=pool)
+
+        for _ in range(5):
+            assert repository.update_processing_status("doc-1", "done") is True
+
+        assert len(pool._pool.created) == 1
+        stats = pool.stats()
+        assert stats["checkouts"] == 5
+        assert stats["in_use"] == 0
+        assert stats["idle"] == 1
+        assert pool._pool.created[0].autocommit is True
+
+    def test_waits_then_times_out_when_exhausted(self, fake_pool):
+        """Borrowers beyond max_size wait for a free connection and time out with PoolError."""
+        pool = PostgresConnectionPool(DatabaseConfig(), min_size=0, max_size=1, timeout=0.05)
+
+        with pool.connection():
+            with pytest.raises(psycopg2_pool.PoolError):
+                with pool.connection():
+                    pass
+
+        released = threading.Event()
+
+        def hold_then_release():
+            with pool.connection():
+                released.wait(1)
+
+        holder = threading.Thread(target=hold_then_release)
+        holder.start()
+        pool.timeout = 2
+        threading.Timer(0.05, released.set).start()
+        with pool.connection() as conn:
+            assert conn is pool._pool.created[0]
+        holder.join()
+
+        assert pool.stats()["timeouts"] == 1
+
+    def test_unhealthy_connection_is_replaced(self, fake_pool):
+        """A connection failing SELECT 1 after idling is discarded and replaced."""
+        pool = PostgresConnectionPool(DatabaseConfig(), min_size=0, max_size=2, health_check_interval=0)
+        with pool.connection() as first:
+            pass
+        first.cursor.return_value.__enter__.return_value.execute.side_effect = psycopg2.OperationalError("gone")
+
+        with pool.connection() as second:
+            assert second is not first
+
+        assert first in pool._pool.closed
+        assert pool.stats()["health_check_failures"] == 1
+
+    def test_error_in_block_rolls_back(self, fake_pool):
+        """An exception inside the block rolls back before the connection is returned."""
+        pool = PostgresConnectionPool(DatabaseConfig(), min_size=0, max_size=1)
+        with pytest.raises(RuntimeError):
+            with pool.connection() as conn:
+                raise RuntimeError("query failed")
+
+        conn.rollback.assert_called_once()
+        assert pool.stats()["in_use"] == 0
+
+    def test_pool_recreated_after_fork(self, fake_pool):
+        """A child process does not reuse the connections of its parent's pool."""
+        with patch.object(connection_pool, "_connection_pool", None):
+            parent_pool = connection_pool.get_connection_pool()
+            assert connection_pool.get_connection_pool() is parent_pool
+
+            with patch.object(connection_pool.os, "getpid", return_value=parent_pool.pid + 1):
+                assert connection_pool.get_connection_pool() is not parent_pool
@@ -29,6 +29,9 @@ class TestStorageClient:
     def download_bytes(self, container: str, blob_name: str) -> Optional[bytes]:
         return self._store.get((container, blob_name))
 
+    def blob_exists(self, container: str, blob_name: str) -> bool:
+        return (container, blob_name) in self._store
+
 
 @pytest.fixture(scope="session")
 def project_root() -> Path:
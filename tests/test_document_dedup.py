@@ -0,0 +1,149 @@
+import asyncio
+import hashlib
+from io import BytesIO
+from typing import Dict, Iterable, List, Optional, Tuple
+from unittest.mock import Mock, patch
+
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import get_dms_service
+from src.api.main import app
+from src.api.routes import api_config, process_document_background
+from src.dms.adapters import AzureBlobStorageClient
+from src.dms.service import UPLOAD_CHUNK_SIZE, DmsService, content_addressed_blob_name
+
+PDF_BYTES = b"%PDF-1.4\n" + bytes(range(256)) * 64
+
+
+class CountingStorageClient:
+    """In-memory StorageClient that counts uploaded bytes."""
+
+    def __init__(self) -> None:
+        self.blobs: Dict[Tuple[str, str], bytes] = {}
+        self.bytes_written = 0
+        self.chunk_sizes: List[int] = []
+
+    def upload_bytes(self, container: str, blob_name: str, data: bytes) -> None:
+        self.blobs[(container, blob_name)] = data
+        self.bytes_written += len(data)
+
+    def upload_stream(self, container: str, blob_name: str, chunks: Iterable[bytes]) -> None:
+        received = list(chunks)
+        self.chunk_sizes = [len(chunk) for chunk in received]
+        self.blobs[(container, blob_name)] = b"".join(received)
+        self.bytes_written += sum(self.chunk_sizes)
+
+    def download_bytes(self, container: str, blob_name: str) -> Optional[bytes]:
+        return self.blobs.get((container, blob_name))
+
+    def blob_exists(self, container: str, blob_name: str) -> bool:
+        return (container, blob_name) in self.blobs
+
+
+class InMemoryMetadataRepository:
+    def __init__(self) -> None:
+        self.documents: Dict[str, Dict[str, str]] = {}
+
+    def insert_document(self, document_id, dms_path, document_type, hash_sha256, source_filename, **kwargs) -> None:
+        self.documents[document_id] = {"id": document_id, "blob_path": dms_path, "hash_sha256": hash_sha256}
+
+    def get_document(self, document_id):
+        return self.documents.get(document_id)
+
+
+def _dms_service():
+    return DmsService(storage_client=CountingStorageClient(), metadata_repository=InMemoryMetadataRepository())
+
+
+def test_identical_uploads_share_one_blob():
+    dms_service = _dms_service()
+
+    dms_service.store_document("doc-1", "antrag.pdf", PDF_BYTES)
+    dms_service.store_document("doc-2", "antrag-kopie.PDF", PDF_BYTES)
+
+    expected_name = content_addressed_blob_name(hashlib.sha256(PDF_BYTES).hexdigest(), ".pdf")
+    assert list(dms_service.storage_client.blobs) == [("documents", expected_name)]
+    assert dms_service.storage_client.bytes_written == len(PDF_BYTES)
+    assert dms_service.download_document("doc-1") == PDF_BYTES
+    assert dms_service.download_document("doc-2") == PDF_BYTES
+
+
+def test_different_content_gets_its_own_blob():
+    dms_service = _dms_service()
+
+    dms_service.store_document("doc-1", "antrag.pdf", PDF_BYTES)
+    dms_service.store_document("doc-2", "antrag.pdf", PDF_BYTES + b"\n")
+
+    assert len(dms_service.storage_client.blobs) == 2
+    assert dms_service.download_document("doc-2") == PDF_BYTES + b"\n"
+
+
+def test_background_processing_writes_no_second_copy():
+    dms_service = _dms_service()
+    dms_service.store_document("doc-1", "antrag.pdf", PDF_BYTES)
+    processor = Mock()
+    processor.trigger_processing.return_value = "task-1"
+
+    with patch("src.api.routes.AsyncDocumentProcessor", return_value=processor):
+        asyncio.run(process_document_background("doc-1", "antrag.pdf", dms_service))
+
+    processor.trigger_processing.assert_called_once_with("doc-1")
+    assert dms_service.storage_client.bytes_written == len(PDF_BYTES)
+
+
+def test_file_objects_are_hashed_and_uploaded_in_chunks():
+    large_pdf = PDF_BYTES * 600
+    dms_service = _dms_service()
+
+    dms_service.store_document("doc-1", "scan.pdf", BytesIO(large_pdf))
+    dms_service.store_document("doc-2", "scan.pdf", large_pdf)
+
+    storage_client = dms_service.storage_client
+    assert len(large_pdf) > 2 * UPLOAD_CHUNK_SIZE
+    assert max(storage_client.chunk_sizes) == UPLOAD_CHUNK_SIZE
+    assert storage_client.bytes_written == len(large_pdf)
+    assert dms_service.download_document("doc-2") == large_pdf
+
+
+def test_azure_client_stages_blocks_and_commits_once():
+    blob_client = Mock()
+    service_client = Mock()
+    service_client.get_container_client.return_value.get_blob_client.return_value = blob_client
+
+    AzureBlobStorageClient(service_client).upload_stream("documents", "raw/x.pdf", [b"ab", b"cd", b"e"])
+
+    staged = [call.kwargs for call in blob_client.stage_block.call_args_list]
+    assert [block["data"] for block in staged] == [b"ab", b"cd", b"e"]
+    committed = blob_client.commit_block_list.call_args.args[0]
+    assert [block.id for block in committed] == [block["block_id"] for block in staged]
+    blob_client.upload_blob.assert_not_called()
+
+
+def _upload(dms_service, data):
+    app.dependency_overrides[get_dms_service] = lambda: dms_service
+    try:
+        with patch("src.api.routes.AsyncDocumentProcessor"):
+            return TestClient(app).post(
+                "/api/v1/upload", files={"file": ("scan.pdf", BytesIO(data), "application/pdf")}
+            )
+    finally:
+        app.dependency_overrides.pop(get_dms_service, None)
+
+
+def test_upload_streams_file_to_storage():
+    dms_service = _dms_service()
+
+    response = _upload(dms_service, PDF_BYTES)
+
+    assert response.status_code == 200
+    assert dms_service.download_document(response.json()["document_id"]) == PDF_BYTES
+
+
+def test_upload_over_size_limit_is_rejected(monkeypatch):
+    monkeypatch.setattr(api_config, "max_file_size", len(PDF_BYTES) - 1)
+    dms_service = _dms_service()
+
+    response = _upload(dms_service, PDF_BYTES)
+
+    assert response.status_code == 413
+    assert dms_service.storage_client.blobs == {}
@@ -0,0 +1,50 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from src.ocr import easyocr_client
+
+
+class TestStreamingOcr:
+    """Test page-by-page OCR on top of the rasterization backends."""
+
+    @pytest.fixture
+    def mock_reader(self):
+        """Reader that returns one text element per page."""
+        reader = Mock()
+        reader.readtext.return_value = [
+            ([[10, 20], [110, 20], [110, 40], [10, 40]], "Loan Amount:", 0.97)
+        ]
+        return reader
+
+    def test_pages_recognized_as_they_are_rasterized(self, mock_reader):
+        """Each page is OCR'd and yielded before the next one is rendered."""
+        rendered_pages = []
+
+        def render_pages(pdf_input, dpi, backend, pages=None):
+            for page_num in (1, 2, 3):
+                rendered_pages.append(page_num)
+                yield page_num, Mock(name=f"page-{page_num}")
+
+        with patch.object(easyocr_client, "get_reader", return_value=mock_reader), \
+             patch.object(easyocr_client, "iter_page_images", side_effect=render_pages):
+            page_iterator = easyocr_client.iter_text_bboxes_with_ocr("loan_application.pdf")
+
+            first_page_results = next(page_iterator)
+            # Only the first page has been rendered when its results are yielded
+            assert rendered_pages == [1]
+            assert first_page_results[0]["page_num"] == 1
+
+            remaining = list(page_iterator)
+
+        assert rendered_pages == [1, 2, 3]
+        assert [page[0]["page_num"] for page in remaining] == [2, 3]
+
+    def test_extract_without_images(self, mock_reader):
+        """keep_images=False returns all results and no page bitmaps."""
+        pages = [(1, Mock()), (2, Mock())]
+        with patch.object(easyocr_client, "get_reader", return_value=mock_reader), \
+             patch.object(easyocr_client, "iter_page_images", return_value=pages):
+            results, images = easyocr_client.extract_text_bboxes_with_ocr(b"%PDF-1.4", keep_images=False)
+
+        assert [result["page_num"] for result in results] == [1, 2]
+        assert images == []
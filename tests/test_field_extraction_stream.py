@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from src.llm.client import LLMClient
+from src.llm.config import DocumentTypeConfig
+from src.llm.field_extractor import ExtractedFieldsScanner, extract_fields_with_llm, generate_extraction_json
+
+RESPONSE = """Here is the result:
+```json
+{
+    // fields found in the document
+    "extracted_fields": {
+        "company_name": "Müller {Bau} \\"GmbH\\"",
+        "purchase_price": {"value": "€500.000"},
+        "website": "www.demo.example"
+    },
+    "missing_fields": ["vat_id"],
+    "validation_results": {}
+}
+```
+The company name was found on page 1 and the purchase price in the table."""
+
+DOC_CONFIG = DocumentTypeConfig(
+    name="credit_request",
+    expected_fields=["company_name", "purchase_price", "website", "vat_id"],
+    field_descriptions={"company_name": "Company Name"},
+    validation_rules={},
+)
+
+
+class ChunkedLLMClient(LLMClient):
+    """LLM client streaming a canned response in fixed-size chunks."""
+
+    def __init__(self, response, chunk_size=5):
+        self.response = response
+        self.chunk_size = chunk_size
+        self.chunks_sent = 0
+        self.closed = False
+
+    async def generate(self, prompt):
+        return self.response
+
+    async def generate_stream(self, prompt):
+        try:
+            for offset in range(0, len(self.response), self.chunk_size):
+                self.chunks_sent += 1
+                yield self.response[offset:offset + self.chunk_size]
+        finally:
+            self.closed = True
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, len(RESPONSE)])
+def test_scanner_finds_extracted_fields_for_any_chunking(chunk_size):
+    scanner = ExtractedFieldsScanner()
+    source = None
+    for offset in range(0, len(RESPONSE), chunk_size):
+        source = scanner.feed(RESPONSE[offset:offset + chunk_size])
+        if source is not None:
+            break
+
+    assert json.loads(source) == {
+        "company_name": 'Müller {Bau} "GmbH"',
+        "purchase_price": {"value": "€500.000"},
+        "website": "www.demo.example",
+    }
+    assert scanner.first_field_seen
+
+
+@pytest.mark.asyncio
+async def test_generation_stops_when_extracted_fields_closes():
+    client = ChunkedLLMClient(RESPONSE)
+
+    llm_result, metrics = await generate_extraction_json(client, "prompt")
+
+    assert llm_result["extracted_fields"]["purchase_price"] == {"value": "€500.000"}
+    assert client.closed
+    assert client.chunks_sent < len(RESPONSE) / client.chunk_size - 20
+    assert metrics["stopped_early"]
+    assert 0 <= metrics["time_to_first_token_seconds"] <= metrics["time_to_first_field_seconds"] <= metrics["total_seconds"]
+
+
+@pytest.mark.asyncio
+async def test_responses_without_extracted_fields_are_parsed_in_full():
+    client = ChunkedLLMClient('{"company_name": "DemoTech GmbH"}')
+
+    llm_result, metrics = await generate_extraction_json(client, "prompt")
+
+    assert llm_result == {"company_name": "DemoTech GmbH"}
+    assert not metrics["stopped_early"]
+    assert metrics["time_to_first_field_seconds"] is None
+
+
+@pytest.mark.asyncio
+async def test_missing_fields_are_derived_after_early_stop():
+    ocr_lines = [{"type": "text_line", "text": "Müller Bau GmbH"}]
+
+    streamed = await extract_fields_with_llm(ocr_lines, DOC_CONFIG, ChunkedLLMClient(RESPONSE))
+    blocking = await extract_fields_with_llm(ocr_lines, DOC_CONFIG, ChunkedLLMClient(RESPONSE), stream=False)
+
+    assert streamed["extracted_fields"] == blocking["extracted_fields"]
+    assert streamed["missing_fields"] == ["vat_id"] == blocking["missing_fields"]
+    assert streamed["generation_metrics"]["streamed"]
+    assert not blocking["generation_metrics"]["streamed"]
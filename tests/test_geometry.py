@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from src.ocr.geometry import BoxArray
+from src.ocr.spatial_analysis import reconstruct_split_text_elements
+
+
+def _line(text, x1, y1, x2, y2, confidence=0.9):
+    return {"text": text, "confidence": confidence, "page_num": 1,
+            "bbox": {"x1": x1, "y1": y1, "x2": x2, "y2": y2, "width": x2 - x1, "height": y2 - y1}}
+
+
+class TestBoxArray:
+    """Test the array-backed box geometry."""
+
+    def test_vectorized_measures(self):
+        """Centers and heights match the per-box formulas."""
+        boxes = BoxArray.from_bboxes([
+            {"x1": 0, "y1": 10, "x2": 40, "y2": 30},
+            {"x1": 50, "y1": 12, "x2": 90, "y2": 28},
+            {"x1": 85, "y1": 100, "x2": 120, "y2": 130},
+        ])
+
+        np.testing.assert_array_equal(boxes.y_centers, [20, 20, 115])
+        np.testing.assert_array_equal(boxes.heights, [20, 16, 30])
+        np.testing.assert_array_equal(boxes.x1, [0, 50, 85])
+
+    def test_empty(self):
+        """Empty input gives an empty (0, 4) array."""
+        assert BoxArray.from_bboxes([]).coords.shape == (0, 4)
+
+
+class TestReconstructSplitTextElements:
+    """Test merging of split label fragments on one row."""
+
+    def test_merges_only_close_text_pairs(self):
+        """Close non-value fragments merge pairwise; values and distant elements do not."""
+        row = [
+            _line("Street", 0, 100, 60, 120),
+            _line("Address", 70, 101, 140, 121),
+            _line("Main 5", 150, 100, 210, 120),
+            _line("Berlin", 400, 100, 460, 120),
+        ]
+
+        reconstructed = reconstruct_split_text_elements(row)
+
+        assert [element["text"] for element in reconstructed] == ["Street / Address", "Main 5", "Berlin"]
+        assert reconstructed[0]["type"] == "reconstructed"
+        assert reconstructed[0]["bbox"] == {"x1": 0, "y1": 100, "x2": 140, "y2": 121, "width": 140, "height": 21}
+        assert reconstructed[0]["confidence"] == pytest.approx(0.9)
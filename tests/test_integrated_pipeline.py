@@ -116,7 +116,7 @@ class TestIntegratedPipeline:
         with patch('src.integration.pipeline.get_storage', return_value=mock_storage_client), \
              patch('src.integration.pipeline.load_system_config') as mock_sys_config, \
              patch('src.integration.pipeline.load_document_config') as mock_doc_config, \
-             patch('src.integration.pipeline.OllamaClient') as mock_llm_client, \
+             patch('src.integration.pipeline.get_ollama_client') as mock_llm_client, \
              patch('src.integration.pipeline.extract_fields_with_llm') as mock_extract:
             
             # Setup mocks
@@ -141,14 +141,14 @@ class TestIntegratedPipeline:
     async def test_visualize_ocr_results(self, mock_ocr_results, mock_storage_client):
         """Test OCR visualization function."""
         with patch('src.visualization.ocr_visualization.get_storage', return_value=mock_storage_client), \
-             patch('src.visualization.ocr_visualization.convert_from_bytes') as mock_convert, \
+             patch('src.storage.document_source.get_storage', return_value=mock_storage_client), \
+             patch('src.visualization.ocr_visualization.iter_page_images') as mock_convert, \
              patch('src.visualization.ocr_visualization.plt') as mock_plt:
             
             # Setup mocks
             mock_image = Mock()
-            mock_image.width = 800
-            mock_image.height = 600
-            mock_convert.return_value = [mock_image]
+            mock_image.shape = (600, 800, 3)
+            mock_convert.return_value = [(1, mock_image)]
             
             # Mock plt.subplots to return fig and ax
             mock_fig = Mock()
@@ -160,11 +160,50 @@ class TestIntegratedPipeline:
             
             # Verify storage was called for visualization upload
             mock_storage_client.upload_blob.assert_called()
+            # Only pages with OCR elements are rasterized
+            assert mock_convert.call_args.kwargs["pages"] == {
+                line["page_num"] for line in mock_ocr_results["original_lines"]
+            }
+    
+    def test_visualize_ocr_results_with_pdf_data(self, mock_pdf_data, mock_ocr_results, mock_storage_client):
+        """Bytes passed by the caller are rendered without a download and the PNG is uploaded."""
+        with patch('src.visualization.ocr_visualization.get_storage', return_value=mock_storage_client), \
+             patch('src.visualization.ocr_visualization.iter_page_images') as mock_convert, \
+             patch('src.visualization.ocr_visualization.plt') as mock_plt:
+            mock_image = Mock()
+            mock_image.shape = (600, 800, 3)
+            mock_convert.return_value = [(1, mock_image)]
+            mock_plt.subplots.return_value = (Mock(), Mock())
+            
+            visualize_ocr_results("test-doc-001", mock_ocr_results["original_lines"], pdf_data=mock_pdf_data)
+            
+            assert mock_convert.call_args.args[0] == mock_pdf_data
+            mock_storage_client.download_blob.assert_not_called()
+            upload_kwargs = mock_storage_client.upload_blob.call_args.kwargs
+            assert upload_kwargs["stage"] == Stage.ANNOTATED
+            assert upload_kwargs["ext"] == "_page_1.png"
+    
+    @pytest.mark.asyncio
+    async def test_integrated_pipeline_reads_api_upload_from_dms(self, mock_pdf_data, mock_ocr_results, mock_llm_results, mock_storage_client):
+        """API uploads exist only at their content-addressed DMS path, not in the raw stage."""
+        blob_path = "raw/sha256/" + "a" * 64 + ".pdf"
+        with patch('src.storage.document_source.get_storage', return_value=mock_storage_client), \
+             patch('src.storage.document_source.AzureBlobStorageClient') as mock_dms_storage, \
+             patch('src.integration.orchestration.process_document_with_ocr', return_value=mock_ocr_results) as mock_ocr, \
+             patch('src.integration.orchestration.process_document_with_llm', return_value=mock_llm_results), \
+             patch('src.integration.orchestration.visualize_ocr_results'):
+            mock_dms_storage.return_value.download_bytes.return_value = mock_pdf_data
+            
+            await integrated_pipeline("test-doc-001", "test.pdf", blob_path)
+            
+            mock_dms_storage.return_value.download_bytes.assert_called_once_with("documents", blob_path)
+            mock_storage_client.download_blob.assert_not_called()
+            mock_ocr.assert_called_once_with("test-doc-001", mock_pdf_data)
     
     @pytest.mark.asyncio
     async def test_integrated_pipeline_success(self, mock_pdf_data, mock_ocr_results, mock_llm_results, mock_storage_client):
         """Test complete integrated pipeline."""
-        with patch('src.integration.orchestration.get_storage', return_value=mock_storage_client), \
+        with patch('src.storage.document_source.get_storage', return_value=mock_storage_client), \
              patch('src.integration.orchestration.process_document_with_ocr') as mock_ocr, \
              patch('src.integration.orchestration.process_document_with_llm') as mock_llm, \
              patch('src.integration.orchestration.visualize_ocr_results') as mock_viz:
@@ -188,12 +227,12 @@ class TestIntegratedPipeline:
             # Verify all processing steps were called
             mock_ocr.assert_called_once_with("test-doc-001", mock_pdf_data)
             mock_llm.assert_called_once_with("test-doc-001", mock_ocr_results)
-            mock_viz.assert_called_once_with("test-doc-001", mock_ocr_results["original_lines"])
+            mock_viz.assert_called_once_with("test-doc-001", mock_ocr_results["original_lines"], pdf_data=mock_pdf_data)
     
     @pytest.mark.asyncio
     async def test_integrated_pipeline_document_not_found(self, mock_storage_client):
         """Test integrated pipeline when document is not found."""
-        with patch('src.integration.orchestration.get_storage', return_value=mock_storage_client):
+        with patch('src.storage.document_source.get_storage', return_value=mock_storage_client):
             # Setup mock to return None (document not found)
             mock_storage_client.download_blob.return_value = None
             
@@ -234,14 +273,14 @@ class TestPipelineIntegration:
         filename = "loan_application.pdf"
         blob_path = "raw/integration-test-001.pdf"
         
-        with patch('src.integration.orchestration.get_storage') as mock_storage, \
+        with patch('src.storage.document_source.get_storage') as mock_storage, \
              patch('src.integration.pipeline.extract_text_bboxes_with_ocr') as mock_extract, \
              patch('src.integration.pipeline.normalize_ocr_lines') as mock_normalize, \
              patch('src.integration.pipeline.convert_numpy_types') as mock_convert, \
              patch('src.integration.pipeline.load_system_config') as mock_sys_config, \
              patch('src.integration.pipeline.load_document_config') as mock_doc_config, \
              patch('src.integration.pipeline.extract_fields_with_llm') as mock_llm_extract, \
-             patch('src.visualization.ocr_visualization.convert_from_bytes') as mock_convert_viz, \
+             patch('src.visualization.ocr_visualization.iter_page_images') as mock_convert_viz, \
              patch('src.visualization.ocr_visualization.plt') as mock_plt:
             
             # Setup all mocks
@@ -254,9 +293,8 @@ class TestPipelineIntegration:
             mock_llm_extract.return_value = {"extracted_fields": {"test": "value"}, "missing_fields": [], "validation_results": {}}
             
             mock_image = Mock()
-            mock_image.width = 800
-            mock_image.height = 600
-            mock_convert_viz.return_value = [mock_image]
+            mock_image.shape = (600, 800, 3)
+            mock_convert_viz.return_value = [(1, mock_image)]
             
             # Run the complete pipeline
             result = await integrated_pipeline(document_id, filename, blob_path)
@@ -0,0 +1,160 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from src.llm import client as llm_client
+from src.llm.client import OllamaClient, get_ollama_client
+from src.tasks.worker_loop import close_worker_loop, run_in_worker_loop
+
+
+class StubOllama:
+    """Local /api/generate stub that records the client connection of each request."""
+
+    def __init__(self):
+        self.peers = []
+        self.runner = None
+        self.url = None
+
+    async def handle_generate(self, request):
+        payload = await request.json()
+        self.peers.append(request.transport.get_extra_info("peername"))
+        return web.json_response({"model": payload["model"], "response": f"echo: {payload['prompt']}"})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/api/generate", self.handle_generate)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_calls_reuse_one_pooled_connection():
+    stub = StubOllama()
+    await stub.start()
+    try:
+        async with OllamaClient(stub.url, "llama3.1:8b") as client:
+            responses = [await client.generate(f"prompt {index}") for index in range(5)]
+
+        assert responses == [f"echo: prompt {index}" for index in range(5)]
+        assert len(set(stub.peers)) == 1
+        assert client.sessions_opened == 1
+        assert client._sessions == {}
+    finally:
+        await stub.stop()
+
+
+@pytest.mark.asyncio
+async def test_error_responses_raise():
+    async def fail(request):
+        return web.Response(status=500, text="model not found")
+
+    app = web.Application()
+    app.router.add_post("/api/generate", fail)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        async with OllamaClient(f"http://127.0.0.1:{port}", "missing") as client:
+            with pytest.raises(Exception, match="model not found"):
+                await client.generate("prompt")
+    finally:
+        await runner.cleanup()
+
+
+def test_shared_client_survives_across_tasks_on_the_worker_loop():
+    stub = StubOllama()
+    run_in_worker_loop(stub.start())
+    try:
+        for index in range(3):
+            client = get_ollama_client(stub.url, "llama3.1:8b", max_connections_per_host=2)
+            assert run_in_worker_loop(client.generate(f"document {index}")) == f"echo: document {index}"
+
+        assert get_ollama_client(stub.url.rstrip("/"), "llama3.1:8b") is client
+        assert client.max_connections_per_host == 2
+        assert client.sessions_opened == 1
+        assert len(set(stub.peers)) == 1
+    finally:
+        run_in_worker_loop(stub.stop())
+        close_worker_loop()
+    assert llm_client._clients == {}
+
+
+def test_each_event_loop_gets_its_own_session():
+    client = OllamaClient("http://127.0.0.1:11435", "llama3.1:8b")
+    first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        first_session = first_loop.run_until_complete(client._get_session())
+        assert first_loop.run_until_complete(client._get_session()) is first_session
+
+        second_session = second_loop.run_until_complete(client._get_session())
+        assert second_session is not first_session
+        # The first loop keeps its session instead of having it replaced
+        assert first_loop.run_until_complete(client._get_session()) is first_session
+        assert client.sessions_opened == 2
+
+        second_loop.run_until_complete(client.close())
+        assert second_session.closed and not first_session.closed
+        first_loop.run_until_complete(client.close())
+        assert first_session.closed
+        assert client._sessions == {}
+    finally:
+        first_loop.close()
+        second_loop.close()
+
+
+def test_sessions_are_closed_when_their_loop_shuts_down():
+    client = OllamaClient("http://127.0.0.1:11435", "llama3.1:8b")
+
+    sessions = [asyncio.run(client._get_session()) for _ in range(3)]
+
+    assert len(set(map(id, sessions))) == 3
+    assert all(session.closed for session in sessions)
+    assert client._sessions == {}
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_ndjson_chunks_and_closing_early_aborts_generation():
+    sent = []
+
+    async def stream_generate(request):
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        try:
+            for index in range(200):
+                await response.write(json.dumps({"response": f"t{index} ", "done": False}).encode() + b"\n")
+                sent.append(index)
+                await asyncio.sleep(0.005)
+            await response.write(json.dumps({"response": "", "done": True}).encode() + b"\n")
+        except ConnectionResetError:
+            pass
+        return response
+
+    app = web.Application()
+    app.router.add_post("/api/generate", stream_generate)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        async with OllamaClient(f"http://127.0.0.1:{port}", "llama3.1:8b") as client:
+            stream = client.generate_stream("prompt")
+            chunks = [await stream.__anext__() for _ in range(3)]
+            await stream.aclose()
+            await asyncio.sleep(0.2)
+
+        assert chunks == ["t0 ", "t1 ", "t2 "]
+        assert len(sent) < 100
+    finally:
+        await runner.cleanup()
@@ -0,0 +1,219 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.llm.client import LLMClient
+from src.llm.field_extractor import generate_extraction_json
+from src.llm import response_cache
+from src.llm.response_cache import (
+    REDIS_BYTES_KEY, REDIS_KEY_PREFIX, CachedLLMClient, CachedResponse, LlmResponseCache, LruTtlCache,
+    compute_prompt_key,
+)
+
+RESPONSE = '{"extracted_fields": {"company_name": "DemoTech GmbH"}, "missing_fields": ["vat_id"]} Anything else?'
+
+
+class CountingLLMClient(LLMClient):
+    def __init__(self, model_name="llama3.1:8b", options=None):
+        self.model_name = model_name
+        self.options = options
+        self.calls = 0
+
+    async def generate(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return RESPONSE
+
+    async def generate_stream(self, prompt):
+        self.calls += 1
+        for offset in range(0, len(RESPONSE), 4):
+            yield RESPONSE[offset:offset + 4]
+
+
+class FakeRedis:
+    """The redis.Redis calls the response cache makes, on plain dicts."""
+
+    def __init__(self):
+        self.values = {}
+        self.sorted_sets = {}
+        self.hashes = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def delete(self, *keys):
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    def incrby(self, key, amount):
+        self.values[key] = int(self.values.get(key, 0)) + amount
+        return self.values[key]
+
+    def decrby(self, key, amount):
+        return self.incrby(key, -amount)
+
+    def zadd(self, key, mapping):
+        self.sorted_sets.setdefault(key, {}).update(mapping)
+
+    def zpopmin(self, key, count=1):
+        members = sorted(self.sorted_sets.get(key, {}).items(), key=lambda item: item[1])[:count]
+        for name, _ in members:
+            del self.sorted_sets[key][name]
+        return members
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = str(value).encode()
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hmget(self, key, fields):
+        return [self.hget(key, field) for field in fields]
+
+    def hdel(self, key, *fields):
+        return sum(self.hashes.get(key, {}).pop(field, None) is not None for field in fields)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.redis_client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class BrokenRedis:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, key):
+        self.calls += 1
+        raise ConnectionError("redis down")
+
+    set = get
+
+
+def test_keys_depend_on_model_options_and_prompt():
+    key = compute_prompt_key("llama3.1:8b", {"temperature": 0}, "prompt")
+
+    assert key == compute_prompt_key("llama3.1:8b", {"temperature": 0}, "prompt")
+    assert key != compute_prompt_key("llama3.1:70b", {"temperature": 0}, "prompt")
+    assert key != compute_prompt_key("llama3.1:8b", {"temperature": 0.7}, "prompt")
+    assert key != compute_prompt_key("llama3.1:8b", {"temperature": 0}, "prompt ")
+
+
+def test_lru_evicts_least_recently_used_and_expired_entries():
+    cache = LruTtlCache(max_entries=2, ttl_seconds=60)
+    for key in ("a", "b"):
+        cache.put(key, CachedResponse(key, True, 1.0))
+    cache.get("a")
+    cache.put("c", CachedResponse("c", True, 1.0))
+
+    assert cache.get("b") is None
+    assert cache.get("a").text == "a"
+    assert cache.evictions == 1
+
+    expiring = LruTtlCache(max_entries=2, ttl_seconds=0.01)
+    expiring.put("a", CachedResponse("a", True, 1.0))
+    time.sleep(0.02)
+    assert expiring.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_repeated_prompts_are_served_from_cache_with_stats():
+    client = CountingLLMClient()
+    cached_client = CachedLLMClient(client, LlmResponseCache())
+
+    responses = [await cached_client.generate("prompt") for _ in range(3)]
+
+    assert responses == [RESPONSE] * 3
+    assert client.calls == 1
+    stats = cached_client.cache.stats()
+    assert (stats["memory_hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+    assert stats["saved_seconds"] > 0
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_between_processes():
+    redis_client = FakeRedis()
+    first = CachedLLMClient(CountingLLMClient(), LlmResponseCache(redis_client=redis_client))
+    second_client = CountingLLMClient()
+    second = CachedLLMClient(second_client, LlmResponseCache(redis_client=redis_client))
+
+    await first.generate("prompt")
+    assert await second.generate("prompt") == RESPONSE
+
+    assert second_client.calls == 0
+    assert second.cache.stats()["redis_hits"] == 1
+    assert await second.generate("prompt") == RESPONSE
+    assert second.cache.stats()["memory_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_stays_within_its_byte_budget():
+    redis_client = FakeRedis()
+    entry_bytes = len(CachedResponse(RESPONSE, True, 0.0).to_json().encode("utf-8"))
+    # Room for two entries, whatever digits their generation_seconds take
+    cache = LlmResponseCache(redis_client=redis_client, redis_max_bytes=2 * entry_bytes + 60)
+    cached_client = CachedLLMClient(CountingLLMClient(), cache)
+
+    for index in range(5):
+        await cached_client.generate(f"prompt {index}")
+
+    stored = [key for key in redis_client.values if key.startswith(REDIS_KEY_PREFIX)]
+    assert stored == [REDIS_KEY_PREFIX + cached_client._key(f"prompt {index}") for index in (3, 4)]
+    assert redis_client.values[REDIS_BYTES_KEY] == sum(len(redis_client.values[key]) for key in stored)
+    assert cache.stats()["redis_evictions"] == 3
+
+
+def test_redis_tier_uses_its_own_database(monkeypatch):
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_REDIS_DB", "3")
+    monkeypatch.setattr(response_cache, "_response_cache", None)
+
+    with patch("redis.Redis") as mock_redis:
+        cache = response_cache.get_llm_response_cache()
+
+    assert mock_redis.call_args.kwargs["db"] == 3
+    assert cache.redis_max_bytes == 64 * 1024 * 1024
+    monkeypatch.setattr(response_cache, "_response_cache", None)
+
+
+@pytest.mark.asyncio
+async def test_redis_failures_fall_back_to_the_model():
+    redis_client = BrokenRedis()
+    client = CountingLLMClient()
+    cached_client = CachedLLMClient(client, LlmResponseCache(redis_client=redis_client))
+
+    assert await cached_client.generate("first") == RESPONSE
+    assert await cached_client.generate("second") == RESPONSE
+
+    assert client.calls == 2
+    assert redis_client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_early_stopped_streams_are_replayed_for_streaming_callers_only():
+    client = CountingLLMClient()
+    cached_client = CachedLLMClient(client, LlmResponseCache())
+
+    first_result, _ = await generate_extraction_json(cached_client, "prompt")
+    second_result, second_metrics = await generate_extraction_json(cached_client, "prompt")
+
+    assert first_result == second_result == {"extracted_fields": {"company_name": "DemoTech GmbH"}}
+    assert second_metrics["stopped_early"]
+    assert client.calls == 1
+    # The cached text stops after extracted_fields, so a blocking caller regenerates the full response
+    assert await cached_client.generate("prompt") == RESPONSE
+    assert client.calls == 2
@@ -134,7 +134,8 @@ class TestNotebook04Integration:
         ]
         
         with patch('src.visualization.ocr_visualization.get_storage') as mock_get_storage, \
-             patch('src.visualization.ocr_visualization.convert_from_bytes') as mock_convert, \
+             patch('src.storage.document_source.get_storage', new=mock_get_storage), \
+             patch('src.visualization.ocr_visualization.iter_page_images') as mock_convert, \
              patch('src.visualization.ocr_visualization.plt') as mock_plt:
             
             # Setup mocks
@@ -143,9 +144,8 @@ class TestNotebook04Integration:
             mock_storage.download_blob.return_value = b"mock pdf data"
             
             mock_image = Mock()
-            mock_image.width = 800
-            mock_image.height = 600
-            mock_convert.return_value = [mock_image]
+            mock_image.shape = (600, 800, 3)
+            mock_convert.return_value = [(1, mock_image)]
             
             # Mock plt.subplots to return fig and ax
             mock_fig = Mock()
@@ -161,7 +161,7 @@ class TestNotebook04Integration:
     @pytest.mark.asyncio
     async def test_complete_integrated_pipeline(self, sample_pdf_data, document_metadata):
         """Test the complete integrated pipeline (as executed in notebook 04)."""
-        with patch('src.integration.orchestration.get_storage') as mock_get_storage, \
+        with patch('src.storage.document_source.get_storage') as mock_get_storage, \
              patch('src.integration.orchestration.process_document_with_ocr') as mock_ocr, \
              patch('src.integration.orchestration.process_document_with_llm') as mock_llm, \
              patch('src.integration.orchestration.visualize_ocr_results') as mock_viz:
@@ -215,7 +215,9 @@ class TestNotebook04Integration:
             # Verify all processing steps were called
             mock_ocr.assert_called_once_with(document_metadata["document_id"], sample_pdf_data)
             mock_llm.assert_called_once_with(document_metadata["document_id"], mock_ocr_results)
-            mock_viz.assert_called_once_with(document_metadata["document_id"], mock_ocr_results["original_lines"])
+            mock_viz.assert_called_once_with(
+                document_metadata["document_id"], mock_ocr_results["original_lines"], pdf_data=sample_pdf_data
+            )
     
     def test_system_config_loading(self):
         """Test system configuration loading (as used in notebook 04)."""
@@ -265,7 +267,7 @@ class TestNotebook04Workflow:
             mock_storage.upload_blob.assert_called_once()
         
         # Step 3: Run integrated pipeline (as in notebook 04)
-        with patch('src.integration.orchestration.get_storage') as mock_get_storage, \
+        with patch('src.storage.document_source.get_storage') as mock_get_storage, \
              patch('src.integration.orchestration.process_document_with_ocr') as mock_ocr, \
              patch('src.integration.orchestration.process_document_with_llm') as mock_llm, \
              patch('src.integration.orchestration.visualize_ocr_results') as mock_viz:
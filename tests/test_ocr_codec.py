@@ -0,0 +1,102 @@
+import json
+import random
+from unittest.mock import patch
+
+import pytest
+
+from src.integration.pipeline import load_ocr_results, save_ocr_results
+from src.storage import ocr_codec
+from src.storage.ocr_codec import (
+    OCR_COLUMNAR_EXT, ColumnarOcrArtifact, decode_ocr_artifact, encode_ocr_artifact, is_columnar_artifact,
+)
+from src.storage.storage import Stage, build_document_envelope
+
+
+def _ocr_results(pages=3, lines_per_page=40, seed=0):
+    rng = random.Random(seed)
+    original_lines = []
+    for page_num in range(1, pages + 1):
+        for index in range(lines_per_page):
+            x1, y1 = rng.uniform(0, 1100), rng.uniform(0, 1600)
+            x2, y2 = x1 + rng.uniform(10, 300), y1 + rng.uniform(10, 20)
+            original_lines.append({
+                "page_num": page_num,
+                "text": f"Zeile {index} – Betrag {rng.randint(0, 99999)} €",
+                "confidence": rng.random(),
+                "bbox": {"x1": x1, "y1": y1, "x2": x2, "y2": y2, "width": x2 - x1, "height": y2 - y1},
+            })
+    return {
+        "document_id": "doc-1",
+        "processing_metadata": {"total_elements": len(original_lines)},
+        "normalized_lines": [{"type": "label_value", "label": "Firma", "value": "DemoTech", "page": 1}],
+        "original_lines": original_lines,
+    }
+
+
+def test_round_trip_is_lossless():
+    envelope = build_document_envelope("doc-1", _ocr_results(), {"stage": "ocr"})
+
+    blob = encode_ocr_artifact(envelope, codec="gzip")
+
+    assert is_columnar_artifact(blob)
+    assert decode_ocr_artifact(blob) == envelope
+    bare_results = _ocr_results(pages=1)
+    assert decode_ocr_artifact(encode_ocr_artifact(bare_results, codec="gzip")) == bare_results
+
+
+def test_columnar_artifact_is_smaller_than_json():
+    envelope = build_document_envelope("doc-1", _ocr_results(pages=5, lines_per_page=200))
+    json_size = len(json.dumps(envelope, indent=2, ensure_ascii=False).encode("utf-8"))
+
+    assert len(encode_ocr_artifact(envelope, codec="gzip")) < json_size / 3
+
+
+def test_single_page_is_decoded_without_other_pages():
+    results = _ocr_results()
+    blob = encode_ocr_artifact(results, codec="gzip")
+    artifact = ColumnarOcrArtifact(blob)
+
+    with patch.object(ocr_codec, "_decompress", wraps=ocr_codec._decompress) as decompress:
+        page_two = artifact.read_page(2)
+
+    assert decompress.call_count == 1
+    assert page_two == [line for line in results["original_lines"] if line["page_num"] == 2]
+    assert artifact.read_page(9) == []
+    assert [entry["count"] for entry in artifact.pages] == [40, 40, 40]
+    assert decode_ocr_artifact(blob, pages=[3])["original_lines"] == results["original_lines"][80:]
+
+
+def test_invalid_blobs_and_codecs_are_rejected():
+    with pytest.raises(ValueError):
+        ColumnarOcrArtifact(b'{"data": {}}')
+    with pytest.raises(ValueError):
+        encode_ocr_artifact(_ocr_results(), codec="lz4")
+    if ocr_codec.zstandard is None:
+        with pytest.raises(ValueError):
+            encode_ocr_artifact(_ocr_results(), codec="zstd")
+
+
+class RecordingStorage:
+    def __init__(self):
+        self.blobs = {}
+
+    def upload_blob(self, uuid, stage, ext, data, overwrite=True):
+        self.blobs[(stage, ext)] = data
+
+    def download_blob(self, uuid, stage, ext):
+        return self.blobs.get((stage, ext))
+
+
+def test_save_and_load_columnar_ocr_results():
+    storage = RecordingStorage()
+    results = _ocr_results()
+
+    with patch("src.integration.pipeline.get_storage", return_value=storage), \
+            patch("src.integration.ocr_index.get_storage", return_value=storage):
+        save_ocr_results("doc-1", results, artifact_format="columnar")
+        loaded = load_ocr_results("doc-1")
+
+    assert (Stage.OCR, ".json") not in storage.blobs
+    assert is_columnar_artifact(storage.blobs[(Stage.OCR, OCR_COLUMNAR_EXT)])
+    assert loaded["data"] == results
+    assert loaded["metadata"]["stage"] == "ocr"
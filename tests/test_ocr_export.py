@@ -0,0 +1,159 @@
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import get_blob_storage, get_metadata_repository
+from src.api.main import app
+from src.integration.ocr_export import JsonArrayStreamParser
+from src.storage.ocr_codec import OCR_COLUMNAR_EXT, encode_ocr_artifact
+from src.storage.storage import Stage
+
+DOCUMENT_ID = "export-document"
+
+OCR_ARTIFACT = {
+    "document_uuid": DOCUMENT_ID,
+    "timestamp": "2024-01-01T00:00:00",
+    "data": {
+        "processing_metadata": {"original_lines": "not an array", "total_elements": 3},
+        "normalized_lines": [{"label": "Firmenname", "value": "Müller & Söhne {GmbH}"}],
+        "original_lines": [
+            {
+                "text": 'Quote " and \\ backslash ] }',
+                "confidence": 0.9,
+                "bbox": {"x1": 1, "y1": 2, "x2": 11, "y2": 12, "width": 10, "height": 10},
+                "page_num": 1,
+            },
+            {
+                "text": "Größe [m²]",
+                "confidence": 0.8,
+                "bbox": {"x1": 3, "y1": 4, "x2": 13, "y2": 14, "width": 10, "height": 10},
+                "page_num": 2,
+            },
+        ],
+    },
+    "metadata": {"stage": "ocr"},
+}
+ARTIFACT_BYTES = json.dumps(OCR_ARTIFACT, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _parse(data, chunk_size, keys):
+    parser = JsonArrayStreamParser(keys)
+    items = []
+    for offset in range(0, len(data), chunk_size):
+        items.extend(parser.feed(data[offset:offset + chunk_size]))
+    parser.close()
+    return items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, len(ARTIFACT_BYTES)])
+def test_parser_matches_json_loads_for_any_chunking(chunk_size):
+    items = _parse(ARTIFACT_BYTES, chunk_size, ["original_lines", "normalized_lines"])
+
+    assert items == (
+        [("normalized_lines", line) for line in OCR_ARTIFACT["data"]["normalized_lines"]]
+        + [("original_lines", line) for line in OCR_ARTIFACT["data"]["original_lines"]]
+    )
+
+
+def test_parser_only_buffers_the_current_item():
+    lines = [{"text": f"line {index}", "page_num": 1} for index in range(2000)]
+    data = json.dumps({"data": {"original_lines": lines}}).encode("utf-8")
+    parser = JsonArrayStreamParser(["original_lines"])
+    largest_buffer = 0
+
+    for offset in range(0, len(data), 256):
+        parser.feed(data[offset:offset + 256])
+        largest_buffer = max(largest_buffer, len(parser._buffer))
+
+    assert largest_buffer < 512
+
+
+def test_parser_rejects_truncated_documents():
+    parser = JsonArrayStreamParser(["original_lines"])
+    parser.feed(ARTIFACT_BYTES[:-10])
+
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+class StreamingBlobStorage:
+    def __init__(self, blobs, chunk_size=16):
+        self.blobs = blobs
+        self.chunk_size = chunk_size
+
+    async def open_blob_stream(self, uuid, stage, ext):
+        data = self.blobs.get((stage, ext))
+        if data is None:
+            return None
+
+        async def chunks():
+            for offset in range(0, len(data), self.chunk_size):
+                yield data[offset:offset + self.chunk_size]
+
+        return chunks()
+
+    async def download_blob(self, uuid, stage, ext):
+        return self.blobs.get((stage, ext))
+
+
+def _export(blob_storage, document=True, params=None):
+    metadata_repository = Mock()
+    metadata_repository.get_document = AsyncMock(return_value={"id": DOCUMENT_ID} if document else None)
+    app.dependency_overrides[get_metadata_repository] = lambda: metadata_repository
+    app.dependency_overrides[get_blob_storage] = lambda: blob_storage
+    try:
+        return TestClient(app).get(f"/api/v1/export/{DOCUMENT_ID}/ocr", params=params)
+    finally:
+        app.dependency_overrides.pop(get_metadata_repository, None)
+        app.dependency_overrides.pop(get_blob_storage, None)
+
+
+def test_export_streams_ndjson():
+    response = _export(StreamingBlobStorage({(Stage.OCR, ".json"): ARTIFACT_BYTES}))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["type"] for record in records] == ["ocr_element", "ocr_element"]
+    assert records[0] == {
+        "type": "ocr_element",
+        "document_id": DOCUMENT_ID,
+        "text": 'Quote " and \\ backslash ] }',
+        "confidence": 0.9,
+        "bbox": {"x1": 1, "y1": 2, "width": 10, "height": 10},
+        "page_num": 1,
+    }
+    assert records[1]["text"] == "Größe [m²]"
+
+
+def test_export_includes_normalized_lines_on_request():
+    response = _export(
+        StreamingBlobStorage({(Stage.OCR, ".json"): ARTIFACT_BYTES}), params={"include_normalized": "true"}
+    )
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["type"] for record in records] == ["normalized_line", "ocr_element", "ocr_element"]
+    assert records[0]["value"] == "Müller & Söhne {GmbH}"
+
+
+def test_export_reads_columnar_artifacts():
+    json_response = _export(
+        StreamingBlobStorage({(Stage.OCR, ".json"): ARTIFACT_BYTES}), params={"include_normalized": "true"}
+    )
+    columnar_blob = encode_ocr_artifact(OCR_ARTIFACT, codec="gzip")
+
+    response = _export(
+        StreamingBlobStorage({(Stage.OCR, OCR_COLUMNAR_EXT): columnar_blob}), params={"include_normalized": "true"}
+    )
+
+    assert response.status_code == 200
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        json.loads(line) for line in json_response.text.splitlines()
+    ]
+
+
+def test_export_missing_document_or_artifact_is_404():
+    assert _export(StreamingBlobStorage({}), document=False).status_code == 404
+    assert _export(StreamingBlobStorage({})).status_code == 404
@@ -0,0 +1,237 @@
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import get_blob_storage, get_metadata_repository
+from src.api.main import app
+from src.integration.ocr_index import (
+    OCR_INDEX_EXT, build_ocr_page_shards, page_shard_ext, parse_cursor, plan_shard_reads,
+    save_ocr_page_index, select_ocr_elements,
+)
+from src.integration.results import (
+    RESULTS_EXT, RESULTS_FIELDS_EXT, build_results_payload, resolve_results_sections, save_results_document,
+)
+from src.storage.blob_operations import delete_ocr_results_from_bucket
+from src.storage.storage import Stage
+
+DOCUMENT_ID = "paged-document"
+
+
+def _line(text, confidence, page_num):
+    return {
+        "text": text,
+        "confidence": confidence,
+        "bbox": {"x1": 0, "y1": 0, "x2": 10, "y2": 10, "width": 10, "height": 10},
+        "page_num": page_num,
+    }
+
+
+# Three pages; page 2 holds only low-confidence elements
+OCR_CONTENT = {
+    "original_lines": [
+        _line("p1 a", 0.95, 1),
+        _line("p1 b", 0.40, 1),
+        _line("p1 c", 0.90, 1),
+        _line("p2 a", 0.30, 2),
+        _line("p2 b", 0.20, 2),
+        _line("p3 a", 0.99, 3),
+        _line("p3 b", 0.85, 3),
+    ],
+    "normalized_lines": [],
+}
+
+LLM_CONTENT = {
+    "extraction_results": {
+        "extracted_fields": {"company_name": {"value": "DemoTech Solutions GmbH", "confidence": 0.9}},
+        "validation_results": [],
+    }
+}
+
+
+class RecordingStorage:
+    def __init__(self):
+        self.blobs = {}
+
+    def upload_blob(self, uuid, stage, ext, data, overwrite=True):
+        self.blobs[(stage, ext)] = data
+
+
+class InMemoryBlobStorage:
+    """Async storage over the blobs written by the pipeline, recording reads."""
+
+    def __init__(self, blobs):
+        self.blobs = blobs
+        self.downloads = []
+
+    async def download_blob(self, uuid, stage, ext):
+        self.downloads.append((stage, ext))
+        return self.blobs.get((stage, ext))
+
+    async def blob_exists(self, uuid, stage, ext):
+        return False
+
+
+def _pipeline_blobs(with_index=True):
+    storage = RecordingStorage()
+    save_results_document(DOCUMENT_ID, OCR_CONTENT, LLM_CONTENT, storage=storage)
+    if with_index:
+        save_ocr_page_index(DOCUMENT_ID, OCR_CONTENT, storage=storage)
+    return storage.blobs
+
+
+def _get(blob_storage, params=None):
+    metadata_repository = Mock()
+    metadata_repository.get_document = AsyncMock(return_value={
+        "id": DOCUMENT_ID, "filename": "loan_application.pdf", "processing_status": "done",
+    })
+    app.dependency_overrides[get_metadata_repository] = lambda: metadata_repository
+    app.dependency_overrides[get_blob_storage] = lambda: blob_storage
+    try:
+        return TestClient(app).get(f"/api/v1/results/{DOCUMENT_ID}", params=params)
+    finally:
+        app.dependency_overrides.pop(get_metadata_repository, None)
+        app.dependency_overrides.pop(get_blob_storage, None)
+
+
+def test_build_ocr_page_shards_indexes_pages():
+    index, shards = build_ocr_page_shards(OCR_CONTENT)
+
+    assert index["total_elements"] == 7
+    assert [(entry["page_num"], entry["start"], entry["count"]) for entry in index["pages"]] == [
+        (1, 0, 3), (2, 3, 2), (3, 5, 2),
+    ]
+    assert index["pages"][1]["max_confidence"] == 0.30
+    assert [element["element_index"] for element in shards[3]] == [5, 6]
+    assert set(shards[1][0]["bbox"]) == {"x1", "y1", "width", "height"}
+
+
+def test_plan_shard_reads_skips_pages_by_cursor_and_confidence():
+    index, _ = build_ocr_page_shards(OCR_CONTENT)
+
+    assert [entry["page_num"] for entry in plan_shard_reads(index, min_confidence=0.5)] == [1, 3]
+    assert [entry["page_num"] for entry in plan_shard_reads(index, start=3)] == [2, 3]
+    assert [entry["page_num"] for entry in plan_shard_reads(index, page=2)] == [2]
+
+
+def test_select_ocr_elements_returns_next_cursor():
+    _, shards = build_ocr_page_shards(OCR_CONTENT)
+    elements = [element for page_num in sorted(shards) for element in shards[page_num]]
+
+    selected, next_cursor = select_ocr_elements(elements, start=1, min_confidence=0.5, limit=2)
+
+    assert [element["text"] for element in selected] == ["p1 c", "p3 a"]
+    assert next_cursor == "6"
+    assert select_ocr_elements(elements, start=6, limit=2) == ([elements[6]], None)
+
+
+def test_parse_cursor_and_sections_reject_invalid_input():
+    assert parse_cursor(None) == 0
+    with pytest.raises(ValueError):
+        parse_cursor("-1")
+    with pytest.raises(ValueError):
+        parse_cursor("abc")
+    assert resolve_results_sections("fields,summary", None) == ["processing_summary", "extracted_fields"]
+    assert resolve_results_sections(None, "ocr_elements") == ["processing_summary", "extracted_fields"]
+    with pytest.raises(ValueError):
+        resolve_results_sections("bboxes", None)
+
+
+def test_fields_only_request_skips_ocr_data():
+    blob_storage = InMemoryBlobStorage(_pipeline_blobs())
+
+    response = _get(blob_storage, {"include": "fields"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"document_id", "filename", "status", "has_visualization", "extracted_fields"}
+    assert data["extracted_fields"][0]["extracted_value"] == "DemoTech Solutions GmbH"
+    assert blob_storage.downloads == [(Stage.RESULTS, RESULTS_FIELDS_EXT)]
+
+
+def test_cursor_pagination_reads_only_candidate_shards():
+    blob_storage = InMemoryBlobStorage(_pipeline_blobs())
+    params = {"include": "ocr_elements", "limit": 2, "min_confidence": 0.5}
+
+    first = _get(blob_storage, params).json()
+    first_reads = list(blob_storage.downloads)
+    second = _get(blob_storage, {**params, "cursor": first["next_cursor"]}).json()
+
+    assert [element["text"] for element in first["ocr_elements"]] == ["p1 a", "p1 c"]
+    assert first["next_cursor"] == "5"
+    # The page fills at the end of page 1; page 3 is read to confirm another match exists
+    assert first_reads == [(Stage.OCR, OCR_INDEX_EXT), (Stage.OCR, page_shard_ext(1)), (Stage.OCR, page_shard_ext(3))]
+    assert [element["text"] for element in second["ocr_elements"]] == ["p3 a", "p3 b"]
+    assert second["next_cursor"] is None
+    # Page 2 has no element above the threshold and is never read
+    assert (Stage.OCR, page_shard_ext(2)) not in blob_storage.downloads
+    assert all(stage == Stage.OCR for stage, _ in blob_storage.downloads)
+
+
+def test_no_cursor_when_only_the_first_shard_matches():
+    """A page filled by the last matching element ends the pagination without an empty extra page."""
+    ocr_content = {
+        "original_lines": [_line("p1 a", 0.95, 1), _line("p1 b", 0.92, 1), _line("p2 a", 0.60, 2)],
+        "normalized_lines": [],
+    }
+    storage = RecordingStorage()
+    save_results_document(DOCUMENT_ID, ocr_content, LLM_CONTENT, storage=storage)
+    save_ocr_page_index(DOCUMENT_ID, ocr_content, storage=storage)
+    blob_storage = InMemoryBlobStorage(storage.blobs)
+
+    data = _get(blob_storage, {"include": "ocr_elements", "limit": 2, "min_confidence": 0.5}).json()
+    filtered = _get(blob_storage, {"include": "ocr_elements", "limit": 2, "min_confidence": 0.9}).json()
+
+    assert [element["text"] for element in data["ocr_elements"]] == ["p1 a", "p1 b"]
+    assert data["next_cursor"] == "2"
+    assert [element["text"] for element in filtered["ocr_elements"]] == ["p1 a", "p1 b"]
+    assert filtered["next_cursor"] is None
+
+    # A candidate shard that yields no element (here: missing) does not produce a cursor either
+    del storage.blobs[(Stage.OCR, page_shard_ext(2))]
+    orphaned = _get(blob_storage, {"include": "ocr_elements", "limit": 2, "min_confidence": 0.5}).json()
+    assert orphaned["next_cursor"] is None
+
+
+def test_delete_ocr_results_removes_index_and_shards():
+    """Deleting a document's OCR results leaves no page shards or index behind."""
+    storage = Mock()
+    blobs = _pipeline_blobs()
+    storage.download_blob.side_effect = lambda uuid, stage, ext: blobs.get((stage, ext))
+
+    with patch("src.storage.blob_operations.get_storage", return_value=storage):
+        assert delete_ocr_results_from_bucket(DOCUMENT_ID)
+
+    deleted = {call.args[2] for call in storage.delete_blob.call_args_list}
+    assert {OCR_INDEX_EXT, page_shard_ext(1), page_shard_ext(2), page_shard_ext(3)} <= deleted
+
+
+def test_page_filter_without_index_uses_full_results():
+    """Documents processed before page shards existed are filtered from the results document."""
+    blobs = _pipeline_blobs(with_index=False)
+    indexed = _get(InMemoryBlobStorage(_pipeline_blobs()), {"page": 3, "exclude": "fields"}).json()
+    blob_storage = InMemoryBlobStorage(blobs)
+
+    data = _get(blob_storage, {"page": 3, "exclude": "fields"}).json()
+
+    assert data == indexed
+    assert [element["element_index"] for element in data["ocr_elements"]] == [5, 6]
+    assert data["processing_summary"] == build_results_payload(OCR_CONTENT, LLM_CONTENT)["processing_summary"]
+    assert (Stage.RESULTS, RESULTS_EXT) in blob_storage.downloads
+
+
+def test_unparameterized_request_is_unchanged():
+    blobs = _pipeline_blobs()
+
+    data = _get(InMemoryBlobStorage(blobs)).json()
+
+    assert "next_cursor" not in data
+    assert len(data["ocr_elements"]) == 7
+    assert json.loads(blobs[(Stage.RESULTS, RESULTS_EXT)])["ocr_elements"] == data["ocr_elements"]
+
+
+def test_invalid_section_is_rejected():
+    response = _get(InMemoryBlobStorage(_pipeline_blobs()), {"include": "bboxes"})
+
+    assert response.status_code == 400
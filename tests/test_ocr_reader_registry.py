@@ -0,0 +1,73 @@
+import sys
+import pytest
+from unittest.mock import Mock, patch
+
+from src.ocr.reader_registry import ReaderRegistry
+
+
+class TestReaderRegistry:
+    """Test the process-wide EasyOCR reader cache."""
+
+    @pytest.fixture
+    def mock_easyocr(self):
+        """Replace the easyocr module so no model weights are loaded."""
+        fake_easyocr = Mock()
+        fake_easyocr.Reader.side_effect = lambda languages, **options: Mock(languages=languages, options=options)
+        with patch.dict(sys.modules, {"easyocr": fake_easyocr}):
+            yield fake_easyocr
+
+    def test_reader_loaded_once_per_key(self, mock_easyocr):
+        """Repeated lookups with the same key reuse the loaded reader."""
+        registry = ReaderRegistry()
+
+        first = registry.get_reader(["en"])
+        second = registry.get_reader(["en"])
+        third = registry.get_reader(("en",))
+
+        assert first is second is third
+        mock_easyocr.Reader.assert_called_once_with(["en"])
+
+        stats = registry.stats()
+        assert stats["en"]["hits"] == 2
+        assert stats["en"]["load_seconds"] >= 0
+
+    def test_reader_keyed_by_languages_and_options(self, mock_easyocr):
+        """Different languages or options load separate readers."""
+        registry = ReaderRegistry()
+
+        english = registry.get_reader(["en"])
+        german = registry.get_reader(["en", "de"])
+        english_cpu = registry.get_reader(["en"], gpu=False)
+
+        assert english is not german
+        assert english is not english_cpu
+        assert mock_easyocr.Reader.call_count == 3
+        assert set(registry.stats()) == {"en", "en+de", "en gpu=False"}
+
+    def test_warm_up_means_first_document_is_a_hit(self, mock_easyocr):
+        """After warm-up the first real lookup does not load the model."""
+        registry = ReaderRegistry()
+        registry.warm_up()
+
+        registry.get_reader()
+
+        mock_easyocr.Reader.assert_called_once()
+        assert registry.stats()["en"]["hits"] == 1
+
+    def test_extract_uses_shared_reader(self, mock_easyocr):
+        """The OCR client pulls its reader from the registry instead of constructing one."""
+        from src.ocr import easyocr_client
+
+        shared_reader = Mock()
+        shared_reader.readtext.return_value = [
+            ([[10, 20], [110, 20], [110, 40], [10, 40]], "Company Name:", 0.98)
+        ]
+
+        with patch.object(easyocr_client, "get_reader", return_value=shared_reader) as mock_get_reader, \
+             patch.object(easyocr_client, "iter_page_images", return_value=[(1, Mock())]):
+            results, _ = easyocr_client.extract_text_bboxes_with_ocr("loan_application.pdf")
+
+        mock_get_reader.assert_called_once()
+        mock_easyocr.Reader.assert_not_called()
+        assert results[0]["text"] == "Company Name:"
+        assert results[0]["bbox"] == {"x1": 10, "y1": 20, "x2": 110, "y2": 40, "width": 100, "height": 20}
@@ -0,0 +1,154 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from unittest.mock import Mock, patch
+
+import pymupdf
+
+from src.ocr import easyocr_client, parallel
+from src.ocr.parallel import ParallelOcrExecutor
+
+
+def _image_only_pdf(page_count: int) -> bytes:
+    """PDF whose pages have no text layer, so every page needs OCR."""
+    document = pymupdf.open()
+    for _ in range(page_count):
+        document.new_page(width=200, height=200)
+    pdf_bytes = document.tobytes()
+    document.close()
+    return pdf_bytes
+
+
+class TestParallelOcr:
+    """Test fan-out of page OCR and in-order reassembly."""
+
+    @pytest.fixture
+    def thread_pool(self):
+        """Run the pool in threads so the mocked reader is shared with the workers."""
+        def make_pool(max_workers, mp_context, initializer, initargs):
+            return ThreadPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs)
+
+        with patch.object(parallel, "ProcessPoolExecutor", side_effect=make_pool):
+            yield
+
+    @pytest.fixture
+    def slow_reader(self):
+        """Reader whose latency varies per call and which records peak concurrency."""
+        state = {"running": 0, "peak": 0, "calls": 0}
+        lock = threading.Lock()
+
+        def readtext(image):
+            with lock:
+                state["calls"] += 1
+                delay = 0.03 if state["calls"] % 2 else 0.0
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(delay)
+            with lock:
+                state["running"] -= 1
+            return [([[0, 0], [50, 0], [50, 10], [0, 10]], "Loan Amount:", 0.9)]
+
+        reader = Mock()
+        reader.readtext.side_effect = readtext
+        with patch.object(parallel, "get_reader", return_value=reader):
+            yield reader, state
+
+    def test_results_in_page_order(self, thread_pool, slow_reader):
+        """Pages finishing out of order are still yielded in page order."""
+        executor = ParallelOcrExecutor(workers=4, max_in_flight=4)
+        try:
+            pages = list(executor.iter_pages(_image_only_pdf(7), dpi=72, pages=range(1, 8)))
+        finally:
+            executor.shutdown()
+
+        assert [page_num for page_num, _ in pages] == list(range(1, 8))
+        assert all(results[0]["page_num"] == page_num for page_num, results in pages)
+
+    def test_in_flight_limit(self, thread_pool, slow_reader):
+        """No more than max_in_flight pages are submitted at once."""
+        _, state = slow_reader
+        executor = ParallelOcrExecutor(workers=4, max_in_flight=2)
+        try:
+            list(executor.iter_pages(_image_only_pdf(6), dpi=72, pages=range(1, 7)))
+        finally:
+            executor.shutdown()
+
+        assert state["calls"] == 6
+        assert state["peak"] <= 2
+
+    def test_pdf_bytes_are_shared_through_one_temp_file(self, thread_pool, slow_reader):
+        """Tasks get the path of a temporary copy of the PDF, removed once the document is done."""
+        inputs = []
+        original_task = parallel._ocr_page_task
+
+        def recording_task(pdf_input, *args):
+            inputs.append(pdf_input)
+            return original_task(pdf_input, *args)
+
+        executor = ParallelOcrExecutor(workers=2)
+        with patch.object(parallel, "_ocr_page_task", side_effect=recording_task):
+            try:
+                pages = list(executor.iter_pages(_image_only_pdf(4), dpi=72, pages=range(1, 5)))
+            finally:
+                executor.shutdown()
+
+        assert len(pages) == 4
+        assert len(set(inputs)) == 1 and isinstance(inputs[0], str)
+        assert not os.path.exists(inputs[0])
+
+    def test_extract_uses_pool_only_for_ocr_pages(self, thread_pool, slow_reader):
+        """extract_text_bboxes_with_ocr fans out pages when images are not kept."""
+        executor = ParallelOcrExecutor(workers=2)
+        with patch.object(easyocr_client, "get_ocr_executor", return_value=executor), \
+             patch.object(easyocr_client, "get_reader") as mock_local_reader:
+            try:
+                results, images = easyocr_client.extract_text_bboxes_with_ocr(
+                    _image_only_pdf(3), keep_images=False, workers=2
+                )
+            finally:
+                executor.shutdown()
+
+        mock_local_reader.assert_not_called()
+        assert images == []
+        assert [result["page_num"] for result in results] == [1, 2, 3]
+
+    def test_sequential_in_daemonic_process(self):
+        """Celery prefork children cannot start a pool, so OCR stays in-process."""
+        reader = Mock()
+        reader.readtext.return_value = []
+        with patch.object(easyocr_client, "can_use_process_pool", return_value=False), \
+             patch.object(easyocr_client, "get_ocr_executor") as mock_get_executor, \
+             patch.object(easyocr_client, "get_reader", return_value=reader):
+            easyocr_client.extract_text_bboxes_with_ocr(_image_only_pdf(2), keep_images=False, workers=4)
+
+        mock_get_executor.assert_not_called()
+        assert reader.readtext.call_count == 2
+
+    @pytest.mark.parametrize("value,expected", [("", 1), ("3", 3), ("0", 1), ("many", 1)])
+    def test_workers_from_env(self, value, expected):
+        """OCR_WORKERS controls the pool size and defaults to sequential."""
+        with patch.dict("os.environ", {"OCR_WORKERS": value}):
+            assert parallel.get_default_workers() == expected
+
+    def test_auto_workers_use_cpu_affinity_and_cap(self):
+        """OCR_WORKERS=auto sizes the pool from the usable CPUs, not the host core count."""
+        with patch.dict("os.environ", {"OCR_WORKERS": "auto"}), \
+             patch.object(parallel, "available_cpus", return_value=2):
+            assert parallel.get_default_workers() == 2
+        with patch.dict("os.environ", {"OCR_WORKERS": "auto"}), \
+             patch.object(parallel, "available_cpus", return_value=64):
+            assert parallel.get_default_workers() == parallel.MAX_AUTO_WORKERS
+
+    def test_warm_up_loads_reader_in_every_worker(self, thread_pool):
+        """Warm-up starts the pool so each worker has its reader before the first document."""
+        # Model loads take a while, so every submit finds no idle worker and starts one
+        with patch.object(parallel, "get_reader", side_effect=lambda languages: time.sleep(0.05)) as mock_get_reader:
+            executor = ParallelOcrExecutor(workers=3)
+            try:
+                executor.warm_up()
+            finally:
+                executor.shutdown()
+
+        assert mock_get_reader.call_count == 3
@@ -0,0 +1,98 @@
+import asyncio
+
+from src.llm.client import LLMClient
+from src.llm.config import DocumentTypeConfig
+from src.llm.field_extractor import extract_fields_with_llm
+from src.llm.prefilter import field_query, select_candidate_lines
+
+FIELD_DESCRIPTIONS = {
+    "company_name": "Company Name (e.g., DemoTech Solutions GmbH)",
+    "property_address": "Property Address (full address)",
+    "term": "Term. Return number followed by unit (e.g., 15 years, 10 Jahre).",
+}
+DOC_CONFIG = DocumentTypeConfig(
+    name="credit_request",
+    expected_fields=list(FIELD_DESCRIPTIONS),
+    field_descriptions=FIELD_DESCRIPTIONS,
+    validation_rules={},
+)
+
+
+def _lines(*texts, page=1):
+    return [{"type": "text_line", "text": text, "page": page, "confidence": 0.9} for text in texts]
+
+
+LINES = (
+    _lines("Loan Application", "Company Name", "DemoTech Solutions GmbH", "Business Address", "Main Street 123")
+    + _lines("Adress", "Tech Park 45, 70191 Stuttgart", "Term", "15 years")
+    + _lines("I hereby confirm the accuracy and completeness of the information provided.", "Place / Date", page=2)
+)
+
+
+def _texts(lines):
+    return [line["text"] for line in lines]
+
+
+def test_query_leaves_out_examples_and_instructions():
+    assert field_query("company_name", FIELD_DESCRIPTIONS["company_name"]) == "Company Name  company name"
+    assert "years" not in field_query("term", FIELD_DESCRIPTIONS["term"])
+
+
+def test_labels_are_kept_with_their_values_and_boilerplate_is_dropped():
+    kept = _texts(select_candidate_lines(LINES, FIELD_DESCRIPTIONS, top_k=2))
+
+    assert ["Company Name", "DemoTech Solutions GmbH"] == kept[kept.index("Company Name"):][:2]
+    assert ["Term", "15 years"] == kept[kept.index("Term"):][:2]
+    # OCR spelling variants still match through shared character trigrams
+    assert ["Adress", "Tech Park 45, 70191 Stuttgart"] == kept[kept.index("Adress"):][:2]
+    assert "Place / Date" not in kept
+    assert not any(text.startswith("I hereby") for text in kept)
+    # Document order is preserved
+    assert kept == [text for text in _texts(LINES) if text in kept]
+
+
+def test_context_lines_stay_on_the_same_page():
+    lines = _lines("Intro", "Company Name") + _lines("Footer", page=2)
+
+    kept = select_candidate_lines(lines, {"company_name": "Company Name"}, top_k=1)
+
+    assert _texts(kept) == ["Company Name"]
+
+
+def test_nothing_is_dropped_without_fields_or_top_k():
+    assert select_candidate_lines(LINES, {}, top_k=2) == LINES
+    assert select_candidate_lines(LINES, FIELD_DESCRIPTIONS, top_k=0) == LINES
+    assert select_candidate_lines([], FIELD_DESCRIPTIONS) == []
+
+
+class PromptRecordingClient(LLMClient):
+    def __init__(self):
+        self.prompts = []
+
+    async def generate(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return '{"extracted_fields": {"company_name": {"value": "DemoTech Solutions GmbH", "confidence": 0.9}}}'
+
+
+def test_extraction_prompt_only_contains_candidate_lines():
+    client = PromptRecordingClient()
+
+    result = asyncio.run(extract_fields_with_llm(LINES, DOC_CONFIG, client, stream=False, prefilter_top_k=2))
+
+    assert result["extracted_fields"]["company_name"]["value"] == "DemoTech Solutions GmbH"
+    assert "DemoTech Solutions GmbH" in client.prompts[0]
+    assert "I hereby confirm" not in client.prompts[0]
+
+
+def test_prefilter_is_on_by_default_and_only_versions_results_when_enabled(monkeypatch):
+    from src.config import AppConfig
+    from src.integration.pipeline import get_llm_pipeline_version
+
+    monkeypatch.delenv("LLM_PREFILTER_TOP_K", raising=False)
+    assert AppConfig().llm.prefilter_top_k == 2
+    default_version = get_llm_pipeline_version()
+
+    monkeypatch.setenv("LLM_PREFILTER_TOP_K", "2")
+    assert get_llm_pipeline_version() == default_version
+    monkeypatch.setenv("LLM_PREFILTER_TOP_K", "0")
+    assert get_llm_pipeline_version() != default_version
@@ -0,0 +1,77 @@
+import pytest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from src.ocr.rasterization import RasterBackend, iter_page_images, render_page_images
+
+SAMPLE_PDF = Path(__file__).resolve().parents[1] / "data" / "loan_application.pdf"
+
+
+class TestPyMuPdfBackend:
+    """Test in-memory rasterization with PyMuPDF."""
+
+    def test_render_from_bytes(self):
+        """Bytes are rendered into RGB arrays without touching the filesystem."""
+        pdf_bytes = SAMPLE_PDF.read_bytes()
+
+        with patch("tempfile.NamedTemporaryFile") as mock_tempfile:
+            pages = list(iter_page_images(pdf_bytes, dpi=150, backend=RasterBackend.PYMUPDF))
+
+        mock_tempfile.assert_not_called()
+        assert [page_num for page_num, _ in pages] == [1]
+        image = pages[0][1]
+        assert image.dtype == np.uint8
+        # US Letter at 150 DPI
+        assert image.shape == (1650, 1275, 3)
+
+    def test_path_and_bytes_render_identically(self):
+        """File path and byte input produce the same pixels."""
+        from_path = render_page_images(str(SAMPLE_PDF), dpi=72, backend=RasterBackend.PYMUPDF)
+        from_bytes = render_page_images(SAMPLE_PDF.read_bytes(), dpi=72, backend=RasterBackend.PYMUPDF)
+
+        assert len(from_path) == len(from_bytes) == 1
+        assert np.array_equal(from_path[0], from_bytes[0])
+
+
+class TestPdf2ImageBackend:
+    """Test the poppler-based backend."""
+
+    def test_pages_converted_one_at_a_time(self):
+        """Each page is converted on its own instead of the whole PDF at once."""
+        converted_pages = []
+
+        def convert_single_page(pdf_path, dpi, first_page, last_page):
+            assert first_page == last_page
+            converted_pages.append(first_page)
+            page_image = Mock()
+            page_image.convert.return_value = np.zeros((4, 3, 3), dtype=np.uint8)
+            return [page_image]
+
+        with patch("pdf2image.pdfinfo_from_path", return_value={"Pages": 3}), \
+             patch("pdf2image.convert_from_path", side_effect=convert_single_page):
+            page_iterator = iter_page_images(b"%PDF-1.4", dpi=150, backend=RasterBackend.PDF2IMAGE)
+
+            first_page_num, first_image = next(page_iterator)
+            assert converted_pages == [1]
+            assert first_page_num == 1
+            assert first_image.shape == (4, 3, 3)
+
+            remaining = list(page_iterator)
+
+        assert converted_pages == [1, 2, 3]
+        assert [page_num for page_num, _ in remaining] == [2, 3]
+
+
+@pytest.mark.parametrize("backend_name,expected", [
+    ("pymupdf", RasterBackend.PYMUPDF),
+    ("pdf2image", RasterBackend.PDF2IMAGE),
+    ("unknown", RasterBackend.PYMUPDF),
+])
+def test_default_backend_from_environment(monkeypatch, backend_name, expected):
+    """OCR_RASTER_BACKEND selects the backend, falling back to PyMuPDF."""
+    from src.ocr.rasterization import get_default_backend
+
+    monkeypatch.setenv("OCR_RASTER_BACKEND", backend_name)
+    assert get_default_backend() == expected
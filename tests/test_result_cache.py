@@ -0,0 +1,136 @@
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+from src.storage.result_cache import ResultCache, compute_document_hash, compute_pipeline_version
+
+
+class InMemoryStorage:
+    """Minimal stand-in for BlobStorage keyed by blob name."""
+
+    def __init__(self):
+        self.blobs = {}
+
+    def upload_document_data(self, uuid, stage, ext, data, metadata=None, overwrite=True):
+        self.blobs[f"{uuid}{ext}"] = json.dumps({"document_uuid": uuid, "data": data, "metadata": metadata or {}})
+
+    def download_document_data(self, uuid, stage, ext):
+        blob = self.blobs.get(f"{uuid}{ext}")
+        return json.loads(blob) if blob else None
+
+    def list_blobs_in_stage(self, stage):
+        return list(self.blobs)
+
+    def delete_blob(self, uuid, stage, ext):
+        return self.blobs.pop(f"{uuid}{ext}", None) is not None
+
+
+class TestResultCache:
+    """Test the content-hash result cache."""
+
+    @pytest.fixture
+    def storage(self):
+        return InMemoryStorage()
+
+    def test_miss_then_hit(self, storage):
+        """A stored result is returned for the same hash and version, and counted."""
+        cache = ResultCache(storage)
+        document_hash = compute_document_hash(b"%PDF-1.4 loan application")
+
+        assert cache.get("ocr", document_hash, "v1") is None
+        cache.put("ocr", document_hash, "v1", {"original_lines": [{"text": "Loan Amount:"}]})
+        assert cache.get("ocr", document_hash, "v1") == {"original_lines": [{"text": "Loan Amount:"}]}
+
+        assert cache.stats() == {"ocr": {"hits": 1, "misses": 1, "hit_rate": 0.5}}
+        assert f"ocr/v1/{document_hash}.json" in storage.blobs
+
+    def test_version_and_kind_isolate_entries(self, storage):
+        """Another pipeline version or result kind never sees the entry."""
+        cache = ResultCache(storage)
+        cache.put("ocr", "abc", "v1", {"value": 1})
+
+        assert cache.get("ocr", "abc", "v2") is None
+        assert cache.get("llm", "abc", "v1") is None
+
+    def test_invalidate_keeps_current_version(self, storage):
+        """Invalidation removes stale versions of one kind only."""
+        cache = ResultCache(storage)
+        cache.put("ocr", "abc", "old", {"value": 1})
+        cache.put("ocr", "abc", "current", {"value": 2})
+        cache.put("llm", "abc", "old", {"value": 3})
+
+        assert cache.invalidate("ocr", keep_version="current") == 1
+        assert cache.get("ocr", "abc", "current") == {"value": 2}
+        assert cache.get("llm", "abc", "old") == {"value": 3}
+
+        assert cache.invalidate() == 2
+        assert storage.blobs == {}
+
+    def test_storage_errors_are_misses(self):
+        """An unreachable blob store degrades to cache misses instead of failing the task."""
+        storage = Mock()
+        storage.download_document_data.side_effect = ConnectionError("azurite down")
+        storage.upload_document_data.side_effect = ConnectionError("azurite down")
+        cache = ResultCache(storage)
+
+        cache.put("ocr", "abc", "v1", {"value": 1})
+        assert cache.get("ocr", "abc", "v1") is None
+        assert cache.stats()["ocr"]["misses"] == 1
+
+    def test_pipeline_version_is_order_independent(self):
+        """The same settings always produce the same version string."""
+        assert compute_pipeline_version({"dpi": 150, "engine": "easyocr"}) == \
+            compute_pipeline_version({"engine": "easyocr", "dpi": 150})
+        assert compute_pipeline_version({"dpi": 150}) != compute_pipeline_version({"dpi": 200})
+
+
+class TestCachedTasks:
+    """Test the OCR task short-circuit on a cache hit."""
+
+    def test_ocr_task_reuses_cached_result(self):
+        """A cache hit skips OCR and stores the cached result under the new document ID."""
+        from src.tasks import pipeline_tasks
+
+        cache = ResultCache(InMemoryStorage())
+        pdf_bytes = b"%PDF-1.4 same bytes"
+        cache.put("ocr", compute_document_hash(pdf_bytes), pipeline_tasks.get_ocr_pipeline_version(),
+                  {"document_id": "first-upload", "original_lines": []})
+
+        dms_service = Mock()
+        dms_service.get_document.return_value = {"id": "second-upload"}
+        dms_service.download_document.return_value = pdf_bytes
+
+        with patch.object(pipeline_tasks, "_get_dms_service", return_value=dms_service), \
+             patch.object(pipeline_tasks, "get_result_cache", return_value=cache), \
+             patch.object(pipeline_tasks, "process_document_with_ocr") as mock_ocr, \
+             patch.object(pipeline_tasks, "save_ocr_results") as mock_save:
+            assert pipeline_tasks.process_ocr_task("second-upload") == "second-upload"
+
+        mock_ocr.assert_not_called()
+        mock_save.assert_called_once_with("second-upload", {"document_id": "first-upload", "original_lines": []})
+        assert cache.stats()["ocr"]["hits"] == 1
+
+    def test_llm_task_cache_hit_survives_status_update_failure(self):
+        """A DMS error after the cached LLM results are saved is logged, not raised."""
+        from src.tasks import pipeline_tasks
+
+        cache = ResultCache(InMemoryStorage())
+        cache.put("llm", "abc", "v1", {"extraction_results": {}})
+        ocr_results = {"processing_metadata": {"document_sha256": "abc"}, "original_lines": []}
+
+        dms_service = Mock()
+        dms_service.mark_processing_done.side_effect = RuntimeError("database unavailable")
+
+        with patch.object(pipeline_tasks, "_get_dms_service", return_value=dms_service), \
+             patch.object(pipeline_tasks, "get_result_cache", return_value=cache), \
+             patch.object(pipeline_tasks, "get_llm_pipeline_version", return_value="v1"), \
+             patch.object(pipeline_tasks, "get_llm_response_cache"), \
+             patch.object(pipeline_tasks, "load_ocr_results", return_value={"data": ocr_results}), \
+             patch.object(pipeline_tasks, "process_document_with_llm") as mock_llm, \
+             patch.object(pipeline_tasks, "save_llm_results") as mock_save, \
+             patch.object(pipeline_tasks, "save_final_results"):
+            assert pipeline_tasks.process_llm_task("doc-1") == "doc-1"
+
+        mock_llm.assert_not_called()
+        mock_save.assert_called_once_with("doc-1", {"extraction_results": {}})
+        dms_service.mark_processing_done.assert_called_once_with("doc-1")
@@ -0,0 +1,206 @@
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, Mock
+
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import get_blob_storage, get_metadata_repository
+from src.api.main import app
+from src.integration.results import (
+    RESULTS_EXT, build_results_payload, compose_results_response, encode_results_payload,
+    parse_stored_artifact, save_results_document,
+)
+from src.storage.ocr_codec import OCR_COLUMNAR_EXT, encode_ocr_artifact
+from src.storage.storage import Stage, build_document_envelope
+
+DOCUMENT_ID = "results-document"
+
+OCR_CONTENT = {
+    "original_lines": [
+        {
+            "text": "Company Name",
+            "confidence": 0.98,
+            "bbox": {"x1": 10, "y1": 20, "x2": 110, "y2": 35, "width": 100, "height": 15},
+            "page_num": 1,
+        },
+        {
+            "text": "DemoTech Solutions GmbH",
+            "confidence": 0.91,
+            "bbox": {"x1": 150, "y1": 20, "x2": 350, "y2": 35, "width": 200, "height": 15},
+            "page_num": 1,
+        },
+    ],
+    "normalized_lines": [{"label": "Company Name", "value": "DemoTech Solutions GmbH"}],
+}
+
+LLM_CONTENT = {
+    "extraction_results": {
+        "extracted_fields": {
+            "company_name": {"value": "DemoTech Solutions GmbH", "confidence": 0.9},
+            "loan_amount": {"value": 250000, "confidence": 0.8, "source_ocr_elements": ["elem_7"]},
+            "missing": {"value": None},
+        },
+        "validation_results": [{"field": "loan_amount", "error": "out of range"}],
+    }
+}
+
+
+def _envelope(content):
+    return json.dumps({"document_uuid": DOCUMENT_ID, "data": content, "metadata": {}}).encode("utf-8")
+
+
+def test_parse_stored_artifact_unwraps_envelope():
+    assert parse_stored_artifact(_envelope(OCR_CONTENT)) == OCR_CONTENT
+    assert parse_stored_artifact(json.dumps(LLM_CONTENT).encode("utf-8")) == LLM_CONTENT
+    assert parse_stored_artifact(None) is None
+
+
+def test_build_results_payload():
+    payload = build_results_payload(OCR_CONTENT, LLM_CONTENT)
+
+    assert payload["ocr_elements"][1] == {
+        "text": "DemoTech Solutions GmbH",
+        "confidence": 0.91,
+        "bbox": {"x1": 150, "y1": 20, "width": 200, "height": 15},
+        "page_num": 1,
+    }
+    fields = {field["field_name"]: field for field in payload["extracted_fields"]}
+    assert fields["loan_amount"]["extracted_value"] == "250000"
+    assert fields["loan_amount"]["source_ocr_elements"] == ["elem_7"]
+    assert fields["missing"]["extracted_value"] is None
+    assert payload["processing_summary"] == {
+        "total_ocr_elements": 2,
+        "normalized_elements": 1,
+        "extracted_fields": 3,
+        "validation_errors": 1,
+    }
+
+
+def test_build_results_payload_without_llm_has_no_summary():
+    payload = build_results_payload(OCR_CONTENT, None)
+
+    assert len(payload["ocr_elements"]) == 2
+    assert payload["extracted_fields"] == []
+    assert payload["processing_summary"] is None
+
+
+def test_compose_results_response_prepends_header():
+    payload = build_results_payload(OCR_CONTENT, LLM_CONTENT)
+    header = {"document_id": DOCUMENT_ID, "status": "completed", "has_visualization": False}
+
+    composed = json.loads(compose_results_response(header, encode_results_payload(payload)))
+
+    assert composed == {**header, **payload}
+    assert json.loads(compose_results_response(header, b"{}")) == header
+
+
+class RecordingStorage:
+    def __init__(self):
+        self.blobs = {}
+
+    def upload_blob(self, uuid, stage, ext, data, overwrite=True):
+        self.blobs[(uuid, stage, ext)] = data
+
+
+def test_save_results_document_stores_compact_payload():
+    storage = RecordingStorage()
+
+    save_results_document(DOCUMENT_ID, OCR_CONTENT, LLM_CONTENT, storage=storage)
+
+    stored = storage.blobs[(DOCUMENT_ID, Stage.RESULTS, RESULTS_EXT)]
+    assert json.loads(stored) == build_results_payload(OCR_CONTENT, LLM_CONTENT)
+    assert b"\n" not in stored and b": " not in stored
+
+
+class SlowBlobStorage:
+    """Async storage whose every call takes the same latency."""
+
+    def __init__(self, latency, precomputed=False):
+        self.latency = latency
+        self.blobs = {
+            (Stage.OCR, ".json"): _envelope(OCR_CONTENT),
+            (Stage.LLM, ".json"): _envelope(LLM_CONTENT),
+        }
+        if precomputed:
+            self.blobs[(Stage.RESULTS, RESULTS_EXT)] = encode_results_payload(
+                build_results_payload(OCR_CONTENT, LLM_CONTENT)
+            )
+        self.downloads = []
+
+    async def download_blob(self, uuid, stage, ext):
+        self.downloads.append(stage)
+        await asyncio.sleep(self.latency)
+        return self.blobs.get((stage, ext))
+
+    async def blob_exists(self, uuid, stage, ext):
+        await asyncio.sleep(self.latency)
+        return stage == Stage.ANNOTATED
+
+
+def _get_results(blob_storage):
+    metadata_repository = Mock()
+    metadata_repository.get_document = AsyncMock(return_value={
+        "id": DOCUMENT_ID,
+        "filename": "loan_application.pdf",
+        "processing_status": "done",
+    })
+    app.dependency_overrides[get_metadata_repository] = lambda: metadata_repository
+    app.dependency_overrides[get_blob_storage] = lambda: blob_storage
+    try:
+        client = TestClient(app)
+        start_time = time.perf_counter()
+        response = client.get(f"/api/v1/results/{DOCUMENT_ID}")
+        return response, time.perf_counter() - start_time
+    finally:
+        app.dependency_overrides.pop(get_metadata_repository, None)
+        app.dependency_overrides.pop(get_blob_storage, None)
+
+
+def test_results_endpoint_serves_precomputed_document():
+    """One blob read, concurrent with the visualization check."""
+    latency = 0.2
+    blob_storage = SlowBlobStorage(latency, precomputed=True)
+
+    response, elapsed = _get_results(blob_storage)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert blob_storage.downloads == [Stage.RESULTS]
+    assert elapsed < 1.5 * latency
+    legacy_response, _ = _get_results(SlowBlobStorage(0))
+    assert response.json() == legacy_response.json()
+
+
+def test_results_endpoint_falls_back_to_stage_artifacts():
+    """Documents without a results document are rebuilt from OCR and LLM, fetched concurrently."""
+    latency = 0.2
+    blob_storage = SlowBlobStorage(latency)
+
+    response, elapsed = _get_results(blob_storage)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "completed"
+    assert data["has_visualization"] is True
+    assert len(data["ocr_elements"]) == 2
+    assert data["processing_summary"]["validation_errors"] == 1
+    assert sorted(stage.value for stage in blob_storage.downloads) == ["llm", "ocr", "results"]
+    # Results check + visualization, then OCR + LLM: two round trips, not four
+    assert elapsed < 3 * latency
+
+
+def test_results_endpoint_rebuilds_from_columnar_ocr_artifact():
+    """Documents stored in the columnar OCR format still get their OCR elements."""
+    blob_storage = SlowBlobStorage(0)
+    del blob_storage.blobs[(Stage.OCR, ".json")]
+    blob_storage.blobs[(Stage.OCR, OCR_COLUMNAR_EXT)] = encode_ocr_artifact(
+        build_document_envelope(DOCUMENT_ID, OCR_CONTENT), codec="gzip"
+    )
+
+    response, _ = _get_results(blob_storage)
+
+    assert response.status_code == 200
+    assert [element["text"] for element in response.json()["ocr_elements"]] == [
+        "Company Name", "DemoTech Solutions GmbH"
+    ]
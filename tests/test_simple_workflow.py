@@ -23,7 +23,7 @@ def test_simple_notebook_workflow():
          patch('src.integration.pipeline.load_system_config') as mock_sys_config, \
          patch('src.integration.pipeline.load_document_config') as mock_doc_config, \
          patch('src.integration.pipeline.extract_fields_with_llm') as mock_llm_extract, \
-         patch('src.visualization.ocr_visualization.convert_from_bytes') as mock_convert_viz, \
+         patch('src.visualization.ocr_visualization.iter_page_images') as mock_convert_viz, \
          patch('src.visualization.ocr_visualization.plt') as mock_plt:
         
         # Setup simple mocks
@@ -43,9 +43,8 @@ def test_simple_notebook_workflow():
         
         # Mock visualization
         mock_image = Mock()
-        mock_image.width = 800
-        mock_image.height = 600
-        mock_convert_viz.return_value = [mock_image]
+        mock_image.shape = (600, 800, 3)
+        mock_convert_viz.return_value = [(1, mock_image)]
         mock_fig = Mock()
         mock_ax = Mock()
         mock_plt.subplots.return_value = (mock_fig, mock_ax)
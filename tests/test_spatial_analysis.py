@@ -0,0 +1,99 @@
+import random
+import pytest
+
+from src.ocr.spatial_analysis import detect_lines_on_same_row
+
+
+def _reference_detect_lines_on_same_row(ocr_lines, tolerance=15.0):
+    """The original quadratic implementation, kept as the equivalence oracle."""
+    grouped_lines = []
+    remaining_lines = ocr_lines.copy()
+
+    while remaining_lines:
+        current_line = remaining_lines.pop(0)
+        current_group = [current_line]
+        current_y_center = (current_line['bbox']['y1'] + current_line['bbox']['y2']) / 2
+        current_height = current_line['bbox']['y2'] - current_line['bbox']['y1']
+
+        lines_to_remove = []
+        for i, line in enumerate(remaining_lines):
+            line_y_center = (line['bbox']['y1'] + line['bbox']['y2']) / 2
+            line_height = line['bbox']['y2'] - line['bbox']['y1']
+            center_distance = abs(current_y_center - line_y_center)
+            avg_height = (current_height + line_height) / 2
+            if center_distance < tolerance and center_distance < avg_height * 0.5:
+                current_group.append(line)
+                lines_to_remove.append(i)
+
+        for i in reversed(lines_to_remove):
+            remaining_lines.pop(i)
+
+        current_group.sort(key=lambda x: x['bbox']['x1'])
+        grouped_lines.append(current_group)
+
+    return grouped_lines
+
+
+def _random_page(rng, box_count, quantize):
+    """Random boxes; quantized coordinates produce many exact ties in y and x."""
+    lines = []
+    for index in range(box_count):
+        y1 = rng.uniform(0, 40 * max(1, box_count // 8))
+        height = rng.choice([rng.uniform(0, 40), rng.uniform(5, 25)])
+        x1 = rng.uniform(0, 1200)
+        if quantize:
+            y1, height, x1 = round(y1 / 4) * 4, round(height / 2) * 2, round(x1 / 50) * 50
+        lines.append({
+            "text": f"t{index}",
+            "confidence": 0.9,
+            "page_num": 1,
+            "bbox": {"x1": x1, "y1": y1, "x2": x1 + 60, "y2": y1 + height},
+        })
+    return lines
+
+
+def _group_ids(groups):
+    return [[id(line) for line in group] for group in groups]
+
+
+class TestDetectLinesOnSameRow:
+    """Test the sort-and-sweep row grouping against the original algorithm."""
+
+    @pytest.mark.parametrize("quantize", [False, True])
+    def test_matches_reference(self, quantize):
+        """Identical groups, group order and in-group order on random pages."""
+        multi_line_groups = 0
+        for seed in range(300):
+            rng = random.Random(seed)
+            lines = _random_page(rng, rng.randint(0, 120), quantize=quantize)
+            tolerance = rng.choice([0.0, 5.0, 15.0, 15.0, 40.0, -1.0])
+
+            expected = _reference_detect_lines_on_same_row(lines, tolerance)
+            actual = detect_lines_on_same_row(lines, tolerance)
+
+            assert _group_ids(actual) == _group_ids(expected), f"seed={seed} tolerance={tolerance}"
+            multi_line_groups += sum(len(group) > 1 for group in expected)
+
+        # The random pages must actually exercise grouping, not just singletons
+        assert multi_line_groups > 1000
+
+    def test_table_rows(self):
+        """Cells of a simple table are grouped per row and ordered left to right."""
+        lines = []
+        for row in range(3):
+            for column in reversed(range(4)):
+                y1 = 100 + row * 30
+                lines.append({"text": f"r{row}c{column}", "bbox": {"x1": column * 150, "y1": y1, "x2": column * 150 + 100, "y2": y1 + 20}})
+
+        groups = detect_lines_on_same_row(lines)
+
+        assert [[line["text"] for line in group] for group in groups] == [
+            [f"r{row}c{column}" for column in range(4)] for row in range(3)
+        ]
+
+    def test_does_not_modify_input(self):
+        """The caller's list is left untouched."""
+        lines = _random_page(random.Random(7), 50, quantize=True)
+        snapshot = list(lines)
+        detect_lines_on_same_row(lines)
+        assert lines == snapshot
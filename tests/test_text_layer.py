@@ -0,0 +1,102 @@
+import os
+import pytest
+from unittest.mock import Mock, patch
+
+import pymupdf
+
+from src.ocr import easyocr_client
+from src.ocr.postprocess import normalize_ocr_lines
+from src.ocr.text_layer import _has_usable_text, extract_text_layer
+
+SAMPLE_PDF = os.path.join(os.path.dirname(__file__), "..", "data", "loan_application.pdf")
+
+
+def _digital_and_scanned_pdf() -> bytes:
+    """Two-page PDF: page 1 has a text layer, page 2 is an image only."""
+    document = pymupdf.open()
+    text_page = document.new_page()
+    text_page.insert_text((72, 72), "Company Name: Example Manufacturing GmbH", fontsize=11)
+    text_page.insert_text((72, 96), "Loan Amount: 250,000 EUR", fontsize=11)
+
+    pixmap = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 200, 100), False)
+    pixmap.clear_with(255)
+    image_page = document.new_page()
+    image_page.insert_image(pymupdf.Rect(72, 72, 272, 172), pixmap=pixmap)
+
+    pdf_bytes = document.tobytes()
+    document.close()
+    return pdf_bytes
+
+
+class TestTextLayer:
+    """Test the native text-layer fast path."""
+
+    def test_sample_document_skips_ocr(self):
+        """A digital PDF is read from its text layer without loading a reader or rasterizing."""
+        with patch.object(easyocr_client, "get_reader") as mock_get_reader, \
+             patch.object(easyocr_client, "iter_page_images") as mock_render:
+            results, images = easyocr_client.extract_text_bboxes_with_ocr(SAMPLE_PDF, use_text_layer=True)
+
+        mock_get_reader.assert_not_called()
+        mock_render.assert_not_called()
+        assert images == []
+        assert results
+        for result in results:
+            assert set(result) == {"page_num", "text", "confidence", "bbox"}
+            assert result["page_num"] == 1
+            assert set(result["bbox"]) == {"x1", "y1", "x2", "y2", "width", "height"}
+            # Coordinates are in OCR pixels, inside a Letter page rendered at OCR_DPI
+            assert 0 <= result["bbox"]["x1"] < result["bbox"]["x2"] <= 612 * easyocr_client.OCR_DPI / 72
+
+        # Records feed the existing post-processing unchanged
+        normalized = normalize_ocr_lines(results)
+        company = next(line for line in normalized if line.get("label") == "Company Name")
+        assert company["value"] == "DemoTech Solutions GmbH"
+        # Lines outside label/value pairs are kept as text lines
+        text_lines = [line["text"] for line in normalized if line["type"] == "text_line"]
+        assert "Stuttgart, 19/08/2025" in text_lines
+
+    def test_image_only_page_falls_back_to_ocr(self):
+        """Only the page without a text layer is rasterized and OCR'd; output stays in page order."""
+        reader = Mock()
+        reader.readtext.return_value = [
+            ([[10, 20], [110, 20], [110, 40], [10, 40]], "Signature", 0.91)
+        ]
+        pdf_bytes = _digital_and_scanned_pdf()
+
+        with patch.object(easyocr_client, "get_reader", return_value=reader):
+            results, images = easyocr_client.extract_text_bboxes_with_ocr(pdf_bytes, use_text_layer=True)
+
+        assert len(images) == 1
+        reader.readtext.assert_called_once()
+        assert [result["page_num"] for result in results] == [1, 1, 2]
+        assert results[0]["text"] == "Company Name: Example Manufacturing GmbH"
+        assert results[0]["confidence"] == 1.0
+        assert results[-1]["text"] == "Signature"
+
+    def test_disabled_text_layer_runs_ocr(self):
+        """With the fast path disabled every page goes through OCR."""
+        reader = Mock()
+        reader.readtext.return_value = []
+
+        with patch.object(easyocr_client, "get_reader", return_value=reader):
+            easyocr_client.extract_text_bboxes_with_ocr(_digital_and_scanned_pdf(), use_text_layer=False)
+
+        assert reader.readtext.call_count == 2
+
+    @pytest.mark.parametrize("text", ["", "ab"])
+    def test_unusable_text_layer_needs_ocr(self, text):
+        """Empty or near-empty text layers are sent to OCR."""
+        document = pymupdf.open()
+        page = document.new_page()
+        if text:
+            page.insert_text((72, 72), text, fontsize=11)
+        pdf_bytes = document.tobytes()
+        document.close()
+
+        assert extract_text_layer(pdf_bytes, dpi=150) == {1: None}
+
+    def test_undecodable_text_needs_ocr(self):
+        """Text made mostly of replacement characters (broken font encodings) is not trusted."""
+        words = [(72, 72, 300, 84, "\ufffd" * 30 + "abc", 0, 0, 0)]
+        assert _has_usable_text(words) is False